@@ -0,0 +1,286 @@
+"""
+Пакетная обработка входных файлов.
+"""
+from __future__ import annotations
+
+import csv
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+import click
+
+from logger import ProgressLogger, get_logger
+from main import CitationEnum, generate
+from settings import BATCH_WORKERS
+
+logger = get_logger(__name__)
+
+# расширения входных файлов, обрабатываемых из директории
+INPUT_SUFFIXES = (".xlsx", ".csv", ".jsonl")
+
+
+def get_default_output(path_input: Path, output_dir: Path, taken: set[Path]) -> Path:
+    """
+    Получение пути к выходному файлу по умолчанию, не совпадающего с уже выбранными.
+
+    Выходным файлам одноименных входных файлов (из разных директорий или с разными
+    расширениями) добавляется номер: `ivanov.docx`, `ivanov_2.docx`.
+
+    :param Path path_input: Путь к входному файлу
+    :param Path output_dir: Директория для выходных файлов
+    :param set[Path] taken: Уже выбранные пути к выходным файлам (дополняется)
+    :return: Путь к выходному файлу
+    """
+
+    path_output = output_dir / f"{path_input.stem}.docx"
+    number = 1
+    while path_output.resolve() in taken:
+        number += 1
+        path_output = output_dir / f"{path_input.stem}_{number}.docx"
+
+    if number > 1:
+        logger.warning(
+            "Выходной файл для %s переименован в %s (совпадение имен).",
+            path_input,
+            path_output.name,
+        )
+    taken.add(path_output.resolve())
+
+    return path_output
+
+
+def check_outputs(jobs: list[tuple[str, str]]) -> None:
+    """
+    Проверка отсутствия заданий с одинаковыми выходными файлами.
+
+    :param list[tuple[str, str]] jobs: Пары из путей к входному и выходному файлам
+    :raises click.UsageError: Если несколько входных файлов записываются в один выходной файл
+    """
+
+    inputs: dict[Path, str] = {}
+    for path_input, path_output in jobs:
+        path = Path(path_output).resolve()
+        if path in inputs:
+            raise click.UsageError(
+                f"Входные файлы {inputs[path]} и {path_input} "
+                f"записываются в один выходной файл {path_output}."
+            )
+        inputs[path] = path_input
+
+
+def iter_directory(input_dir: Path, output_dir: Path) -> Iterator[tuple[str, str]]:
+    """
+    Получение заданий для всех входных файлов директории.
+
+    :param Path input_dir: Директория с входными файлами
+    :param Path output_dir: Директория для выходных файлов
+    :return: Итератор пар из путей к входному и выходному файлам
+    """
+
+    taken: set[Path] = set()
+    for path in sorted(input_dir.iterdir()):
+        # временные файлы Excel (блокировки открытых файлов) пропускаются
+        if path.suffix.lower() in INPUT_SUFFIXES and not path.name.startswith("~$"):
+            yield str(path), str(get_default_output(path, output_dir, taken))
+
+
+def iter_manifest(manifest: Path, output_dir: Path) -> Iterator[tuple[str, str]]:
+    """
+    Получение заданий из файла-манифеста.
+
+    Манифест – CSV-файл, каждая строка которого содержит путь к входному файлу
+    и, необязательно, путь к выходному файлу. Относительные пути отсчитываются
+    от директории манифеста. Выходные файлы по умолчанию не совпадают с указанными
+    ранее (см. :func:`get_default_output`).
+
+    .. code-block::
+
+        groups/101/ivanov.xlsx,output/101/ivanov.docx
+        groups/101/petrov.xlsx
+
+    :param Path manifest: Путь к файлу-манифесту
+    :param Path output_dir: Директория для выходных файлов, путь к которым не указан
+    :return: Итератор пар из путей к входному и выходному файлам
+    """
+
+    taken: set[Path] = set()
+    with manifest.open(encoding="utf-8", newline="") as file:
+        for row in csv.reader(file):
+            if not row or not row[0].strip():
+                continue
+
+            path_input = manifest.parent / row[0].strip()
+            if len(row) > 1 and row[1].strip():
+                path_output = manifest.parent / row[1].strip()
+                taken.add(path_output.resolve())
+            else:
+                path_output = get_default_output(path_input, output_dir, taken)
+
+            yield str(path_input), str(path_output)
+
+
+def process_job(path_input: str, path_output: str, **options: Any) -> Optional[str]:
+    """
+    Обработка одного входного файла в процессе пула.
+
+    :param str path_input: Путь к входному файлу
+    :param str path_output: Путь к выходному файлу
+    :param options: Параметры генерации выходного файла
+    :return: Описание ошибки или `None`, если файл обработан успешно
+    """
+
+    try:
+        Path(path_output).parent.mkdir(parents=True, exist_ok=True)
+        generate(path_input, path_output, **options)
+    except Exception as ex:
+        logger.error("При обработке файла %s возникла ошибка: %s", path_input, ex)
+        return f"{path_input}: {ex}"
+
+    return None
+
+
+@click.command()
+@click.option(
+    "--input_dir",
+    "-id",
+    "input_dir",
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+    default=None,
+    help="Директория с входными файлами (*.xlsx, *.csv, *.jsonl)",
+)
+@click.option(
+    "--manifest",
+    "-m",
+    "manifest",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    default=None,
+    help="CSV-файл со списком входных и выходных файлов",
+)
+@click.option(
+    "--output_dir",
+    "-od",
+    "output_dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    required=True,
+    help="Директория для выходных файлов",
+)
+@click.option(
+    "--citation",
+    "-c",
+    "citation",
+    type=click.Choice([item.name for item in CitationEnum], case_sensitive=False),
+    default=CitationEnum.GOST.name,
+    show_default=True,
+    help="Стиль цитирования",
+)
+@click.option(
+    "--workers",
+    "-w",
+    "workers",
+    type=click.IntRange(min=1),
+    default=BATCH_WORKERS,
+    show_default=True,
+    help="Количество процессов для обработки файлов",
+)
+@click.option(
+    "--streaming",
+    "-s",
+    "streaming",
+    is_flag=True,
+    default=False,
+    help="Потоковое чтение входных файлов",
+)
+@click.option(
+    "--trusted",
+    "-t",
+    "trusted",
+    is_flag=True,
+    default=False,
+    help="Пакетная проверка столбцов вместо валидации каждой строки (для доверенных входных файлов)",
+)
+@click.option(
+    "--stream_render",
+    "-sr",
+    "stream_render",
+    is_flag=True,
+    default=False,
+    help="Потоковая генерация выходных файлов",
+)
+def process_batch(  # pylint: disable=too-many-arguments
+    input_dir: Optional[Path],
+    manifest: Optional[Path],
+    output_dir: Path,
+    citation: str = CitationEnum.GOST.name,
+    workers: int = BATCH_WORKERS,
+    streaming: bool = False,
+    trusted: bool = False,
+    stream_render: bool = False,
+) -> None:
+    """
+    Пакетная генерация файлов Word с оформленными библиографическими списками.
+
+    Файлы обрабатываются пулом процессов, каждый из которых загружает зависимости
+    и стили цитирования один раз и переиспользует их для всех своих файлов.
+
+    :param Optional[Path] input_dir: Директория с входными файлами
+    :param Optional[Path] manifest: CSV-файл со списком входных и выходных файлов
+    :param Path output_dir: Директория для выходных файлов
+    :param str citation: Стиль цитирования
+    :param int workers: Количество процессов для обработки файлов
+    :param bool streaming: Потоковое чтение входных файлов
+    :param bool trusted: Пакетная проверка столбцов вместо валидации каждой строки
+    :param bool stream_render: Потоковая генерация выходных файлов
+    """
+
+    if (input_dir is None) == (manifest is None):
+        raise click.UsageError("Укажите либо --input_dir, либо --manifest.")
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    if input_dir is not None:
+        jobs = list(iter_directory(input_dir, output_dir))
+    else:
+        jobs = list(iter_manifest(manifest, output_dir))  # type: ignore
+    check_outputs(jobs)
+
+    logger.info(
+        "Пакетная обработка %s файлов (стиль цитирования: %s, процессов: %s) ...",
+        len(jobs),
+        citation,
+        workers,
+    )
+
+    worker = partial(
+        process_job,
+        streaming=streaming,
+        trusted=trusted,
+        stream_render=stream_render,
+        citations=(citation.upper(),),
+    )
+    inputs = [path_input for path_input, _ in jobs]
+    outputs = [path_output for _, path_output in jobs]
+    progress = ProgressLogger(logger, "Пакетная обработка", every=100)
+
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            errors = [
+                error
+                for error in progress.track(executor.map(worker, inputs, outputs))
+                if error
+            ]
+    else:
+        errors = [
+            error for error in progress.track(map(worker, inputs, outputs)) if error
+        ]
+
+    if errors:
+        logger.error("Не обработано файлов: %s.", len(errors))
+        sys.exit(1)
+
+    logger.info("Пакетная обработка успешно завершена.")
+
+
+if __name__ == "__main__":
+    process_batch()  # pylint: disable=no-value-for-parameter
@@ -0,0 +1,3 @@
+"""
+Замеры производительности чтения, форматирования и генерации выходного файла.
+"""
@@ -0,0 +1,190 @@
+"""
+Генерация синтетического входного файла для замеров производительности.
+"""
+from __future__ import annotations
+
+import csv
+import json
+import random
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Iterator
+
+import openpyxl
+
+from readers.base import convert_date
+from readers.reader import SourcesReader
+from settings import TEMPLATE_FILE_PATH
+
+SURNAMES = ("Иванов", "Петров", "Сидоров", "Смирнов", "Кузнецов", "Попов", "Smith")
+INITIALS = ("И.М.", "С.Н.", "А.А.", "В.П.", "Е.К.", "J.R.")
+WORDS = (
+    "наука",
+    "искусство",
+    "введение",
+    "лингвистика",
+    "психология",
+    "стилистика",
+    "теория",
+    "практика",
+    "analysis",
+    "methods",
+)
+CITIES = ("М.", "СПб.", "Екатеринбург", "Новосибирск", "London")
+PUBLISHERS = ("Просвещение", "АСТ", "Наука", "Флинта", "Аспект Пресс", "Springer")
+WEBSITES = ("Ведомости", "Коммерсантъ", "Академик", "Wikipedia")
+
+
+def make_authors(rnd: random.Random) -> str:
+    """
+    Генерация списка авторов.
+
+    :param rnd: Генератор случайных чисел.
+    :return: Авторы через запятую.
+    """
+
+    return ", ".join(
+        f"{rnd.choice(SURNAMES)} {rnd.choice(INITIALS)}"
+        for _ in range(rnd.randint(1, 4))
+    )
+
+
+def make_title(rnd: random.Random) -> str:
+    """
+    Генерация названия.
+
+    :param rnd: Генератор случайных чисел.
+    :return: Название.
+    """
+
+    return " ".join(rnd.choice(WORDS) for _ in range(rnd.randint(2, 6))).capitalize()
+
+
+def make_book(rnd: random.Random) -> tuple:
+    """
+    Генерация строки листа "Книга".
+
+    :param rnd: Генератор случайных чисел.
+    :return: Значения ячеек строки.
+    """
+
+    return (
+        make_authors(rnd),
+        make_title(rnd),
+        rnd.choice((None, "1-е", "2-е", "3-е")),
+        rnd.choice(CITIES),
+        rnd.choice(PUBLISHERS),
+        rnd.randint(1950, 2022),
+        rnd.randint(50, 1200),
+    )
+
+
+def make_internet_resource(rnd: random.Random) -> tuple:
+    """
+    Генерация строки листа "Интернет-ресурс".
+
+    :param rnd: Генератор случайных чисел.
+    :return: Значения ячеек строки.
+    """
+
+    return (
+        make_title(rnd),
+        rnd.choice(WEBSITES),
+        f"https://example.com/{rnd.randint(1, 10 ** 6)}",
+        datetime(2020, 1, 1) + timedelta(days=rnd.randint(0, 1000)),
+    )
+
+
+def make_articles_collection(rnd: random.Random) -> tuple:
+    """
+    Генерация строки листа "Статья из сборника".
+
+    :param rnd: Генератор случайных чисел.
+    :return: Значения ячеек строки.
+    """
+
+    start = rnd.randint(1, 500)
+
+    return (
+        make_authors(rnd),
+        make_title(rnd),
+        f"Сборник: {make_title(rnd)}",
+        rnd.choice(CITIES),
+        rnd.choice(PUBLISHERS),
+        rnd.randint(1950, 2022),
+        f"{start}-{start + rnd.randint(1, 30)}",
+    )
+
+
+# генераторы строк для читаемых листов шаблона
+SHEETS: dict[str, Callable[[random.Random], tuple]] = {
+    "Книга": make_book,
+    "Интернет-ресурс": make_internet_resource,
+    "Статья из сборника": make_articles_collection,
+}
+
+
+def iter_generated(rows: int, seed: int = 0) -> Iterator[tuple[str, tuple]]:
+    """
+    Генерация строк всех читаемых листов.
+
+    :param rows: Количество строк на каждом листе.
+    :param seed: Начальное значение генератора случайных чисел.
+    :return: Итератор из наименования листа и значений ячеек строки.
+    """
+
+    rnd = random.Random(seed)
+    for sheet, make_row in SHEETS.items():
+        for _ in range(rows):
+            yield sheet, make_row(rnd)
+
+
+def generate_workbook(path: Path | str, rows: int, seed: int = 0) -> None:
+    """
+    Генерация входного файла по шаблону с заданным количеством строк на каждом читаемом листе.
+
+    :param path: Путь для сохранения входного файла.
+    :param rows: Количество строк на каждом листе.
+    :param seed: Начальное значение генератора случайных чисел.
+    """
+
+    workbook = openpyxl.load_workbook(TEMPLATE_FILE_PATH)
+    # строки шаблона заменяются сгенерированными (заголовок сохраняется)
+    for sheet in SHEETS:
+        workbook[sheet].delete_rows(2, workbook[sheet].max_row)
+    for sheet, values in iter_generated(rows, seed):
+        workbook[sheet].append(values)
+
+    workbook.save(path)
+
+
+def generate_text(path: Path | str, rows: int, seed: int = 0) -> None:
+    """
+    Генерация входного текстового файла (CSV или JSON Lines по расширению)
+    с теми же строками, что и :func:`generate_workbook`.
+
+    :param path: Путь для сохранения входного файла.
+    :param rows: Количество строк каждого типа.
+    :param seed: Начальное значение генератора случайных чисел.
+    """
+
+    columns = {reader.sheet: reader(None).columns for reader in SourcesReader.readers}
+    with open(path, "w", encoding="utf-8", newline="") as file:
+        if Path(path).suffix.lower() == ".csv":
+            writer = csv.writer(file)
+            writer.writerow(["type", *range(1, max(map(len, columns.values())) + 1)])
+            for sheet, values in iter_generated(rows, seed):
+                writer.writerow(
+                    [
+                        sheet,
+                        *(
+                            "" if value is None else convert_date(value)
+                            for value in values
+                        ),
+                    ]
+                )
+        else:
+            for sheet, values in iter_generated(rows, seed):
+                record = dict(zip(columns[sheet], map(convert_date, values)))
+                file.write(json.dumps({"type": sheet, **record}, ensure_ascii=False))
+                file.write("\n")
@@ -0,0 +1,355 @@
+"""
+Запуск замеров производительности этапов чтения, форматирования и генерации выходного файла.
+
+.. code-block:: console
+
+    python -m benchmarks.run --rows 10000 --save
+    python -m benchmarks.run --rows 10000
+"""
+from __future__ import annotations
+
+import json
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import click
+
+from benchmarks.generator import generate_text, generate_workbook
+from benchmarks.startup import measure_startup
+from formatters.styles.gost import GOSTCitationFormatter
+from readers.reader import SourcesReader
+from renderer import Renderer, StreamRenderer
+
+# путь к файлу с базовыми результатами замеров для сравнения
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+# этап, относительно которого оценивается ускорение остальных этапов чтения
+# (чтение рабочей книги Excel с параметрами по умолчанию)
+SPEEDUP_BASE = "read"
+
+
+def count(items: Any) -> int:
+    """
+    Подсчет количества элементов итератора.
+
+    :param items: Итератор элементов.
+    :return: Количество элементов.
+    """
+
+    return sum(1 for _ in items)
+
+
+def read(path: Path, **kwargs: Any) -> int:
+    """
+    Чтение входного файла.
+
+    :param path: Путь к входному файлу.
+    :param kwargs: Параметры читателя исходного файла.
+    :return: Количество прочитанных строк.
+    """
+
+    reader = SourcesReader(str(path), **kwargs)
+    try:
+        return count(reader.iter_read())
+    finally:
+        reader.close()
+
+
+def get_stages(path: Path, output_dir: Path) -> dict[str, Callable[[], int]]:
+    """
+    Получение замеряемых этапов обработки.
+
+    Входные данные этапов форматирования и генерации выходного файла подготавливаются заранее,
+    поэтому каждый этап замеряется отдельно.
+
+    :param path: Путь к входному файлу (рядом с ним располагаются одноименные файлы
+        `.csv` и `.jsonl` с теми же строками).
+    :param output_dir: Директория для выходных файлов.
+    :return: Наименования этапов и функции их выполнения, возвращающие количество строк.
+    """
+
+    models = SourcesReader(str(path)).read()
+    rows = tuple(str(item) for item in GOSTCitationFormatter(models).format())
+
+    def render(renderer: type[Renderer]) -> int:
+        renderer(rows).render(output_dir / "output.docx")
+        return len(rows)
+
+    return {
+        "read": lambda: read(path),
+        "read_streaming": lambda: read(path, streaming=True),
+        "read_trusted": lambda: read(path, streaming=True, trusted=True),
+        "read_native": lambda: read(path, native=True),
+        "read_csv": lambda: read(path.with_suffix(".csv")),
+        "read_jsonl": lambda: read(path.with_suffix(".jsonl")),
+        "format": lambda: len(GOSTCitationFormatter(models).format()),
+        "render": lambda: render(Renderer),
+        "render_stream": lambda: render(StreamRenderer),
+    }
+
+
+def measure(stage: Callable[[], int], memory: bool = True) -> dict[str, Any]:
+    """
+    Замер времени выполнения и пикового потребления памяти этапа.
+
+    Потребление памяти замеряется отдельным запуском, чтобы трассировка памяти
+    не влияла на замер времени.
+
+    :param stage: Функция выполнения этапа.
+    :param memory: Замер пикового потребления памяти.
+    :return: Результаты замера.
+    """
+
+    started = time.perf_counter()
+    rows = stage()
+    seconds = time.perf_counter() - started
+
+    result: dict[str, Any] = {
+        "rows": rows,
+        "seconds": round(seconds, 4),
+        "rows_per_second": round(rows / seconds) if seconds else None,
+    }
+
+    if memory:
+        tracemalloc.start()
+        stage()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        result["peak_memory_mb"] = round(peak / 2**20, 2)
+
+    return result
+
+
+def add_speedups(results: dict[str, Any]) -> None:
+    """
+    Расчет ускорения этапов чтения относительно чтения рабочей книги Excel
+    (например, для чтения CSV и JSON Lines с теми же строками).
+
+    :param results: Результаты замеров (ускорение сохраняется в результаты этапов).
+    """
+
+    stages = results["stages"]
+    if not (base := stages.get(SPEEDUP_BASE)) or not base["seconds"]:
+        return
+
+    for name, result in stages.items():
+        if name.startswith(f"{SPEEDUP_BASE}_") and result["seconds"]:
+            result["speedup"] = round(base["seconds"] / result["seconds"], 1)
+
+
+def compare(
+    results: dict[str, Any], baseline: dict[str, Any], tolerance: float
+) -> list[str]:
+    """
+    Сравнение результатов замеров с базовыми.
+
+    :param results: Результаты замеров.
+    :param baseline: Базовые результаты замеров.
+    :param tolerance: Допустимое относительное замедление (например, 0.2 – на 20 %).
+    :return: Наименования этапов с регрессией производительности.
+    """
+
+    regressions = []
+    for name, result in results["stages"].items():
+        base = baseline.get("stages", {}).get(name)
+        if not base or not base.get("seconds"):
+            continue
+
+        ratio = result["seconds"] / base["seconds"]
+        result["baseline_ratio"] = round(ratio, 3)
+        if ratio > 1 + tolerance:
+            regressions.append(name)
+
+    startup, base_startup = results.get("startup"), baseline.get("startup")
+    if startup and base_startup and base_startup.get("help_ms"):
+        ratio = startup["help_ms"] / base_startup["help_ms"]
+        startup["baseline_ratio"] = round(ratio, 3)
+        if ratio > 1 + tolerance:
+            regressions.append("startup")
+
+    return regressions
+
+
+def print_results(results: dict[str, Any]) -> None:
+    """
+    Вывод результатов замеров в виде таблицы.
+
+    :param results: Результаты замеров.
+    """
+
+    click.echo(
+        f"{'Этап':<16}{'Строк':>10}{'Секунд':>10}{'Строк/с':>12}{'Память, МБ':>12}"
+        f"{'К базе':>10}{'Ускорение':>12}"
+    )
+    for name, result in results["stages"].items():
+        click.echo(
+            f"{name:<16}{result['rows']:>10}{result['seconds']:>10.3f}"
+            f"{result['rows_per_second'] or 0:>12}"
+            f"{result.get('peak_memory_mb', '–'):>12}"
+            f"{result.get('baseline_ratio', '–'):>10}"
+            f"{result.get('speedup', '–'):>12}"
+        )
+
+    if startup := results.get("startup"):
+        click.echo(
+            f"Запуск: импорт main – {startup['import_main']['total_ms']} мс, "
+            f"main.py --help – {startup['help_ms']} мс "
+            f"(к базе: {startup.get('baseline_ratio', '–')})"
+        )
+        if startup["heavy_modules_on_import"]:
+            click.echo(
+                "При импорте main загружаются: "
+                + ", ".join(startup["heavy_modules_on_import"])
+            )
+
+
+@click.command()
+@click.option(
+    "--rows",
+    "-r",
+    "rows",
+    type=click.IntRange(min=1),
+    default=1000,
+    show_default=True,
+    help="Количество строк на каждом листе синтетического входного файла",
+)
+@click.option(
+    "--stage",
+    "-s",
+    "stages",
+    type=click.Choice(
+        [
+            "read",
+            "read_streaming",
+            "read_trusted",
+            "read_native",
+            "read_csv",
+            "read_jsonl",
+            "format",
+            "render",
+            "render_stream",
+        ]
+    ),
+    multiple=True,
+    help="Замеряемые этапы (по умолчанию все)",
+)
+@click.option(
+    "--memory/--no-memory",
+    "memory",
+    default=True,
+    show_default=True,
+    help="Замер пикового потребления памяти",
+)
+@click.option(
+    "--startup/--no-startup",
+    "startup",
+    default=True,
+    show_default=True,
+    help="Замер времени запуска консольной команды и импорта модулей",
+)
+@click.option(
+    "--baseline",
+    "-b",
+    "baseline_path",
+    type=click.Path(path_type=Path),
+    default=BASELINE_PATH,
+    show_default=True,
+    help="Путь к файлу с базовыми результатами замеров",
+)
+@click.option(
+    "--save",
+    "save",
+    is_flag=True,
+    default=False,
+    help="Сохранение результатов как базовых",
+)
+@click.option(
+    "--tolerance",
+    "-t",
+    "tolerance",
+    type=float,
+    default=0.2,
+    show_default=True,
+    help="Допустимое относительное замедление по сравнению с базовыми результатами",
+)
+@click.option(
+    "--output",
+    "-o",
+    "output",
+    type=click.Path(path_type=Path),
+    default=None,
+    help="Путь для сохранения результатов замеров (JSON)",
+)
+def run_benchmarks(  # pylint: disable=too-many-arguments,too-many-locals
+    rows: int = 1000,
+    stages: tuple[str, ...] = (),
+    memory: bool = True,
+    startup: bool = True,
+    baseline_path: Path = BASELINE_PATH,
+    save: bool = False,
+    tolerance: float = 0.2,
+    output: Optional[Path] = None,
+) -> None:
+    """
+    Замеры производительности чтения, форматирования и генерации выходного файла.
+
+    :param int rows: Количество строк на каждом листе синтетического входного файла
+    :param tuple[str, ...] stages: Замеряемые этапы (по умолчанию все)
+    :param bool memory: Замер пикового потребления памяти
+    :param bool startup: Замер времени запуска консольной команды и импорта модулей
+    :param Path baseline_path: Путь к файлу с базовыми результатами замеров
+    :param bool save: Сохранение результатов как базовых
+    :param float tolerance: Допустимое относительное замедление
+    :param Optional[Path] output: Путь для сохранения результатов замеров
+    """
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "input.xlsx"
+        click.echo(f"Генерация входного файла ({rows} строк на лист) ...")
+        generate_workbook(path, rows)
+        for suffix in (".csv", ".jsonl"):
+            generate_text(path.with_suffix(suffix), rows)
+
+        available = get_stages(path, Path(directory))
+        results: dict[str, Any] = {
+            "rows_per_sheet": rows,
+            "python": platform.python_version(),
+            "stages": {},
+        }
+        for name in stages or available:
+            click.echo(f"Замер этапа {name} ...")
+            results["stages"][name] = measure(available[name], memory=memory)
+        add_speedups(results)
+
+    if startup:
+        click.echo("Замер времени запуска ...")
+        results["startup"] = measure_startup()
+
+    regressions = []
+    if baseline_path.exists() and not save:
+        baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+        if baseline.get("rows_per_sheet") == rows:
+            regressions = compare(results, baseline, tolerance)
+        else:
+            click.echo("Базовые результаты получены для другого количества строк.")
+
+    print_results(results)
+
+    if output:
+        output.write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+    if save:
+        baseline_path.write_text(json.dumps(results, indent=2), encoding="utf-8")
+        click.echo(f"Базовые результаты сохранены: {baseline_path}")
+
+    if regressions:
+        click.echo(f"Регрессия производительности: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    run_benchmarks()  # pylint: disable=no-value-for-parameter
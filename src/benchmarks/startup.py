@@ -0,0 +1,112 @@
+"""
+Замеры времени запуска приложения и импорта модулей.
+"""
+from __future__ import annotations
+
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+# директория исходного кода приложения (рабочая директория для запуска команд)
+SOURCE_DIR = Path(__file__).resolve().parent.parent
+
+# тяжелые зависимости, которые не должны загружаться при запуске консольной команды
+HEAVY_MODULES = ("openpyxl", "docx", "pydantic")
+
+
+def run_python(*args: str) -> subprocess.CompletedProcess:
+    """
+    Запуск интерпретатора Python в директории исходного кода приложения.
+
+    :param args: Аргументы интерпретатора.
+    :return: Результат выполнения процесса.
+    """
+
+    return subprocess.run(
+        [sys.executable, *args],
+        cwd=SOURCE_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def measure_import(module: str, top: int = 5) -> dict[str, Any]:
+    """
+    Замер времени импорта модуля с помощью `python -X importtime`.
+
+    :param module: Наименование модуля.
+    :param top: Количество самых долгих импортируемых модулей в результате.
+    :return: Общее время импорта (мс) и самые долгие импорты (собственное время, мс).
+    """
+
+    stderr = run_python("-X", "importtime", "-c", f"import {module}").stderr
+
+    total = 0.0
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line[12:]:
+            continue
+
+        own, cumulative, name = line[12:].split("|")
+        if not own.strip().isdigit():
+            continue
+
+        imports.append((name.strip(), int(own) / 1000))
+        if name.strip() == module:
+            total = int(cumulative) / 1000
+
+    imports.sort(key=lambda item: item[1], reverse=True)
+
+    return {"total_ms": round(total, 2), "slowest_ms": dict(imports[:top])}
+
+
+def measure_command(*args: str, repeat: int = 5) -> float:
+    """
+    Замер времени выполнения команды (лучший результат из нескольких запусков).
+
+    :param args: Аргументы интерпретатора (например, `main.py --help`).
+    :param repeat: Количество запусков.
+    :return: Время выполнения (мс).
+    """
+
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run_python(*args)
+        timings.append(time.perf_counter() - started)
+
+    return round(min(timings) * 1000, 2)
+
+
+def get_loaded_heavy_modules(module: str) -> list[str]:
+    """
+    Получение тяжелых зависимостей, загружаемых при импорте модуля.
+
+    :param module: Наименование модуля.
+    :return: Наименования загруженных тяжелых зависимостей.
+    """
+
+    code = (
+        f"import sys, {module}; "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    output = run_python("-c", code).stdout.strip()
+
+    return output.split(",") if output else []
+
+
+def measure_startup() -> dict[str, Any]:
+    """
+    Замер времени запуска консольной команды.
+
+    :return: Результаты замеров.
+    """
+
+    return {
+        "import_main": measure_import("main"),
+        "help_ms": measure_command("main.py", "--help"),
+        "heavy_modules_on_import": get_loaded_heavy_modules("main"),
+    }
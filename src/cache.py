@@ -0,0 +1,357 @@
+"""
+Постоянный кэш отформатированных строк списка источников.
+"""
+from __future__ import annotations
+
+import hashlib
+import inspect
+import json
+import sqlite3
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional, Sequence
+
+from dedup import Deduplicator
+from formatters.authors import Author
+from formatters.base import StyleCitationFormatter
+from formatters.collation import sort_columns, sort_key
+from formatters.models import ArticlesCollectionModel, BookModel, InternetResourceModel
+from formatters.styles.base import BaseCitationStyle
+from formatters.styles.gost import GOSTCitationFormatter
+from logger import get_logger
+from readers.base import BaseReader
+from readers.reader import SourcesReader
+from settings import (
+    CACHE_BATCH_SIZE,
+    CACHE_BUSY_TIMEOUT,
+    CACHE_MAX_ENTRIES,
+    CACHE_PATH,
+    FORMATTER_AUTHORS_LIMIT,
+)
+
+logger = get_logger(__name__)
+
+
+def get_code_version(*classes: type) -> str:
+    """
+    Получение версии кода по содержимому модулей, в которых определены классы.
+
+    :param classes: Классы (например, стили цитирования).
+    :return: Хэш исходного кода модулей.
+    """
+
+    digest = hashlib.sha256()
+    for path in sorted({inspect.getfile(cls) for cls in classes}):
+        digest.update(Path(path).read_bytes())
+
+    return digest.hexdigest()
+
+
+class FormattedCache:
+    """
+    Постоянный кэш отформатированных строк по содержимому строк входного файла.
+
+    Ключом записи является хэш нормализованных атрибутов строки (как их считывает
+    :meth:`readers.base.BaseReader.parse`), значением – отформатированная строка.
+    При изменении версии кода стиля цитирования кэш очищается,
+    а при превышении максимального количества записей удаляются давно не использованные.
+
+    Изменения (новые записи и отметки об использовании) сохраняются пакетами
+    по `batch_size`, поэтому транзакция записи не удерживается до закрытия кэша.
+    """
+
+    def __init__(
+        self,
+        version: str,
+        path: Path | str = CACHE_PATH,
+        max_entries: int = CACHE_MAX_ENTRIES,
+        batch_size: int = CACHE_BATCH_SIZE,
+    ) -> None:
+        """
+        Конструктор.
+
+        :param version: Версия кода стиля цитирования.
+        :param path: Путь к файлу кэша.
+        :param max_entries: Максимальное количество записей в кэше.
+        :param batch_size: Количество изменений, сохраняемых одной транзакцией.
+        """
+
+        self.max_entries = max_entries
+        self.batch_size = batch_size
+        # ожидание освобождения файла кэша другим процессом
+        self.connection = sqlite3.connect(path, timeout=CACHE_BUSY_TIMEOUT)
+        self.connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT NOT NULL);
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY, value TEXT NOT NULL, used INTEGER NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS entries_used ON entries (used);
+            """
+        )
+
+        if self.get_meta("version") != version:
+            logger.info("Очистка кэша (изменилась версия стиля цитирования) ...")
+            self.connection.execute("DELETE FROM entries")
+            self.set_meta("version", version)
+
+        # номер запуска для учета давности использования записей
+        self.generation = int(self.get_meta("generation") or 0) + 1
+        self.set_meta("generation", str(self.generation))
+        self.connection.commit()
+
+        # количество найденных записей
+        self.hits = 0
+        # ключи найденных записей, отметка об использовании которых еще не сохранена
+        self.used: list[str] = []
+        # количество несохраненных изменений
+        self.pending = 0
+
+    def get_meta(self, name: str) -> Optional[str]:
+        """
+        Получение служебного значения кэша.
+
+        :param name: Наименование значения.
+        :return: Значение или `None`, если оно не задано.
+        """
+
+        row = self.connection.execute(
+            "SELECT value FROM meta WHERE name = ?", (name,)
+        ).fetchone()
+
+        return row[0] if row else None
+
+    def set_meta(self, name: str, value: str) -> None:
+        """
+        Сохранение служебного значения кэша.
+
+        :param name: Наименование значения.
+        :param value: Значение.
+        """
+
+        self.connection.execute(
+            "INSERT OR REPLACE INTO meta (name, value) VALUES (?, ?)", (name, value)
+        )
+
+    @staticmethod
+    def make_key(model_name: str, attrs: dict[str, Any]) -> str:
+        """
+        Получение ключа записи по атрибутам строки.
+
+        :param model_name: Наименование модели строки.
+        :param attrs: Атрибуты модели строки.
+        :return: Ключ записи.
+        """
+
+        content = json.dumps(
+            [model_name, attrs], sort_keys=True, ensure_ascii=False, default=str
+        )
+
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Получение отформатированной строки из кэша.
+
+        :param key: Ключ записи.
+        :return: Отформатированная строка или `None`, если записи нет.
+        """
+
+        row = self.connection.execute(
+            "SELECT value FROM entries WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        self.hits += 1
+        self.used.append(key)
+        self.step()
+
+        return row[0]
+
+    def set(self, key: str, value: str) -> None:
+        """
+        Сохранение отформатированной строки в кэш.
+
+        :param key: Ключ записи.
+        :param value: Отформатированная строка.
+        """
+
+        self.connection.execute(
+            "INSERT OR REPLACE INTO entries (key, value, used) VALUES (?, ?, ?)",
+            (key, value, self.generation),
+        )
+        self.step()
+
+    def step(self) -> None:
+        """
+        Учет изменения с сохранением накопленных изменений по достижении размера пакета.
+        """
+
+        self.pending += 1
+        if self.pending >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Сохранение накопленных изменений (отметок об использовании и новых записей).
+        """
+
+        self.connection.executemany(
+            "UPDATE entries SET used = ? WHERE key = ?",
+            ((self.generation, key) for key in self.used),
+        )
+        self.connection.commit()
+        self.used.clear()
+        self.pending = 0
+
+    def evict(self) -> None:
+        """
+        Удаление давно не использованных записей сверх максимального количества.
+        """
+
+        (count,) = self.connection.execute("SELECT COUNT(*) FROM entries").fetchone()
+        if count > self.max_entries:
+            logger.info("Удаление %s записей из кэша ...", count - self.max_entries)
+            self.connection.execute(
+                "DELETE FROM entries WHERE key IN "
+                "(SELECT key FROM entries ORDER BY used LIMIT ?)",
+                (count - self.max_entries,),
+            )
+
+    def close(self) -> None:
+        """
+        Сохранение изменений и закрытие кэша.
+        """
+
+        self.flush()
+        self.evict()
+        self.connection.commit()
+        self.connection.close()
+
+
+class CachedCitationFormatter:
+    """
+    Форматирование списка источников с использованием постоянного кэша.
+
+    Строки, содержимое которых не изменилось с прошлого запуска, не проходят
+    валидацию и форматирование: их отформатированное значение берется из кэша.
+    Строки форматируются сразу во всех заданных стилях цитирования за одно чтение.
+    """
+
+    def __init__(
+        self,
+        reader: SourcesReader,
+        cache: FormattedCache,
+        formatters: Sequence[type[StyleCitationFormatter]] = (GOSTCitationFormatter,),
+        deduplicator: Optional[Deduplicator] = None,
+    ) -> None:
+        """
+        Конструктор.
+
+        :param reader: Читатель исходного файла.
+        :param cache: Кэш отформатированных строк.
+        :param formatters: Классы форматирования списка источников (стили цитирования).
+        :param deduplicator: Объединение повторяющихся источников перед форматированием.
+        """
+
+        self.reader = reader
+        self.cache = cache
+        self.formatters = formatters
+        self.deduplicator = deduplicator
+
+    @staticmethod
+    def get_version(*formatters: type[StyleCitationFormatter]) -> str:
+        """
+        Получение версии кода стилей цитирования для кэша.
+
+        :param formatters: Классы форматирования списка источников.
+        :return: Версия кода стилей цитирования.
+        """
+
+        # атрибуты строк, по которым строится ключ записи, определяются читателями и моделями
+        code_version = get_code_version(
+            BaseReader,
+            SourcesReader,
+            BookModel,
+            InternetResourceModel,
+            ArticlesCollectionModel,
+            BaseCitationStyle,
+            Author,
+            *formatters,
+            *(
+                style
+                for formatter in formatters
+                for style in formatter.formatters_map.values()
+            ),
+        )
+
+        # количество авторов в описании влияет на отформатированные строки
+        return hashlib.sha256(
+            f"{code_version}:{FORMATTER_AUTHORS_LIMIT}".encode()
+        ).hexdigest()
+
+    def iter_formatted(self) -> Iterable[tuple[str, ...]]:
+        """
+        Получение отформатированных строк списка источников.
+
+        :return: Итератор отформатированных строк во всех стилях цитирования.
+        """
+
+        parsed = self.reader.iter_parsed()
+        if self.deduplicator:
+            parsed = self.deduplicator.filter_parsed(parsed)
+
+        hits = misses = 0
+        for reader, attrs in parsed:
+            model = None
+            row = []
+            for formatter in self.formatters:
+                # строки разных стилей хранятся под разными ключами
+                key = self.cache.make_key(
+                    f"{formatter.__name__}.{reader.model.__name__}", attrs
+                )
+
+                formatted = self.cache.get(key)
+                if formatted is None:
+                    misses += 1
+                    if model is None:
+                        model = reader.model(**attrs)
+                    formatted = formatter.format_model(model).formatted
+                    self.cache.set(key, formatted)
+                else:
+                    hits += 1
+                row.append(formatted)
+
+            yield tuple(row)
+
+        logger.info("Кэш: найдено %s, отформатировано %s.", hits, misses)
+
+    def sort_styles(self) -> list[Iterator[str]]:
+        """
+        Потоковое форматирование и сортировка списка источников во всех стилях цитирования.
+
+        Строки сортируются за один проход по входному файлу с ограниченным
+        потреблением памяти (см. :func:`formatters.collation.sort_columns`).
+
+        :return: Итераторы отсортированных отформатированных строк в порядке стилей.
+        """
+
+        return sort_columns(self.iter_formatted(), len(self.formatters), key=sort_key)
+
+    def format_styles(self) -> list[list[str]]:
+        """
+        Форматирование списка источников во всех стилях цитирования.
+
+        :return: Отсортированные списки отформатированных строк в порядке стилей.
+        """
+
+        return [list(column) for column in self.sort_styles()]
+
+    def format(self) -> list[str]:
+        """
+        Форматирование списка источников в первом стиле цитирования.
+
+        :return: Отсортированный список отформатированных строк.
+        """
+
+        return self.format_styles()[0]
@@ -0,0 +1,192 @@
+"""
+Обнаружение и объединение повторяющихся источников.
+"""
+from __future__ import annotations
+
+import logging
+import re
+from typing import Any, Callable, Iterable, Iterator, Mapping, TypeVar
+
+from pydantic import BaseModel
+
+from formatters.models import ArticlesCollectionModel, BookModel, InternetResourceModel
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# ключевые поля моделей, по которым источники считаются одинаковыми
+KEY_FIELDS: dict[type[BaseModel], tuple[str, ...]] = {
+    BookModel: ("authors", "title", "year"),
+    ArticlesCollectionModel: ("authors", "article_title", "year"),
+    InternetResourceModel: ("link",),
+}
+
+# протокол, префикс "www." и завершающие символы "/" в ссылках не учитываются
+LINK_PREFIX = re.compile(r"^[a-z][a-z0-9+.-]*://(www\.)?")
+
+
+def normalize(value: Any) -> str:
+    """
+    Нормализация значения ключевого поля: пробелы схлопываются, регистр не учитывается,
+    буква "ё" приравнивается к "е".
+
+    :param value: Значение поля.
+    :return: Нормализованное значение.
+    """
+
+    if value is None:
+        return ""
+
+    return " ".join(str(value).split()).casefold().replace("ё", "е")
+
+
+def normalize_link(value: Any) -> str:
+    """
+    Нормализация ссылки на интернет-ресурс.
+
+    :param value: Ссылка.
+    :return: Нормализованная ссылка.
+    """
+
+    return LINK_PREFIX.sub("", normalize(value)).rstrip("/")
+
+
+# функции нормализации ключевых полей (по умолчанию – :func:`normalize`)
+NORMALIZERS: dict[str, Callable[[Any], str]] = {
+    "link": normalize_link,
+}
+
+
+class Deduplicator:
+    """
+    Объединение повторяющихся источников за один проход.
+
+    Для каждого источника вычисляется ключ из нормализованных ключевых полей,
+    индекс ключей хранится в хэш-таблице, поэтому проверка выполняется
+    за линейное время от количества источников. Сохраняется первое вхождение источника.
+    """
+
+    def __init__(self) -> None:
+        # ключ источника -> количество объединенных дубликатов
+        self.index: dict[tuple, int] = {}
+
+    @staticmethod
+    def get_fields(model: type[BaseModel]) -> tuple[str, ...]:
+        """
+        Получение ключевых полей модели (для незарегистрированных моделей – всех полей).
+
+        :param model: Класс модели источника.
+        :return: Наименования ключевых полей.
+        """
+
+        return KEY_FIELDS.get(model) or tuple(model.__fields__)
+
+    @staticmethod
+    def make_key(model: type[BaseModel], attrs: Mapping[str, Any]) -> tuple:
+        """
+        Получение ключа источника.
+
+        :param model: Класс модели источника.
+        :param attrs: Атрибуты модели источника.
+        :return: Ключ источника.
+        """
+
+        return (
+            model,
+            *(
+                NORMALIZERS.get(field, normalize)(attrs.get(field))
+                for field in Deduplicator.get_fields(model)
+            ),
+        )
+
+    def is_duplicate(self, model: type[BaseModel], attrs: Mapping[str, Any]) -> bool:
+        """
+        Проверка источника на повтор с учетом его в индексе.
+
+        :param model: Класс модели источника.
+        :param attrs: Атрибуты модели источника.
+        :return: Источник уже встречался.
+        """
+
+        key = self.make_key(model, attrs)
+        if key in self.index:
+            self.index[key] += 1
+            return True
+
+        self.index[key] = 0
+
+        return False
+
+    def filter(self, models: Iterable[T]) -> Iterator[T]:
+        """
+        Исключение повторяющихся моделей источников.
+
+        :param models: Модели источников.
+        :return: Итератор моделей без повторов.
+        """
+
+        for model in models:
+            if not self.is_duplicate(type(model), model.__dict__):  # type: ignore
+                yield model
+
+        self.log_report()
+
+    def filter_parsed(
+        self, parsed: Iterable[tuple[Any, dict[str, Any]]]
+    ) -> Iterator[tuple[Any, dict[str, Any]]]:
+        """
+        Исключение повторяющихся источников, прочитанных в виде атрибутов моделей
+        (см. :meth:`readers.reader.SourcesReader.iter_parsed`).
+
+        :param parsed: Пары из читателя листа и атрибутов модели строки.
+        :return: Итератор пар без повторов.
+        """
+
+        for reader, attrs in parsed:
+            if not self.is_duplicate(reader.model, attrs):
+                yield reader, attrs
+
+        self.log_report()
+
+    def report(self) -> list[dict[str, Any]]:
+        """
+        Получение отчета об объединенных дубликатах.
+
+        :return: Список повторявшихся источников (нормализованные ключевые поля)
+            с количеством объединенных дубликатов.
+        """
+
+        return [
+            {
+                "model": key[0].__name__,
+                "key": dict(zip(self.get_fields(key[0]), key[1:])),
+                "duplicates": count,
+            }
+            for key, count in self.index.items()
+            if count
+        ]
+
+    def log_report(self) -> None:
+        """
+        Вывод отчета об объединенных дубликатах в журнал.
+        """
+
+        # в журнал уровня INFO выводятся только итоги, подробный отчет – на уровне DEBUG
+        counts = [count for count in self.index.values() if count]
+        logger.info(
+            "Объединено дубликатов: %s (повторявшихся источников: %s).",
+            sum(counts),
+            len(counts),
+        )
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+
+        for item in self.report():
+            logger.debug(
+                "Дубликаты (%s) источника %s: %s",
+                item["duplicates"],
+                item["model"],
+                item["key"],
+            )
@@ -0,0 +1,238 @@
+"""
+Разбор и нормализация списка авторов источника.
+
+Список авторов задается строкой вида `Иванов И.М., Петров С.Н.`. Каждый автор разбирается
+на фамилию и инициалы, инициалы приводятся к виду `И.М.` (без пробелов, прописными буквами),
+инициалы, указанные перед фамилией, переносятся после нее. Сокращение "и др." ("et al.")
+в конце списка сохраняется, инициалы, отделенные от фамилии запятой (`Smith, J.`),
+относятся к предыдущему автору.
+
+Одинаковые списки авторов повторяются в списке источников многократно, поэтому
+результаты разбора и форматирования кэшируются (:func:`functools.lru_cache`).
+"""
+import re
+from functools import lru_cache
+from typing import NamedTuple
+
+from settings import FORMATTER_AUTHORS_CACHE_SIZE, FORMATTER_AUTHORS_LIMIT
+
+# разделители авторов в списке
+AUTHORS_SEPARATOR = re.compile(r"\s*[,;]\s*")
+# инициалы: буквы (одна или две, например, `Дж.`) с точками, последняя точка может отсутствовать
+INITIALS = re.compile(r"(?:[^\W\d_]{1,2}\.)+[^\W\d_]?|[^\W\d_]")
+# пробелы между инициалами
+INITIALS_SPACE = re.compile(r"\.\s+(?=[^\W\d_]{1,2}\.|[^\W\d_]$)")
+# сокращение "и др." ("et al.") в конце списка авторов (в том числе в квадратных скобках)
+ET_AL = re.compile(r"(?:^|[\s,;]+)\[?(и\s*др|et\s+al)\.?\]?\s*$", re.IGNORECASE)
+# кириллические буквы (для выбора сокращения "и др." или "et al.")
+CYRILLIC = re.compile(r"[а-яё]", re.IGNORECASE)
+
+
+class Author(NamedTuple):
+    """
+    Автор источника.
+    """
+
+    # фамилия
+    surname: str
+    # инициалы в виде `И.М.` (пустая строка, если не указаны)
+    initials: str
+
+    def __str__(self) -> str:
+        return f"{self.surname} {self.initials}" if self.initials else self.surname
+
+
+def normalize_initials(token: str) -> str:
+    """
+    Нормализация инициалов: `и. м` -> `И.М.`.
+
+    :param token: Инициалы.
+    :return: Нормализованные инициалы.
+    """
+
+    return "".join(f"{part[0].upper()}{part[1:]}." for part in token.split(".") if part)
+
+
+def is_initials(token: str) -> bool:
+    """
+    Проверка фрагмента автора на инициалы (`И.М.`, `Дж.` или одну букву).
+
+    :param token: Фрагмент автора без пробелов.
+    :return: Фрагмент является инициалами.
+    """
+
+    return bool(INITIALS.fullmatch(token)) and ("." in token or len(token) == 1)
+
+
+def split_et_al(authors: str) -> tuple[str, str]:
+    """
+    Отделение сокращения "и др." ("et al.") от списка авторов.
+
+    :param authors: Список авторов через запятую (или точку с запятой).
+    :return: Список авторов без сокращения и нормализованное сокращение
+        (пустая строка, если сокращение не указано).
+    """
+
+    if not (match := ET_AL.search(authors)):
+        return authors, ""
+
+    suffix = "и др." if CYRILLIC.search(match.group(1)) else "et al."
+
+    return authors[: match.start()], suffix
+
+
+def parse_author(text: str) -> Author:
+    """
+    Разбор автора на фамилию и инициалы.
+
+    :param text: Автор (например, `Иванов И.М.` или `И. М. Иванов`).
+    :return: Автор.
+    """
+
+    surname, initials = [], []
+    # инициалы, разделенные пробелами (`И. М.`), объединяются
+    for token in INITIALS_SPACE.sub(".", text).split():
+        if is_initials(token):
+            initials.append(normalize_initials(token))
+        else:
+            surname.append(token)
+
+    if not surname:
+        # фамилия не выделена – автор сохраняется как есть
+        return Author(" ".join(text.split()), "")
+
+    return Author(" ".join(surname), "".join(initials))
+
+
+@lru_cache(maxsize=FORMATTER_AUTHORS_CACHE_SIZE)
+def parse_authors(authors: str) -> tuple[Author, ...]:
+    """
+    Разбор списка авторов.
+
+    Сокращение "и др." ("et al.") в конце списка не считается автором
+    (см. :func:`split_et_al`).
+
+    :param authors: Список авторов через запятую (или точку с запятой).
+    :return: Авторы в исходном порядке.
+    """
+
+    names: list[str] = []
+    for text in AUTHORS_SEPARATOR.split(split_et_al(authors)[0]):
+        if not text:
+            continue
+        # инициалы, отделенные запятой от фамилии без инициалов (`Smith, J.`),
+        # относятся к предыдущему автору
+        if (
+            names
+            and all(map(is_initials, INITIALS_SPACE.sub(".", text).split()))
+            and not parse_author(names[-1]).initials
+        ):
+            names[-1] = f"{names[-1]} {text}"
+        else:
+            names.append(text)
+
+    return tuple(map(parse_author, names))
+
+
+@lru_cache(maxsize=FORMATTER_AUTHORS_CACHE_SIZE)
+def format_authors(authors: str, limit: int = FORMATTER_AUTHORS_LIMIT) -> str:
+    """
+    Форматирование списка авторов для заголовка описания.
+
+    Если `limit` задан и авторов больше `limit`, приводятся первые `limit` авторов
+    с сокращением "и др." (для авторов на латинице – "et al."). Сокращение, указанное
+    в исходном списке, сохраняется.
+
+    :param authors: Список авторов через запятую (или точку с запятой).
+    :param limit: Максимальное количество приводимых авторов (0 – без ограничения).
+    :return: Нормализованный список авторов.
+    """
+
+    parsed = parse_authors(authors)
+    suffix = split_et_al(authors)[1]
+    if limit and len(parsed) > limit:
+        parsed = parsed[:limit]
+        suffix = suffix or ("и др." if CYRILLIC.search(parsed[0].surname) else "et al.")
+
+    formatted = ", ".join(map(str, parsed))
+
+    return f"{formatted} {suffix}" if formatted and suffix else formatted
+
+
+def end_sentence(text: str) -> str:
+    """
+    Завершение элемента описания точкой (если он не оканчивается точкой, например, инициалами).
+
+    :param text: Элемент описания.
+    :return: Элемент описания с точкой в конце.
+    """
+
+    return text if not text or text.endswith(".") else f"{text}."
+
+
+@lru_cache(maxsize=FORMATTER_AUTHORS_CACHE_SIZE)
+def format_authors_mla(authors: str) -> str:
+    """
+    Форматирование списка авторов по MLA.
+
+    Первый автор приводится в виде `Фамилия, Инициалы`, второй – `Инициалы Фамилия`,
+    при трех и более авторах (или сокращении "и др." в исходном списке) приводится
+    первый автор с сокращением "et al.".
+
+    .. code-block::
+
+        format_authors_mla("Иванов И.М., Петров С.Н.")
+        # "Иванов, И.М., and С.Н. Петров."
+
+    :param authors: Список авторов через запятую (или точку с запятой).
+    :return: Отформатированный список авторов с точкой в конце.
+    """
+
+    parsed = parse_authors(authors)
+    if not parsed:
+        return ""
+
+    first = ", ".join(filter(None, parsed[0]))
+    if split_et_al(authors)[1]:
+        return f"{first}, et al."
+    if len(parsed) == 1:
+        return end_sentence(first)
+    if len(parsed) == 2:
+        second = " ".join(filter(None, reversed(parsed[1])))
+        return end_sentence(f"{first}, and {second}")
+
+    return f"{first}, et al."
+
+
+@lru_cache(maxsize=FORMATTER_AUTHORS_CACHE_SIZE)
+def format_authors_apa(authors: str) -> str:
+    """
+    Форматирование списка авторов по APA.
+
+    Авторы приводятся в виде `Фамилия, И. М.`, перед последним автором ставится `&`.
+    При более чем 20 авторах приводятся первые 19 авторов, многоточие и последний автор.
+    Сокращение "и др." в исходном списке приводится в конце как "et al.".
+
+    .. code-block::
+
+        format_authors_apa("Иванов И.М., Петров С.Н.")
+        # "Иванов, И. М., & Петров, С. Н."
+
+    :param authors: Список авторов через запятую (или точку с запятой).
+    :return: Отформатированный список авторов с точкой в конце.
+    """
+
+    names = [
+        f"{author.surname}, {author.initials.replace('.', '. ').strip()}"
+        if author.initials
+        else author.surname
+        for author in parse_authors(authors)
+    ]
+    if names and split_et_al(authors)[1]:
+        return f"{', '.join(names)}, et al."
+    if len(names) > 20:
+        return end_sentence(f"{', '.join(names[:19])}, . . . {names[-1]}")
+    if len(names) > 1:
+        return end_sentence(f"{', '.join(names[:-1])}, & {names[-1]}")
+
+    return end_sentence("".join(names))
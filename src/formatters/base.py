@@ -2,8 +2,21 @@
 Базовые функции форматирования списка источников
 """
 
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import chain, islice
+from typing import Any, ClassVar, Iterable, Iterator, Sequence
+
+from pydantic import BaseModel
+
+from formatters.collation import sort_key
 from formatters.styles.base import BaseCitationStyle
-from logger import get_logger
+from logger import ProgressLogger, get_logger
+from settings import (
+    FORMATTER_CHUNK_SIZE,
+    FORMATTER_PARALLEL_THRESHOLD,
+    FORMATTER_WORKERS,
+)
 
 
 logger = get_logger(__name__)
@@ -32,4 +45,164 @@ class BaseCitationFormatter:
 
         logger.info("Общее форматирование ...")
 
-        return sorted(self.formatted_items, key=lambda item: item.formatted)
+        return sorted(self.formatted_items, key=lambda item: sort_key(item.formatted))
+
+
+class StyleCitationFormatter(BaseCitationFormatter):
+    """
+    Базовый класс форматирования списка источников в заданном стиле цитирования.
+    """
+
+    # классы форматирования строк по классам моделей источников
+    formatters_map: ClassVar[dict[type[BaseModel], type[BaseCitationStyle]]] = {}
+
+    def __init__(
+        self,
+        models: Iterable[BaseModel],
+        workers: int = FORMATTER_WORKERS,
+        chunk_size: int = FORMATTER_CHUNK_SIZE,
+        threshold: int = FORMATTER_PARALLEL_THRESHOLD,
+    ) -> None:
+        """
+        Конструктор.
+
+        :param models: Список (или итератор) объектов для форматирования
+        :param workers: Количество процессов для параллельного форматирования
+        :param chunk_size: Количество строк, форматируемых одним заданием процесса
+        :param threshold: Минимальное количество строк для параллельного форматирования
+        """
+
+        (formatted_items,) = format_models(
+            models, [type(self)], workers, chunk_size, threshold
+        )
+        super().__init__(formatted_items)
+
+    @classmethod
+    def format_model(cls, model: BaseModel) -> BaseCitationStyle:
+        """
+        Форматирование строки списка источников по классу модели.
+
+        :param model: Модель источника.
+        :return: Отформатированная строка.
+        """
+
+        return cls.formatters_map[type(model)](model)
+
+
+def format_chunk(
+    formatters: Sequence[type[StyleCitationFormatter]],
+    chunk: list[tuple[type[BaseModel], dict[str, Any]]],
+) -> list[tuple[str, ...]]:
+    """
+    Форматирование части списка источников в отдельном процессе.
+
+    Модели передаются в виде атрибутов (их передача между процессами значительно
+    дешевле передачи моделей) и восстанавливаются без повторной валидации.
+
+    :param formatters: Классы форматирования списка источников (стили цитирования).
+    :param chunk: Пары из класса модели источника и ее атрибутов.
+    :return: Отформатированные строки моделей в порядке стилей.
+    """
+
+    rows = []
+    for model_class, attrs in chunk:
+        model = model_class.construct(**attrs)
+        rows.append(
+            tuple(formatter.format_model(model).formatted for formatter in formatters)
+        )
+
+    return rows
+
+
+def iter_format_chunks(
+    models: Iterable[BaseModel],
+    formatters: Sequence[type[StyleCitationFormatter]],
+    workers: int = FORMATTER_WORKERS,
+    chunk_size: int = FORMATTER_CHUNK_SIZE,
+    threshold: int = FORMATTER_PARALLEL_THRESHOLD,
+) -> Iterator[tuple[list[BaseModel], list[tuple[str, ...]]]]:
+    """
+    Потоковое форматирование моделей источников частями в заданных стилях цитирования.
+
+    Если процессов несколько и моделей не меньше порогового количества, части
+    форматируются в пуле процессов; одновременно в обработке находится не более
+    двух частей на процесс, поэтому потребление памяти не зависит от длины списка.
+    Части возвращаются в исходном порядке.
+
+    :param models: Список (или итератор) объектов для форматирования.
+    :param formatters: Классы форматирования списка источников (стили цитирования).
+    :param workers: Количество процессов для параллельного форматирования.
+    :param chunk_size: Количество строк, форматируемых одним заданием процесса.
+    :param threshold: Минимальное количество строк для параллельного форматирования.
+    :return: Итератор пар из части моделей и их отформатированных строк в порядке стилей.
+    """
+
+    models = iter(models)
+    head = list(islice(models, threshold)) if workers > 1 else []
+    remaining = chain(head, models)
+    chunks = iter(lambda: list(islice(remaining, chunk_size)), [])
+
+    if not (workers > 1 and len(head) >= threshold):
+        for chunk in chunks:
+            yield chunk, [
+                tuple(
+                    formatter.format_model(model).formatted for formatter in formatters
+                )
+                for model in chunk
+            ]
+        return
+
+    logger.info("Параллельное форматирование (процессов: %s) ...", workers)
+    del head
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: deque[tuple[list[BaseModel], Future]] = deque()
+        for chunk in chunks:
+            payload = [(type(model), model.__dict__) for model in chunk]
+            pending.append((chunk, executor.submit(format_chunk, formatters, payload)))
+            if len(pending) >= workers * 2:
+                chunk, future = pending.popleft()
+                yield chunk, future.result()
+
+        while pending:
+            chunk, future = pending.popleft()
+            yield chunk, future.result()
+
+
+def format_models(
+    models: Iterable[BaseModel],
+    formatters: Sequence[type[StyleCitationFormatter]],
+    workers: int = FORMATTER_WORKERS,
+    chunk_size: int = FORMATTER_CHUNK_SIZE,
+    threshold: int = FORMATTER_PARALLEL_THRESHOLD,
+) -> list[list[BaseCitationStyle]]:
+    """
+    Форматирование моделей источников в заданных стилях цитирования.
+
+    Модели форматируются частями (см. :func:`iter_format_chunks`): если процессов
+    несколько и моделей не меньше порогового количества, части форматируются
+    в пуле процессов, иначе последовательно; отформатированные строки возвращаются
+    в исходном порядке.
+
+    :param models: Список (или итератор) объектов для форматирования.
+    :param formatters: Классы форматирования списка источников (стили цитирования).
+    :param workers: Количество процессов для параллельного форматирования.
+    :param chunk_size: Количество строк, форматируемых одним заданием процесса.
+    :param threshold: Минимальное количество строк для параллельного форматирования.
+    :return: Неотсортированные отформатированные строки в порядке стилей.
+    """
+
+    formatted_items: list[list[BaseCitationStyle]] = [[] for _ in formatters]
+    progress = ProgressLogger(logger, "Форматирование")
+
+    for chunk, rows in iter_format_chunks(
+        models, formatters, workers, chunk_size, threshold
+    ):
+        for model, row in zip(chunk, rows):
+            for formatter, formatted, items in zip(formatters, row, formatted_items):
+                # объект стиля восстанавливается без повторного форматирования
+                style = formatter.formatters_map[type(model)]
+                items.append(style.restore(model, formatted))
+        progress.step(len(chunk))
+    progress.finish()
+
+    return formatted_items
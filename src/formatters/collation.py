@@ -0,0 +1,239 @@
+"""
+Сортировка списка источников.
+"""
+import heapq
+import pickle
+import re
+import sys
+import tempfile
+import unicodedata
+from operator import itemgetter
+from typing import IO, Callable, Iterable, Iterator, Sequence, TypeVar
+
+from settings import COLLATION_BUFFER_SIZE, COLLATION_MEMORY_LIMIT
+
+T = TypeVar("T")
+
+# признак окончания элементов
+_END = object()
+
+# порядок письменностей при сортировке: знаки, не являющиеся буквами, затем кириллица,
+# латиница и остальные письменности (по ГОСТ сначала приводятся источники на русском языке)
+SCRIPT_RANKS = {"CYRILLIC": 1, "LATIN": 2}
+OTHER_SCRIPT_RANK = 3
+
+
+def get_script_rank(char: str) -> int:
+    """
+    Получение порядка письменности символа при сортировке.
+
+    Письменность определяется по наименованию символа в базе Unicode
+    (например, `CYRILLIC SMALL LETTER A`), поэтому учитываются все буквы письменности,
+    а не только основной блок кодовых позиций.
+
+    :param char: Символ.
+    :return: Порядок письменности (0 – не буква).
+    """
+
+    if not char.isalpha():
+        return 0
+
+    script = unicodedata.name(char, "").split(" ", 1)[0]
+
+    return SCRIPT_RANKS.get(script, OTHER_SCRIPT_RANK)
+
+
+class CollationTable(dict[int, str]):
+    """
+    Таблица преобразования символов для ключа сортировки.
+
+    Каждый символ заменяется парой из порядка его письменности и самого символа
+    (буква "ё" приравнивается к "е"), поэтому строки сравниваются сначала
+    по письменности, а затем по кодовой позиции символа. Преобразование символа
+    вычисляется при первом обращении и сохраняется в таблице.
+    """
+
+    def __missing__(self, code: int) -> str:
+        char = "е" if code == ord("ё") else chr(code)
+        self[code] = value = f"{chr(get_script_rank(char))}{char}"
+
+        return value
+
+
+# таблица преобразования символов для ключа сортировки
+COLLATION_TABLE = CollationTable()
+
+# знаки препинания и пробелы в начале строки, не учитываемые при сортировке
+LEADING_PUNCTUATION = re.compile(r"^[\W_]+")
+
+
+def sort_key(text: str) -> str:
+    """
+    Получение ключа сортировки строки списка источников.
+
+    Ключ вычисляется один раз для строки: знаки препинания в начале строки отбрасываются,
+    регистр не учитывается, буква "ё" приравнивается к "е", а кириллица предшествует латинице
+    (по ГОСТ сначала приводятся источники на русском языке, затем на иностранных).
+
+    .. code-block::
+
+        sorted(["Smith J. ...", "«Иванов» ...", "Андреев ..."], key=sort_key)
+        # ["Андреев ...", "«Иванов» ...", "Smith J. ..."]
+
+    :param text: Строка списка источников.
+    :return: Ключ сортировки.
+    """
+
+    return LEADING_PUNCTUATION.sub("", text).casefold().translate(COLLATION_TABLE)
+
+
+def dump_run(items: list[tuple[str, T]]) -> IO[bytes]:
+    """
+    Сохранение отсортированной части элементов во временный файл.
+
+    :param items: Отсортированные пары из ключа сортировки и элемента.
+    :return: Временный файл, подготовленный для чтения.
+    """
+
+    # pylint: disable=consider-using-with
+    run = tempfile.TemporaryFile()
+    for item in items:
+        pickle.dump(item, run, protocol=pickle.HIGHEST_PROTOCOL)
+    run.seek(0)
+
+    return run
+
+
+def load_run(run: IO[bytes]) -> Iterator[tuple[str, T]]:
+    """
+    Чтение отсортированной части элементов из временного файла.
+
+    :param run: Временный файл.
+    :return: Итератор пар из ключа сортировки и элемента.
+    """
+
+    with run:
+        while True:
+            try:
+                yield pickle.load(run)
+            except EOFError:
+                return
+
+
+def iter_buffers(
+    items: Iterable[T],
+    buffer_size: int = COLLATION_BUFFER_SIZE,
+    memory_limit: int = COLLATION_MEMORY_LIMIT,
+    size: Callable[[T], int] = sys.getsizeof,
+) -> Iterator[tuple[list[T], bool]]:
+    """
+    Разбиение элементов на буферы ограниченного размера.
+
+    Буфер завершается, когда в нем набирается заданное количество элементов
+    или оценка занимаемой элементами памяти достигает заданного объема.
+
+    :param items: Элементы.
+    :param buffer_size: Максимальное количество элементов в буфере.
+    :param memory_limit: Максимальный объем памяти элементов буфера в байтах.
+    :param size: Функция оценки объема памяти элемента в байтах.
+    :return: Итератор пар из буфера и признака последнего буфера.
+    """
+
+    iterator = iter(items)
+    item = next(iterator, _END)
+    while item is not _END:
+        buffer: list[T] = []
+        used = 0
+        while item is not _END and len(buffer) < buffer_size and used < memory_limit:
+            buffer.append(item)  # type: ignore
+            used += size(item)  # type: ignore
+            item = next(iterator, _END)
+
+        yield buffer, item is _END
+
+
+def sort_items(
+    items: Iterable[T],
+    key: Callable[[T], str],
+    buffer_size: int = COLLATION_BUFFER_SIZE,
+    memory_limit: int = COLLATION_MEMORY_LIMIT,
+) -> Iterator[T]:
+    """
+    Сортировка элементов по предварительно вычисленным ключам.
+
+    Если элементы не помещаются в буфер (по количеству или по объему памяти),
+    выполняется внешняя сортировка слиянием: отсортированные части сохраняются
+    во временные файлы и затем сливаются.
+    Сортировка устойчива: элементы с равными ключами сохраняют исходный порядок.
+
+    :param items: Элементы для сортировки.
+    :param key: Функция получения ключа сортировки элемента.
+    :param buffer_size: Максимальное количество элементов, сортируемых в памяти.
+    :param memory_limit: Максимальный объем памяти элементов, сортируемых в памяти, в байтах.
+    :return: Итератор отсортированных элементов.
+    """
+
+    (column,) = sort_columns(
+        ((item,) for item in items),
+        1,
+        key=key,
+        buffer_size=buffer_size,
+        memory_limit=memory_limit,
+    )
+
+    return column
+
+
+def sort_columns(
+    rows: Iterable[Sequence[T]],
+    columns: int,
+    key: Callable[[T], str],
+    buffer_size: int = COLLATION_BUFFER_SIZE,
+    memory_limit: int = COLLATION_MEMORY_LIMIT,
+) -> list[Iterator[T]]:
+    """
+    Независимая сортировка каждого столбца строк за один проход по строкам
+    (например, строк списка источников, отформатированных в нескольких стилях).
+
+    Строки читаются буферами ограниченного размера; при нескольких буферах
+    отсортированные части каждого столбца сохраняются во временные файлы
+    и сливаются при получении результата, поэтому потребление памяти
+    ограничено размером буфера.
+
+    :param rows: Строки из значений столбцов.
+    :param columns: Количество столбцов.
+    :param key: Функция получения ключа сортировки значения.
+    :param buffer_size: Максимальное количество строк, сортируемых в памяти.
+    :param memory_limit: Максимальный объем памяти строк, сортируемых в памяти, в байтах.
+    :return: Итераторы отсортированных значений в порядке столбцов.
+    """
+
+    def size(row: Sequence[T]) -> int:
+        return sum(map(sys.getsizeof, row))
+
+    runs: list[list[IO[bytes]]] = [[] for _ in range(columns)]
+    for buffer, last in iter_buffers(rows, buffer_size, memory_limit, size):
+        for index, column_runs in enumerate(runs):
+            column = sorted(
+                ((key(row[index]), row[index]) for row in buffer), key=itemgetter(0)
+            )
+            if last and not column_runs:
+                # все строки поместились в буфер
+                column_runs.append(column)  # type: ignore
+            else:
+                column_runs.append(dump_run(column))
+        del buffer
+
+    return [
+        map(
+            itemgetter(1),
+            heapq.merge(
+                *(
+                    iter(run) if isinstance(run, list) else load_run(run)
+                    for run in column_runs
+                ),
+                key=itemgetter(0),
+            ),
+        )
+        for column_runs in runs
+    ]
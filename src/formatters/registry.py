@@ -0,0 +1,85 @@
+"""
+Реестр стилей цитирования.
+"""
+from typing import Iterable, Iterator, Sequence
+
+from pydantic import BaseModel
+
+from formatters.base import (
+    BaseCitationFormatter,
+    StyleCitationFormatter,
+    format_models,
+    iter_format_chunks,
+)
+from formatters.styles.apa import APACitationFormatter
+from formatters.styles.base import BaseCitationStyle
+from formatters.styles.gost import GOSTCitationFormatter
+from formatters.styles.mla import MLACitationFormatter
+from settings import FORMATTER_WORKERS
+
+# зарегистрированные стили цитирования (наименования совпадают с `main.CitationEnum`)
+STYLES: dict[str, type[StyleCitationFormatter]] = {
+    "GOST": GOSTCitationFormatter,
+    "MLA": MLACitationFormatter,
+    "APA": APACitationFormatter,
+}
+
+
+def get_formatter(style: str) -> type[StyleCitationFormatter]:
+    """
+    Получение класса форматирования списка источников по наименованию стиля цитирования.
+
+    :param style: Наименование стиля цитирования (без учета регистра).
+    :return: Класс форматирования списка источников.
+    :raises ValueError: Стиль цитирования не зарегистрирован.
+    """
+
+    try:
+        return STYLES[style.upper()]
+    except KeyError:
+        raise ValueError(f"Стиль цитирования не поддерживается: {style}") from None
+
+
+def format_styles(
+    models: Iterable[BaseModel],
+    styles: Sequence[str],
+    workers: int = FORMATTER_WORKERS,
+) -> list[list[BaseCitationStyle]]:
+    """
+    Форматирование списка источников сразу в нескольких стилях цитирования.
+
+    Модели читаются один раз: каждая модель форматируется во всех стилях
+    по мере получения, поэтому исходный файл не перечитывается для каждого стиля.
+
+    :param models: Список (или итератор) объектов для форматирования.
+    :param styles: Наименования стилей цитирования.
+    :param workers: Количество процессов для параллельного форматирования.
+    :return: Отсортированные списки отформатированных строк в порядке стилей.
+    """
+
+    formatters = [get_formatter(style) for style in styles]
+    formatted_items = format_models(models, formatters, workers)
+
+    return [BaseCitationFormatter(items).format() for items in formatted_items]
+
+
+def iter_format_styles(
+    models: Iterable[BaseModel],
+    styles: Sequence[str],
+    workers: int = FORMATTER_WORKERS,
+) -> Iterator[tuple[str, ...]]:
+    """
+    Потоковое форматирование списка источников сразу в нескольких стилях цитирования.
+
+    В отличие от :func:`format_styles`, отформатированные строки не накапливаются
+    и не сортируются, а возвращаются по мере форматирования частей списка.
+
+    :param models: Список (или итератор) объектов для форматирования.
+    :param styles: Наименования стилей цитирования.
+    :param workers: Количество процессов для параллельного форматирования.
+    :return: Итератор неотсортированных отформатированных строк в порядке стилей.
+    """
+
+    formatters = [get_formatter(style) for style in styles]
+    for _, rows in iter_format_chunks(models, formatters, workers):
+        yield from rows
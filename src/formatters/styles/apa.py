@@ -0,0 +1,66 @@
+"""
+Стиль цитирования APA (American Psychological Association, 7-е издание).
+"""
+from string import Template
+
+from formatters.authors import format_authors_apa
+from formatters.base import StyleCitationFormatter
+from formatters.models import BookModel, InternetResourceModel, ArticlesCollectionModel
+from formatters.styles.base import (
+    BaseBookStyle,
+    BaseCollectionArticleStyle,
+    BaseInternetResourceStyle,
+)
+
+
+class APABook(BaseBookStyle):
+    """
+    Форматирование для книг.
+    """
+
+    edition_template = " ({edition} изд.)"
+    format_authors = staticmethod(format_authors_apa)
+
+    @property
+    def template(self) -> Template:
+        return self.compile_template(
+            "$authors ($year). $title$edition. $publishing_house."
+        )
+
+
+class APAInternetResource(BaseInternetResourceStyle):
+    """
+    Форматирование для интернет-ресурсов.
+    """
+
+    @property
+    def template(self) -> Template:
+        return self.compile_template(
+            "$article. (n.d.). $website. Retrieved $access_date, from $link"
+        )
+
+
+class APACollectionArticle(BaseCollectionArticleStyle):
+    """
+    Форматирование для статьи из сборника.
+    """
+
+    format_authors = staticmethod(format_authors_apa)
+
+    @property
+    def template(self) -> Template:
+        return self.compile_template(
+            "$authors ($year). $article_title. In $collection_title (pp. $pages). $publishing_house."
+        )
+
+
+class APACitationFormatter(StyleCitationFormatter):
+    """
+    Форматирование списка источников в стиле APA.
+    """
+
+    formatters_map = {
+        BookModel: APABook,
+        InternetResourceModel: APAInternetResource,
+        ArticlesCollectionModel: APACollectionArticle,
+    }
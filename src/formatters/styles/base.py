@@ -3,20 +3,60 @@
 """
 
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from string import Template
+from typing import Any, ClassVar
 
 from pydantic import BaseModel
 
+from formatters.models import ArticlesCollectionModel, BookModel, InternetResourceModel
+from settings import FORMATTER_FRAGMENT_CACHE_SIZE
+
+
+@lru_cache(maxsize=FORMATTER_FRAGMENT_CACHE_SIZE)
+def format_edition(template: str, edition: str) -> str:
+    """
+    Получение отформатированной информации об издании
+    (форматируется один раз для каждого различного значения).
+
+    :param template: Шаблон информации об издании стиля цитирования.
+    :param edition: Издание (например, `3-е`).
+    :return: Информация об издании.
+    """
+
+    return template.format(edition=edition)
+
 
 class BaseCitationStyle(ABC):
     """
     Абстрактный базовый класс стиля цитирования.
     """
 
+    # реестр скомпилированных шаблонов, общий для всех стилей цитирования:
+    # строка шаблона -> (шаблон, строка формата для быстрой подстановки)
+    templates: ClassVar[dict[str, tuple[Template, str]]] = {}
+
     def __init__(self, data: BaseModel) -> None:
         self.data = data
         self.formatted = self.substitute()
 
+    @classmethod
+    def restore(cls, data: BaseModel, formatted: str) -> "BaseCitationStyle":
+        """
+        Восстановление отформатированной строки без повторного заполнения шаблона
+        (например, по строке, отформатированной в другом процессе).
+
+        :param data: Модель источника.
+        :param formatted: Отформатированная строка.
+        :return: Отформатированная строка в виде объекта стиля.
+        """
+
+        style = cls.__new__(cls)
+        style.data = data
+        style.formatted = formatted
+
+        return style
+
     @property
     @abstractmethod
     def template(self) -> Template:
@@ -26,6 +66,65 @@ class BaseCitationStyle(ABC):
         :return:
         """
 
+    @classmethod
+    def compile_template(cls, template: str) -> Template:
+        """
+        Получение скомпилированного шаблона из реестра.
+
+        Шаблон разбирается один раз и преобразуется в строку формата `str.format_map()`.
+
+        :param template: Строка шаблона в формате :class:`string.Template`.
+        :return: Шаблон для форматирования строки.
+        """
+
+        if template not in cls.templates:
+            compiled = Template(template)
+            cls.templates[template] = (compiled, cls.to_format_string(compiled))
+
+        return cls.templates[template][0]
+
+    @staticmethod
+    def to_format_string(template: Template) -> str:
+        """
+        Преобразование шаблона в строку формата `str.format_map()`.
+
+        :param template: Шаблон для форматирования строки.
+        :return: Строка формата.
+        """
+
+        def escape(text: str) -> str:
+            return text.replace("{", "{{").replace("}", "}}")
+
+        parts = []
+        position = 0
+        for match in template.pattern.finditer(template.template):
+            start = match.start()
+            parts.append(escape(template.template[position:start]))
+            if name := match.group("named") or match.group("braced"):
+                parts.append("{" + name + "}")
+            elif match.group("escaped") is not None:
+                parts.append("$")
+            else:
+                raise ValueError(f"Некорректный шаблон: {template.template}")
+            position = match.end()
+        parts.append(escape(template.template[position:]))
+
+        return "".join(parts)
+
+    def fill(self, **values: Any) -> str:
+        """
+        Быстрое заполнение шаблона стиля через предварительно подготовленную строку формата.
+
+        :param values: Значения подстановок шаблона.
+        :return: Заполненный шаблон.
+        """
+
+        template = self.template.template
+        if template not in self.templates:
+            self.compile_template(template)
+
+        return self.templates[template][1].format_map(values)
+
     @abstractmethod
     def substitute(self) -> str:
         """
@@ -39,3 +138,100 @@ class BaseCitationStyle(ABC):
 
     def __repr__(self) -> str:
         return self.formatted
+
+
+class BaseBookStyle(BaseCitationStyle):
+    """
+    Базовый класс форматирования книг: подстановка всех атрибутов модели книги в шаблон стиля.
+
+    Стиль задает шаблон, шаблон информации об издании и форматирование списка авторов.
+    """
+
+    data: BookModel
+
+    # шаблон информации об издании (`{edition}` – издание, например, `3-е`)
+    edition_template: ClassVar[str] = "{edition} изд."
+
+    @staticmethod
+    def format_authors(authors: str) -> str:
+        """
+        Форматирование списка авторов (по умолчанию – без изменений).
+
+        :param authors: Список авторов.
+        :return: Отформатированный список авторов.
+        """
+
+        return authors
+
+    def get_edition(self) -> str:
+        """
+        Получение отформатированной информации об издании.
+
+        :return: Информация об издании (пустая строка, если издание не указано).
+        """
+
+        if not self.data.edition:
+            return ""
+
+        return format_edition(self.edition_template, self.data.edition)
+
+    def substitute(self) -> str:
+        return self.fill(
+            authors=self.format_authors(self.data.authors),
+            title=self.data.title,
+            edition=self.get_edition(),
+            city=self.data.city,
+            publishing_house=self.data.publishing_house,
+            year=self.data.year,
+            pages=self.data.pages,
+        )
+
+
+class BaseInternetResourceStyle(BaseCitationStyle):
+    """
+    Базовый класс форматирования интернет-ресурсов: подстановка всех атрибутов модели
+    интернет-ресурса в шаблон стиля.
+    """
+
+    data: InternetResourceModel
+
+    def substitute(self) -> str:
+        return self.fill(
+            article=self.data.article,
+            website=self.data.website,
+            link=self.data.link,
+            access_date=self.data.access_date,
+        )
+
+
+class BaseCollectionArticleStyle(BaseCitationStyle):
+    """
+    Базовый класс форматирования статей из сборника: подстановка всех атрибутов модели
+    статьи в шаблон стиля.
+
+    Стиль задает шаблон и форматирование списка авторов.
+    """
+
+    data: ArticlesCollectionModel
+
+    @staticmethod
+    def format_authors(authors: str) -> str:
+        """
+        Форматирование списка авторов (по умолчанию – без изменений).
+
+        :param authors: Список авторов.
+        :return: Отформатированный список авторов.
+        """
+
+        return authors
+
+    def substitute(self) -> str:
+        return self.fill(
+            authors=self.format_authors(self.data.authors),
+            article_title=self.data.article_title,
+            collection_title=self.data.collection_title,
+            city=self.data.city,
+            publishing_house=self.data.publishing_house,
+            year=self.data.year,
+            pages=self.data.pages,
+        )
@@ -3,135 +3,65 @@
 """
 from string import Template
 
-from pydantic import BaseModel
-
+from formatters.authors import format_authors
+from formatters.base import StyleCitationFormatter
 from formatters.models import BookModel, InternetResourceModel, ArticlesCollectionModel
-from formatters.styles.base import BaseCitationStyle
-from logger import get_logger
-
+from formatters.styles.base import (
+    BaseBookStyle,
+    BaseCollectionArticleStyle,
+    BaseInternetResourceStyle,
+)
 
-logger = get_logger(__name__)
 
-
-class GOSTBook(BaseCitationStyle):
+class GOSTBook(BaseBookStyle):
     """
     Форматирование для книг.
     """
 
-    data: BookModel
+    edition_template = "{edition} изд. – "
+    format_authors = staticmethod(format_authors)
 
     @property
     def template(self) -> Template:
-        return Template(
+        return self.compile_template(
             "$authors $title. – $edition$city: $publishing_house, $year. – $pages с."
         )
 
-    def substitute(self) -> str:
-
-        logger.info('Форматирование книги "%s" ...', self.data.title)
-
-        return self.template.substitute(
-            authors=self.data.authors,
-            title=self.data.title,
-            edition=self.get_edition(),
-            city=self.data.city,
-            publishing_house=self.data.publishing_house,
-            year=self.data.year,
-            pages=self.data.pages,
-        )
-
-    def get_edition(self) -> str:
-        """
-        Получение отформатированной информации об издательстве.
 
-        :return: Информация об издательстве.
-        """
-
-        return f"{self.data.edition} изд. – " if self.data.edition else ""
-
-
-class GOSTInternetResource(BaseCitationStyle):
+class GOSTInternetResource(BaseInternetResourceStyle):
     """
     Форматирование для интернет-ресурсов.
     """
 
-    data: InternetResourceModel
-
     @property
     def template(self) -> Template:
-        return Template(
+        return self.compile_template(
             "$article // $website URL: $link (дата обращения: $access_date)."
         )
 
-    def substitute(self) -> str:
-
-        logger.info('Форматирование интернет-ресурса "%s" ...', self.data.article)
-
-        return self.template.substitute(
-            article=self.data.article,
-            website=self.data.website,
-            link=self.data.link,
-            access_date=self.data.access_date,
-        )
-
 
-class GOSTCollectionArticle(BaseCitationStyle):
+class GOSTCollectionArticle(BaseCollectionArticleStyle):
     """
     Форматирование для статьи из сборника.
     """
 
-    data: ArticlesCollectionModel
+    format_authors = staticmethod(format_authors)
 
     @property
     def template(self) -> Template:
-        return Template(
-            "$authors $article_title // $collection_title. – $city: $publishing_house, $year. – С. $pages."
+        return self.compile_template(
+            "$authors $article_title // $collection_title. – $city: $publishing_house, "
+            "$year. – С. $pages."
         )
 
-    def substitute(self) -> str:
 
-        logger.info('Форматирование сборника статей "%s" ...', self.data.article_title)
-
-        return self.template.substitute(
-            authors=self.data.authors,
-            article_title=self.data.article_title,
-            collection_title=self.data.collection_title,
-            city=self.data.city,
-            publishing_house=self.data.publishing_house,
-            year=self.data.year,
-            pages=self.data.pages,
-        )
-
-
-class GOSTCitationFormatter:
+class GOSTCitationFormatter(StyleCitationFormatter):
     """
-    Базовый класс для итогового форматирования списка источников.
+    Форматирование списка источников по ГОСТ Р 7.0.5-2008.
     """
 
     formatters_map = {
-        BookModel.__name__: GOSTBook,
-        InternetResourceModel.__name__: GOSTInternetResource,
-        ArticlesCollectionModel.__name__: GOSTCollectionArticle,
+        BookModel: GOSTBook,
+        InternetResourceModel: GOSTInternetResource,
+        ArticlesCollectionModel: GOSTCollectionArticle,
     }
-
-    def __init__(self, models: list[BaseModel]) -> None:
-        """
-        Конструктор.
-
-        :param models: Список объектов для форматирования
-        """
-
-        formatted_items = []
-        for model in models:
-            formatted_items.append(self.formatters_map.get(type(model).__name__)(model))  # type: ignore
-
-        self.formatted_items = formatted_items
-
-    def format(self) -> list[BaseCitationStyle]:
-        """
-        Форматирование списка источников.
-
-        :return:
-        """
-
-        return sorted(self.formatted_items, key=lambda item: item.formatted)
@@ -0,0 +1,66 @@
+"""
+Стиль цитирования MLA (Modern Language Association, 9-е издание).
+"""
+from string import Template
+
+from formatters.authors import format_authors_mla
+from formatters.base import StyleCitationFormatter
+from formatters.models import BookModel, InternetResourceModel, ArticlesCollectionModel
+from formatters.styles.base import (
+    BaseBookStyle,
+    BaseCollectionArticleStyle,
+    BaseInternetResourceStyle,
+)
+
+
+class MLABook(BaseBookStyle):
+    """
+    Форматирование для книг.
+    """
+
+    edition_template = "{edition} изд., "
+    format_authors = staticmethod(format_authors_mla)
+
+    @property
+    def template(self) -> Template:
+        return self.compile_template(
+            "$authors $title. $edition$publishing_house, $year."
+        )
+
+
+class MLAInternetResource(BaseInternetResourceStyle):
+    """
+    Форматирование для интернет-ресурсов.
+    """
+
+    @property
+    def template(self) -> Template:
+        return self.compile_template(
+            '"$article." $website, $link. Accessed $access_date.'
+        )
+
+
+class MLACollectionArticle(BaseCollectionArticleStyle):
+    """
+    Форматирование для статьи из сборника.
+    """
+
+    format_authors = staticmethod(format_authors_mla)
+
+    @property
+    def template(self) -> Template:
+        return self.compile_template(
+            '$authors "$article_title." $collection_title, $publishing_house, $year, pp. $pages.'
+        )
+
+
+class MLACitationFormatter(StyleCitationFormatter):
+    """
+    Форматирование списка источников в стиле MLA.
+    """
+
+    formatters_map = {
+        BookModel: MLABook,
+        InternetResourceModel: MLAInternetResource,
+        ArticlesCollectionModel: MLACollectionArticle,
+    }
@@ -0,0 +1,262 @@
+"""
+Замеры времени выполнения и потребления памяти этапов обработки.
+"""
+from __future__ import annotations
+
+import cProfile
+import json
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from itertools import islice
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional, TypeVar
+
+from logger import get_logger
+from settings import INSTRUMENTATION_BATCH_SIZE
+
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    # модуль недоступен в Windows
+    resource = None  # type: ignore
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+def get_max_rss_mb() -> Optional[float]:
+    """
+    Получение пикового объема резидентной памяти процесса.
+
+    :return: Объем памяти в мегабайтах или `None`, если он недоступен.
+    """
+
+    if resource is None:
+        return None
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # в macOS значение измеряется в байтах, в Linux – в килобайтах
+    divider = 1024**2 if sys.platform == "darwin" else 1024
+
+    return round(max_rss / divider, 3)
+
+
+class Instrumentation:
+    """
+    Замеры этапов обработки: время выполнения, количество строк, пиковое потребление памяти.
+
+    Этапы могут быть вложенными и чередоваться (например, чтение строк выполняется
+    по мере их форматирования): время и память учитываются за активным в данный момент
+    этапом, то есть время вложенного этапа не входит во время внешнего.
+
+    .. code-block::
+
+        instrumentation = Instrumentation()
+        with instrumentation:
+            with instrumentation.stage("format"):
+                formatted = format(instrumentation.track("read", reader.iter_read()))
+        instrumentation.save("output.profile.json")
+
+    Замеры останавливаются при выходе из блока `with`, в том числе при ошибке.
+    Выключенный объект замеров не выполняет никаких действий.
+    """
+
+    def __init__(
+        self, enabled: bool = True, memory: bool = True, cpu_profile: bool = False
+    ) -> None:
+        """
+        Конструктор.
+
+        :param enabled: Выполнение замеров.
+        :param memory: Замер пикового потребления памяти через `tracemalloc`
+            (замедляет обработку).
+        :param cpu_profile: Профилирование вызовов функций через `cProfile`.
+        """
+
+        self.enabled = enabled
+        self.memory = enabled and memory
+        self.profiler = cProfile.Profile() if enabled and cpu_profile else None
+        self.stages: dict[str, dict[str, Any]] = {}
+        self.active: list[str] = []
+        self.started_at = self.mark = self.finished_at = 0.0
+
+    def start(self) -> None:
+        """
+        Начало замеров.
+        """
+
+        if not self.enabled:
+            return
+
+        if self.memory:
+            tracemalloc.start()
+        if self.profiler:
+            self.profiler.enable()
+        self.started_at = self.mark = time.perf_counter()
+
+    def __enter__(self) -> Instrumentation:
+        self.start()
+
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def stop(self) -> None:
+        """
+        Окончание замеров.
+        """
+
+        if not self.enabled:
+            return
+
+        self.switch()
+        self.finished_at = time.perf_counter()
+        if self.profiler:
+            self.profiler.disable()
+        if self.memory:
+            tracemalloc.stop()
+
+    def switch(self) -> None:
+        """
+        Учет времени и памяти за активным этапом с момента последнего переключения этапов.
+        """
+
+        now = time.perf_counter()
+        if self.active:
+            stats = self.stages[self.active[-1]]
+            stats["seconds"] += now - self.mark
+            if self.memory:
+                peak = tracemalloc.get_traced_memory()[1] / 1024**2
+                stats["peak_memory_mb"] = max(stats["peak_memory_mb"], peak)
+
+        if self.memory:
+            tracemalloc.reset_peak()
+        self.mark = now
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """
+        Замер этапа обработки.
+
+        :param name: Наименование этапа.
+        """
+
+        if not self.enabled:
+            yield
+            return
+
+        self.stages.setdefault(
+            name, {"seconds": 0.0, "rows": 0, "peak_memory_mb": 0.0, "max_rss_mb": None}
+        )
+        self.switch()
+        self.active.append(name)
+        try:
+            yield
+        finally:
+            self.switch()
+            self.active.pop()
+            self.stages[name]["max_rss_mb"] = get_max_rss_mb()
+
+    def count(self, name: str, rows: int) -> None:
+        """
+        Учет количества строк, обработанных этапом.
+
+        :param name: Наименование этапа.
+        :param rows: Количество строк.
+        """
+
+        if self.enabled:
+            self.stages[name]["rows"] += rows
+
+    def track(
+        self,
+        name: str,
+        items: Iterable[T],
+        batch_size: int = INSTRUMENTATION_BATCH_SIZE,
+    ) -> Iterator[T]:
+        """
+        Замер этапа, выполняемого по мере получения элементов итератора.
+
+        Элементы получаются пакетами по `batch_size`: замер памяти (`tracemalloc`
+        и `getrusage`) выполняется один раз на пакет, а не на каждый элемент.
+
+        :param name: Наименование этапа.
+        :param items: Элементы, получение которых относится к этапу.
+        :param batch_size: Количество элементов, получаемых за один замер.
+        :return: Итератор тех же элементов.
+        """
+
+        if not self.enabled:
+            yield from items
+            return
+
+        iterator = iter(items)
+        while True:
+            with self.stage(name):
+                batch = list(islice(iterator, batch_size))
+                self.count(name, len(batch))
+
+            if not batch:
+                return
+            yield from batch
+
+    def report(self) -> dict[str, Any]:
+        """
+        Получение результатов замеров.
+
+        :return: Результаты замеров.
+        """
+
+        stages = {}
+        for name, stats in self.stages.items():
+            seconds = stats["seconds"]
+            stages[name] = {
+                "seconds": round(seconds, 6),
+                "rows": stats["rows"],
+                "rows_per_second": round(stats["rows"] / seconds) if seconds else None,
+                "peak_memory_mb": (
+                    round(stats["peak_memory_mb"], 3) if self.memory else None
+                ),
+                "max_rss_mb": stats["max_rss_mb"],
+            }
+
+        return {
+            "total_seconds": round(self.finished_at - self.started_at, 6),
+            "max_rss_mb": get_max_rss_mb(),
+            "stages": stages,
+        }
+
+    def save(self, path: Path | str) -> None:
+        """
+        Сохранение результатов замеров в JSON-файл и статистики профилирования
+        в одноименный файл с расширением `.prof` (при профилировании вызовов функций).
+
+        :param path: Путь к файлу результатов замеров.
+        """
+
+        if not self.enabled:
+            return
+
+        report = self.report()
+        for name, stats in report["stages"].items():
+            logger.info(
+                "Этап %s: %.3f с, строк: %s, пиковая память: %s МБ.",
+                name,
+                stats["seconds"],
+                stats["rows"],
+                stats["peak_memory_mb"],
+            )
+
+        Path(path).write_text(
+            json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8"
+        )
+        logger.info("Результаты замеров сохранены в %s.", path)
+
+        if self.profiler:
+            profile_path = Path(path).with_suffix(".prof")
+            self.profiler.dump_stats(profile_path)
+            logger.info("Статистика профилирования сохранена в %s.", profile_path)
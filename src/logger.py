@@ -1,9 +1,113 @@
 """
 Функции для логирования.
 """
+import atexit
 import logging
+import os
+import queue
+import time
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
+from multiprocessing.util import Finalize, register_after_fork
+from typing import Iterable, Iterator, TypeVar
 
-from settings import LOGGING_FORMAT, LOGGING_LEVEL, LOGGING_PATH
+from settings import (
+    LOGGING_BUFFER_SIZE,
+    LOGGING_FILE_NAME,
+    LOGGING_FORMAT,
+    LOGGING_LEVEL,
+    LOGGING_PATH,
+    LOGGING_PROGRESS_EVERY,
+)
+
+T = TypeVar("T")
+
+# общая очередь записей логов всех модулей
+LOG_QUEUE: queue.SimpleQueue = queue.SimpleQueue()
+# обработчики общей очереди по идентификаторам процессов
+# (поток обработчика не наследуется дочерним процессом при `fork`)
+LISTENERS: dict[int, QueueListener] = {}
+
+
+def setup_logging() -> QueueListener:
+    """
+    Настройка общих приемников логов (выполняется один раз на процесс).
+
+    Записи логов всех модулей поступают в общую очередь, а вывод в консоль и буферизованная
+    запись в общий файл выполняются в отдельном потоке, не задерживая основную обработку.
+
+    :return: Обработчик общей очереди логов.
+    """
+
+    pid = os.getpid()
+    if pid not in LISTENERS:
+        # записи уже отформатированы в обработчике очереди логгера
+        formatter = logging.Formatter("%(message)s")
+
+        # буферизованная запись логов в общий файл
+        # (файл открывается при первой записи, а не при импорте модулей)
+        file_handler = logging.FileHandler(
+            f"{LOGGING_PATH}/{LOGGING_FILE_NAME}", delay=True
+        )
+        file_handler.setFormatter(formatter)
+        buffered_handler = MemoryHandler(
+            LOGGING_BUFFER_SIZE, flushLevel=logging.ERROR, target=file_handler
+        )
+
+        # вывод логов в консоль
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(formatter)
+
+        listener = QueueListener(LOG_QUEUE, buffered_handler, stream_handler)
+        listener.start()
+        LISTENERS[pid] = listener
+        # записи, оставшиеся в очереди и буфере, сохраняются при завершении работы
+        # (процессы пула `multiprocessing` завершаются без вызова обработчиков `atexit`)
+        atexit.register(shutdown_logging)
+        Finalize(None, shutdown_logging, exitpriority=0)
+        # финализаторы родительского процесса удаляются в дочернем процессе `multiprocessing`
+        # после обработчиков `os.register_at_fork`, поэтому остановка регистрируется заново
+        register_after_fork(listener, finalize_logging)
+
+    return LISTENERS[pid]
+
+
+def shutdown_logging() -> None:
+    """
+    Остановка общих приемников логов процесса с сохранением оставшихся записей.
+    """
+
+    if (listener := LISTENERS.pop(os.getpid(), None)) is not None:
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+
+def finalize_logging(_: QueueListener) -> None:
+    """
+    Регистрация остановки приемников логов при завершении дочернего процесса `multiprocessing`
+    (вызывается после очистки финализаторов родительского процесса).
+
+    :param _: Обработчик общей очереди логов родительского процесса.
+    """
+
+    Finalize(None, shutdown_logging, exitpriority=0)
+
+
+def restart_logging() -> None:
+    """
+    Запуск приемников логов в дочернем процессе после `fork`.
+
+    Записи родительского процесса, скопированные в очередь дочернего процесса,
+    отбрасываются (их выводит обработчик родительского процесса).
+    """
+
+    LISTENERS.clear()
+    while not LOG_QUEUE.empty():
+        LOG_QUEUE.get_nowait()
+    setup_logging()
+
+
+os.register_at_fork(after_in_child=restart_logging)
 
 
 def get_logger(
@@ -14,22 +118,116 @@ def get_logger(
     """
     Настройка логгера.
 
+    Повторный вызов для того же модуля не добавляет новых обработчиков.
+
     :param module_name: Наименование модуля
     :param logging_level: Уровень логирования
     :param logging_format: Формат логов
     :return:
     """
 
-    # запись логов в файлы
+    setup_logging()
+
     logger = logging.getLogger(module_name)
     logger.setLevel(logging_level)
-    file_handler = logging.FileHandler(f"{LOGGING_PATH}/{module_name}.log")
-    file_handler.setFormatter(logging.Formatter(logging_format))
-    logger.addHandler(file_handler)
 
-    # вывод логов в консоль
-    stream_handler = logging.StreamHandler()
-    stream_handler.setFormatter(logging.Formatter(logging_format))
-    logger.addHandler(stream_handler)
+    # запись логов в общую очередь
+    queue_handler = next(
+        (
+            handler
+            for handler in logger.handlers
+            if isinstance(handler, QueueHandler) and handler.queue is LOG_QUEUE
+        ),
+        None,
+    )
+    if queue_handler is None:
+        queue_handler = QueueHandler(LOG_QUEUE)
+        logger.addHandler(queue_handler)
+    queue_handler.setFormatter(logging.Formatter(logging_format))
 
     return logger
+
+
+class ProgressLogger:
+    """
+    Периодическое логирование прогресса обработки элементов.
+
+    Вместо записи на каждый элемент логируется количество обработанных элементов
+    и скорость обработки раз в заданное количество элементов.
+    """
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        message: str,
+        every: int = LOGGING_PROGRESS_EVERY,
+    ) -> None:
+        """
+        Конструктор.
+
+        :param logger: Логгер
+        :param message: Описание обработки (например, "Форматирование")
+        :param every: Количество элементов между записями о прогрессе
+        """
+
+        self.logger = logger
+        self.message = message
+        self.every = every
+        self.count = 0
+        self.started = time.perf_counter()
+        self.next_report = every
+
+    @property
+    def rate(self) -> float:
+        """
+        Получение скорости обработки.
+
+        :return: Количество элементов в секунду.
+        """
+
+        elapsed = time.perf_counter() - self.started
+
+        return self.count / elapsed if elapsed else 0.0
+
+    def step(self, count: int = 1) -> None:
+        """
+        Учет обработанных элементов.
+
+        :param count: Количество обработанных элементов
+        """
+
+        self.count += count
+        if self.count >= self.next_report:
+            self.logger.info(
+                "%s: обработано %s (%.0f в секунду) ...",
+                self.message,
+                self.count,
+                self.rate,
+            )
+            self.next_report = (self.count // self.every + 1) * self.every
+
+    def finish(self) -> None:
+        """
+        Логирование итогов обработки.
+        """
+
+        self.logger.info(
+            "%s: всего обработано %s (%.0f в секунду).",
+            self.message,
+            self.count,
+            self.rate,
+        )
+
+    def track(self, items: Iterable[T]) -> Iterator[T]:
+        """
+        Учет прогресса при обходе элементов.
+
+        :param items: Обрабатываемые элементы
+        :return: Итератор тех же элементов
+        """
+
+        for item in items:
+            yield item
+            self.step()
+
+        self.finish()
@@ -2,14 +2,14 @@
 Запуск приложения.
 """
 from enum import Enum, unique
+from itertools import count
+from pathlib import Path
+from typing import Sequence, Union
 
 import click
 
-from formatters.styles.gost import GOSTCitationFormatter
 from logger import get_logger
-from readers.reader import SourcesReader
-from renderer import Renderer
-from settings import INPUT_FILE_PATH, OUTPUT_FILE_PATH
+from settings import INPUT_FILE_PATH, OUTPUT_FILE_PATH, READER_WORKERS
 
 logger = get_logger(__name__)
 
@@ -25,15 +25,181 @@ class CitationEnum(Enum):
     APA = "apa"  # American Psychological Association
 
 
+def get_profile_path(path_output: str) -> Path:
+    """
+    Получение пути к файлу результатов замеров рядом с выходным файлом.
+
+    :param str path_output: Путь к выходному файлу
+    :return: Путь к файлу результатов замеров
+    """
+
+    return Path(path_output).with_suffix(".profile.json")
+
+
+def get_output_paths(path_output: str, citations: Sequence[str]) -> list[str]:
+    """
+    Получение путей к выходным файлам стилей цитирования.
+
+    Для единственного стиля используется заданный путь, для нескольких –
+    к имени файла добавляется наименование стиля (например, `output_mla.docx`).
+
+    :param str path_output: Путь к выходному файлу
+    :param Sequence[str] citations: Стили цитирования
+    :return: Пути к выходным файлам в порядке стилей
+    """
+
+    if len(citations) == 1:
+        return [path_output]
+
+    path = Path(path_output)
+
+    return [
+        str(path.with_name(f"{path.stem}_{citation.lower()}{path.suffix}"))
+        for citation in citations
+    ]
+
+
+def generate(  # pylint: disable=too-many-arguments,too-many-locals
+    path_input: str,
+    path_output: Union[str, Sequence[str]],
+    streaming: bool = False,
+    read_workers: int = READER_WORKERS,
+    trusted: bool = False,
+    stream_render: bool = False,
+    cache: bool = False,
+    profile: bool = False,
+    cpu_profile: bool = False,
+    citations: Sequence[str] = (CitationEnum.GOST.name,),
+    dedup: bool = False,
+    native: bool = False,
+) -> None:
+    """
+    Генерация выходного файла с оформленным библиографическим списком по входному файлу.
+
+    :param str path_input: Путь к входному файлу
+    :param Union[str, Sequence[str]] path_output: Путь к выходному файлу (или несколько путей,
+        формат файла определяется расширением: .docx, .html, .md, .txt, .json)
+    :param bool streaming: Потоковое чтение входного файла
+    :param int read_workers: Количество процессов для параллельного чтения листов входного файла
+    :param bool trusted: Пакетная проверка столбцов вместо валидации каждой строки
+    :param bool stream_render: Потоковая генерация выходного файла Word
+    :param bool cache: Использование постоянного кэша отформатированных строк
+    :param bool profile: Замеры времени и памяти этапов обработки с сохранением результатов
+        в JSON-файл рядом с выходным файлом
+    :param bool cpu_profile: Профилирование вызовов функций (при замерах этапов)
+    :param Sequence[str] citations: Стили цитирования (входной файл читается один раз
+        для всех стилей)
+    :param bool dedup: Объединение повторяющихся источников перед форматированием
+    :param bool native: Быстрое чтение рабочей книги Excel без `openpyxl`
+        (только значения ячеек)
+    """
+
+    # зависимости этапов обработки загружаются только при запуске обработки,
+    # чтобы не замедлять запуск консольной команды (например, `--help`)
+    # pylint: disable=import-outside-toplevel
+    from cache import CachedCitationFormatter, FormattedCache
+    from dedup import Deduplicator
+    from formatters.collation import sort_columns, sort_key
+    from formatters.registry import STYLES, get_formatter, iter_format_styles
+    from instrumentation import Instrumentation
+    from readers.reader import SourcesReader
+    from renderer import check_paths, get_renderer, render_all
+
+    outputs = [path_output] if isinstance(path_output, str) else list(path_output)
+    # пути к выходным файлам по стилям цитирования
+    output_paths = list(
+        zip(*(get_output_paths(output, citations) for output in outputs))
+    )
+    # неподдерживаемый формат и совпадение выходных файлов обнаруживаются
+    # до чтения входного файла
+    for path in outputs:
+        get_renderer(path)
+    check_paths([path for paths in output_paths for path in paths])
+
+    instrumentation = Instrumentation(enabled=profile, cpu_profile=cpu_profile)
+    try:
+        # замеры останавливаются и при ошибке обработки
+        with instrumentation:
+            deduplicator = Deduplicator() if dedup else None
+
+            reader = SourcesReader(
+                path_input,
+                streaming=streaming,
+                workers=read_workers,
+                trusted=trusted,
+                native=native,
+            )
+            formatted_cache = None
+            try:
+                # этапы обработки связаны итераторами: строки читаются, форматируются
+                # и передаются на сортировку по одной, полный проход выполняет только сортировка
+                if cache:
+                    # версия кэша учитывает все стили, чтобы смена стиля не очищала кэш
+                    formatted_cache = FormattedCache(
+                        CachedCitationFormatter.get_version(*STYLES.values())
+                    )
+                    # чтение строк выполняется по мере обращения к кэшу
+                    rows = instrumentation.track(
+                        "read_format_cached",
+                        CachedCitationFormatter(
+                            reader,
+                            formatted_cache,
+                            [get_formatter(citation) for citation in citations],
+                            deduplicator,
+                        ).iter_formatted(),
+                    )
+                else:
+                    models = instrumentation.track("read", reader.iter_read())
+                    if deduplicator:
+                        models = instrumentation.track(
+                            "dedup", deduplicator.filter(models)
+                        )
+                    rows = instrumentation.track(
+                        "format", iter_format_styles(models, citations)
+                    )
+
+                with instrumentation.stage("sort"):
+                    # счетчик продвигается только для полученных строк,
+                    # поэтому после сортировки его значение равно количеству строк
+                    sorted_rows = count()
+                    # при превышении объема памяти отсортированные части сохраняются на диск
+                    formatted_styles = sort_columns(
+                        (row for row, _ in zip(rows, sorted_rows)),
+                        len(citations),
+                        key=sort_key,
+                    )
+                    instrumentation.count("sort", next(sorted_rows))
+            finally:
+                if formatted_cache:
+                    formatted_cache.close()
+                reader.close()
+
+            for paths, formatted_models in zip(output_paths, formatted_styles):
+                logger.info("Генерация выходных файлов %s ...", ", ".join(paths))
+                with instrumentation.stage("render"):
+                    # все форматы стиля записываются за один проход по строкам,
+                    # слияние отсортированных частей выполняется по мере записи
+                    rendered = render_all(
+                        instrumentation.track("merge", formatted_models),
+                        paths,
+                        stream_render=stream_render,
+                    )
+                    instrumentation.count("render", rendered)
+    finally:
+        # результаты замеров сохраняются и для прерванной обработки
+        instrumentation.save(get_profile_path(outputs[0]))
+
+
 @click.command()
 @click.option(
     "--citation",
     "-c",
-    "citation",
+    "citations",
     type=click.Choice([item.name for item in CitationEnum], case_sensitive=False),
-    default=CitationEnum.GOST.name,
+    default=[CitationEnum.GOST.name],
+    multiple=True,
     show_default=True,
-    help="Стиль цитирования",
+    help="Стиль цитирования (можно указать несколько, тогда к имени выходного файла добавляется наименование стиля)",
 )
 @click.option(
     "--path_input",
@@ -47,43 +213,162 @@ class CitationEnum(Enum):
 @click.option(
     "--path_output",
     "-po",
-    "path_output",
+    "paths_output",
     type=str,
-    default=OUTPUT_FILE_PATH,
+    default=[OUTPUT_FILE_PATH],
+    multiple=True,
+    show_default=True,
+    help=(
+        "Путь к выходному файлу (можно указать несколько; "
+        "формат определяется расширением: .docx, .html, .md, .txt, .json)"
+    ),
+)
+@click.option(
+    "--streaming",
+    "-s",
+    "streaming",
+    is_flag=True,
+    default=False,
+    help="Потоковое чтение входного файла",
+)
+@click.option(
+    "--native",
+    "-n",
+    "native",
+    is_flag=True,
+    default=False,
+    help="Быстрое чтение рабочей книги Excel без openpyxl (XML листов разбирается потоком)",
+)
+@click.option(
+    "--read_workers",
+    "-rw",
+    "read_workers",
+    type=click.IntRange(min=1),
+    default=READER_WORKERS,
     show_default=True,
-    help="Путь к выходному файлу",
+    help="Количество процессов для параллельного чтения листов входного файла",
+)
+@click.option(
+    "--trusted",
+    "-t",
+    "trusted",
+    is_flag=True,
+    default=False,
+    help="Пакетная проверка столбцов вместо валидации каждой строки (для доверенных входных файлов)",
 )
-def process_input(
-    citation: str = CitationEnum.GOST.name,
+@click.option(
+    "--stream_render",
+    "-sr",
+    "stream_render",
+    is_flag=True,
+    default=False,
+    help="Потоковая генерация выходного файла",
+)
+@click.option(
+    "--cache",
+    "-ca",
+    "cache",
+    is_flag=True,
+    default=False,
+    help="Использование постоянного кэша отформатированных строк",
+)
+@click.option(
+    "--profile",
+    "-p",
+    "profile",
+    is_flag=True,
+    default=False,
+    help="Замеры времени и памяти этапов обработки (результаты сохраняются в JSON-файл рядом с выходным файлом)",
+)
+@click.option(
+    "--cpu_profile",
+    "-cp",
+    "cpu_profile",
+    is_flag=True,
+    default=False,
+    help="Профилирование вызовов функций через cProfile при замерах (статистика сохраняется в файл .prof)",
+)
+@click.option(
+    "--dedup",
+    "-d",
+    "dedup",
+    is_flag=True,
+    default=False,
+    help="Объединение повторяющихся источников (по авторам, названию и году, для интернет-ресурсов – по ссылке)",
+)
+def process_input(  # pylint: disable=too-many-arguments
+    citations: Sequence[str] = (CitationEnum.GOST.name,),
     path_input: str = INPUT_FILE_PATH,
-    path_output: str = OUTPUT_FILE_PATH,
+    paths_output: Sequence[str] = (OUTPUT_FILE_PATH,),
+    streaming: bool = False,
+    native: bool = False,
+    read_workers: int = READER_WORKERS,
+    trusted: bool = False,
+    stream_render: bool = False,
+    cache: bool = False,
+    profile: bool = False,
+    cpu_profile: bool = False,
+    dedup: bool = False,
 ) -> None:
     """
     Генерация файла Word с оформленным библиографическим списком.
 
-    :param str citation: Стиль цитирования
+    :param Sequence[str] citations: Стили цитирования
     :param str path_input: Путь к входному файлу
-    :param str path_output: Путь к выходному файлу
+    :param Sequence[str] paths_output: Пути к выходным файлам
+    :param bool streaming: Потоковое чтение входного файла
+    :param bool native: Быстрое чтение рабочей книги Excel без openpyxl
+    :param int read_workers: Количество процессов для параллельного чтения листов входного файла
+    :param bool trusted: Пакетная проверка столбцов вместо валидации каждой строки
+    :param bool stream_render: Потоковая генерация выходного файла Word
+    :param bool cache: Использование постоянного кэша отформатированных строк
+    :param bool profile: Замеры времени и памяти этапов обработки
+    :param bool cpu_profile: Профилирование вызовов функций
+    :param bool dedup: Объединение повторяющихся источников
     """
 
     logger.info(
         """Обработка команды с параметрами:
         - Стиль цитирования: %s.
         - Путь к входному файлу: %s.
-        - Путь к выходному файлу: %s.""",
-        citation,
+        - Путь к выходному файлу: %s.
+        - Потоковое чтение: %s.
+        - Быстрое чтение Excel: %s.
+        - Процессов для чтения: %s.
+        - Доверенные данные: %s.
+        - Потоковая генерация: %s.
+        - Кэш: %s.
+        - Замеры этапов: %s.
+        - Объединение дубликатов: %s.""",
+        ", ".join(citations),
         path_input,
-        path_output,
+        ", ".join(paths_output),
+        streaming,
+        native,
+        read_workers,
+        trusted,
+        stream_render,
+        cache,
+        profile,
+        dedup,
     )
 
-    models = SourcesReader(path_input).read()
-    formatted_models = tuple(
-        str(item) for item in GOSTCitationFormatter(models).format()
+    generate(
+        path_input,
+        paths_output,
+        streaming=streaming,
+        read_workers=read_workers,
+        trusted=trusted,
+        stream_render=stream_render,
+        cache=cache,
+        profile=profile or cpu_profile,
+        cpu_profile=cpu_profile,
+        # повторно указанные стили не дублируются
+        citations=list(dict.fromkeys(citation.upper() for citation in citations)),
+        dedup=dedup,
+        native=native,
     )
 
-    logger.info("Генерация выходного файла ...")
-    Renderer(formatted_models).render(path_output)
-
     logger.info("Команда успешно завершена.")
 
 
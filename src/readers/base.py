@@ -2,31 +2,180 @@
 Функции чтения исходного файла.
 """
 
+import operator
+import sys
 from abc import ABC, abstractmethod
 from datetime import date
-from typing import Type
+from functools import cached_property
+from itertools import islice
+from typing import Any, Callable, ClassVar, Iterable, Iterator, Optional, Sequence, Type
 
 from openpyxl.workbook import Workbook
 from pydantic import BaseModel
+from pydantic.fields import ModelField
 
 from logger import get_logger
+from settings import READER_BATCH_SIZE
 
 logger = get_logger(__name__)
 
 
+def convert_int(value: Any) -> int:
+    """
+    Преобразование значения ячейки в целое число.
+
+    :param value: Значение ячейки.
+    :return: Целое число.
+    """
+
+    return int(str(value))
+
+
+def convert_str(value: Any) -> str:
+    """
+    Преобразование значения ячейки в строку без пробелов по краям.
+
+    :param value: Значение ячейки.
+    :return: Строка.
+    """
+
+    return str(value).strip()
+
+
+def convert_interned(value: Any) -> str:
+    """
+    Преобразование значения ячейки в строку из таблицы интернированных строк.
+
+    Одинаковые значения (например, города и издательства) хранятся одним объектом
+    строки на все строки листа, а хэш строки вычисляется один раз.
+
+    :param value: Значение ячейки.
+    :return: Строка.
+    """
+
+    return sys.intern(convert_str(value))
+
+
+def convert_date(value: Any) -> Any:
+    """
+    Преобразование значения ячейки с датой в строку формата `ДД.ММ.ГГГГ`.
+
+    :param value: Значение ячейки.
+    :return: Строка с датой (или исходное значение, если это не дата).
+    """
+
+    if isinstance(value, date):
+        return value.strftime("%d.%m.%Y")
+
+    return value
+
+
+def convert_any(value: Any) -> Any:
+    """
+    Получение значения ячейки без преобразования.
+
+    :param value: Значение ячейки.
+    :return: Исходное значение.
+    """
+
+    return value
+
+
+def get_column_check(field: ModelField) -> Callable[[list], set[int]]:
+    """
+    Получение функции проверки столбца значений поля модели без их преобразования.
+
+    Проверяются типы значений и числовые ограничения поля (`gt`, `ge`, `lt`, `le`).
+    Столбец сначала проверяется целиком (типы – через множество, ограничения – через минимум
+    и максимум), и только при нарушении значения проверяются по отдельности.
+
+    :param field: Поле модели.
+    :return: Функция, возвращающая индексы значений столбца, не прошедших проверку.
+    """
+
+    info = field.field_info
+    # ограниченные типы (например, `conint` для `Field(..., gt=0)`) проверяются по базовому типу
+    data_type = next(
+        (
+            base
+            for base in (bool, int, float, str)
+            if isinstance(field.type_, type) and issubclass(field.type_, base)
+        ),
+        field.type_,
+    )
+    allowed = {data_type, type(None)} if field.allow_none else {data_type}
+    bounds = [
+        (bound, compare, reduce)
+        for bound, compare, reduce in (
+            (info.gt, operator.gt, min),
+            (info.ge, operator.ge, min),
+            (info.lt, operator.lt, max),
+            (info.le, operator.le, max),
+        )
+        if bound is not None
+    ]
+
+    def is_valid(value: Any) -> bool:
+        if value is None:
+            return field.allow_none
+
+        # точное совпадение типа: `bool` (подкласс `int`) не принимается за `int`
+        # pylint: disable-next=unidiomatic-typecheck
+        return type(value) is data_type and all(
+            compare(value, bound) for bound, compare, _ in bounds
+        )
+
+    def check(column: list) -> set[int]:
+        if set(map(type, column)) <= allowed:
+            values = [value for value in column if value is not None]
+            if not values or all(
+                compare(reduce(values), bound) for bound, compare, reduce in bounds
+            ):
+                return set()
+
+        return {i for i, value in enumerate(column) if not is_valid(value)}
+
+    return check
+
+
+# функции преобразования значений ячеек по типу данных атрибута
+CONVERTERS: dict[type, Callable[[Any], Any]] = {
+    int: convert_int,
+    str: convert_str,
+    date: convert_date,
+}
+
+
 class BaseReader(ABC):
     """
     Базовый класс читателя исходного файла.
     """
 
-    def __init__(self, workbook: Workbook) -> None:
+    # наименование листа рабочей книги
+    sheet: ClassVar[str]
+
+    def __init__(
+        self,
+        workbook: Workbook,
+        min_row: int = 2,
+        max_row: Optional[int] = None,
+        trusted: bool = False,
+    ) -> None:
         """
         Конструктор.
 
         :param workbook: Рабочая книга Excel.
+        :param min_row: Номер первой читаемой строки листа
+            (по умолчанию вторая, так как первая строка содержит заголовок).
+        :param max_row: Номер последней читаемой строки листа (по умолчанию до конца листа).
+        :param trusted: Режим доверенных данных (столбцы проверяются пакетно,
+            модели создаются без повторной валидации каждого поля).
         """
 
         self.workbook = workbook
+        self.min_row = min_row
+        self.max_row = max_row
+        self.trusted = trusted
 
     @property
     @abstractmethod
@@ -37,15 +186,6 @@ class BaseReader(ABC):
         :return: Модель объекта (строки).
         """
 
-    @property
-    @abstractmethod
-    def sheet(self) -> str:
-        """
-        Получение наименования листа рабочей книги.
-
-        :return: Наименование листа рабочей книги.
-        """
-
     @property
     @abstractmethod
     def attributes(self) -> dict:
@@ -67,40 +207,190 @@ class BaseReader(ABC):
         :return: Атрибуты с информацией об индексе столбца и типе данных
         """
 
-    def read(self) -> list[BaseModel]:
+    @property
+    def interned(self) -> tuple[str, ...]:
         """
-        Чтение исходного файла.
+        Получение наименований строковых атрибутов с часто повторяющимися значениями,
+        которые интернируются при чтении (см. :func:`convert_interned`).
 
-        :return: Список моделей строк в виде DTO (Data Transfer Objects).
+        :return: Наименования атрибутов.
         """
 
-        models = []
-        # чтение со второй строки таблицы (первая строка содержит заголовок)
-        for row in self.workbook[self.sheet].iter_rows(min_row=2):
+        return ()
+
+    @cached_property
+    def plan(self) -> tuple[tuple[str, int, Callable[[Any], Any]], ...]:
+        """
+        Получение плана извлечения столбцов.
+
+        План компилируется из метода `attributes()` один раз на читателя
+        и содержит для каждого атрибута индекс столбца и функцию преобразования значения
+        (для атрибутов из `interned` – с интернированием строк).
+
+        .. code-block::
+
+            (
+                ("authors", 0, convert_str),
+                ("title", 1, convert_str),
+                ...
+                ("year", 5, convert_int),
+            )
+
+        :return: План извлечения столбцов.
+        """
+
+        plan = []
+        for attr, params in self.attributes.items():
+            ((index, data_type),) = params.items()
+            convert: Callable[[Any], Any]
+            if data_type is str and attr in self.interned:
+                convert = convert_interned
+            else:
+                convert = CONVERTERS.get(data_type, convert_any)
+            plan.append((attr, index, convert))
+
+        return tuple(plan)
+
+    @cached_property
+    def columns(self) -> tuple[str, ...]:
+        """
+        Получение наименований атрибутов в порядке столбцов листа.
+
+        :return: Наименования атрибутов.
+        """
+
+        return tuple(
+            attr for attr, _, _ in sorted(self.plan, key=operator.itemgetter(1))
+        )
+
+    def parse(self, row: Sequence) -> dict[str, Any]:
+        """
+        Преобразование значений строки в атрибуты модели по плану извлечения столбцов.
+
+        :param row: Значения ячеек строки.
+        :return: Атрибуты модели.
+        """
+
+        # пустые значения сохраняются как есть
+        return {
+            attr: convert(row[index]) if row[index] else row[index]
+            for attr, index, convert in self.plan
+        }
+
+    def build(self, row: Sequence) -> BaseModel:
+        """
+        Создание модели из значений строки.
+
+        :param row: Значения ячеек строки.
+        :return: Модель строки в виде DTO (Data Transfer Object).
+        """
+
+        return self.model(**self.parse(row))
+
+    @cached_property
+    def checks(self) -> tuple[tuple[str, Callable[[list], set[int]]], ...]:
+        """
+        Получение проверок столбцов по схеме модели.
+
+        :return: Наименования полей модели и функции проверки их значений.
+        """
+
+        return tuple(
+            (name, get_column_check(field))
+            for name, field in self.model.__fields__.items()
+        )
+
+    def construct_batch(self, batch: list[dict[str, Any]]) -> Iterator[BaseModel]:
+        """
+        Создание моделей из пакета строк с проверкой значений по столбцам.
+
+        Строки, прошедшие проверку всех столбцов, создаются без валидации полей,
+        остальные – с полной валидацией (с исключением :class:`pydantic.ValidationError` при ошибке).
+
+        :param batch: Пакет атрибутов моделей.
+        :return: Итератор моделей строк в виде DTO (Data Transfer Objects).
+        """
+
+        invalid: set[int] = set()
+        for name, check in self.checks:
+            invalid |= check([attrs.get(name) for attrs in batch])
+
+        construct = self.model.construct
+        for i, attrs in enumerate(batch):
+            yield self.model(**attrs) if i in invalid else construct(**attrs)
+
+    def iter_rows(self) -> Iterator[tuple]:
+        """
+        Получение значений строк листа рабочей книги.
+
+        :return: Итератор кортежей значений ячеек в заданном диапазоне строк.
+        """
+
+        return self.workbook[self.sheet].iter_rows(
+            min_row=self.min_row, max_row=self.max_row, values_only=True
+        )
+
+    def iter_parsed(self) -> Iterator[dict[str, Any]]:
+        """
+        Потоковое чтение атрибутов моделей без создания моделей.
+
+        :return: Итератор атрибутов моделей строк.
+        """
+
+        parse = self.parse
+        # обработка строки идет только, если заполнены обязательные столбцы
+        return (parse(row) for row in self.iter_rows() if row[0])
+
+    def iter_read(self) -> Iterator[BaseModel]:
+        """
+        Потоковое чтение исходного файла.
+
+        Модели строк создаются по мере обхода листа и не накапливаются в памяти.
+
+        :return: Итератор моделей строк в виде DTO (Data Transfer Objects).
+        """
+
+        return self.iter_build(self.iter_rows())
+
+    def iter_build(self, rows: Iterable[Sequence]) -> Iterator[BaseModel]:
+        """
+        Создание моделей из значений строк листа.
+
+        :param rows: Значения ячеек строк.
+        :return: Итератор моделей строк в виде DTO (Data Transfer Objects).
+        """
+
+        if self.trusted:
+            yield from self.iter_build_trusted(rows)
+            return
+
+        build = self.build
+        for row in rows:
             # обработка строки идет только, если заполнены обязательные столбцы
-            if row[0].value:
-                attrs = {}
+            if row[0]:
+                yield build(row)
 
-                # обработка заданных в методе `attributes()` атрибутов
-                for attr, params in self.attributes.items():
-                    index, data_type = list(params.items())[0]
-                    attrs[attr] = row[index].value
+    def iter_build_trusted(self, rows: Iterable[Sequence]) -> Iterator[BaseModel]:
+        """
+        Создание моделей из значений строк листа в режиме доверенных данных.
 
-                    if not attrs[attr]:
-                        continue
+        Строки обрабатываются пакетами по `READER_BATCH_SIZE`.
 
-                    if data_type is int:
-                        attrs[attr] = int(str(attrs.get(attr)))
+        :param rows: Значения ячеек строк.
+        :return: Итератор моделей строк в виде DTO (Data Transfer Objects).
+        """
 
-                    if data_type is str:
-                        attrs[attr] = str(attrs.get(attr)).strip()
+        parse = self.parse
+        # обработка строки идет только, если заполнены обязательные столбцы
+        parsed = (parse(row) for row in rows if row[0])
+        while batch := list(islice(parsed, READER_BATCH_SIZE)):
+            yield from self.construct_batch(batch)
 
-                    if data_type is date:
-                        value = attrs.get(attr)
-                        if isinstance(value, date):
-                            attrs[attr] = value.strftime("%d.%m.%Y")
+    def read(self) -> list[BaseModel]:
+        """
+        Чтение исходного файла.
 
-                # добавление считанной и обработанной строки в список моделей
-                models.append(self.model(**attrs))
+        :return: Список моделей строк в виде DTO (Data Transfer Objects).
+        """
 
-        return models
+        return list(self.iter_read())
@@ -1,33 +1,52 @@
 """
 Чтение исходного файла.
 """
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from datetime import date
-from typing import Type
+from functools import cached_property
+from pathlib import Path
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Type,
+    TypeVar,
+    Union,
+)
 
 import openpyxl
 from openpyxl.workbook import Workbook
+from pydantic import BaseModel
 
 from formatters.models import BookModel, InternetResourceModel, ArticlesCollectionModel
-from logger import get_logger
+from logger import ProgressLogger, get_logger
 from readers.base import BaseReader
+from readers.text import get_text_workbook_class
+from readers.xlsx import XLSXWorkbook
+from settings import READER_CHUNK_SIZE, READER_WORKERS
 
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
 
 class BookReader(BaseReader):
     """
     Чтение модели книги.
     """
 
+    sheet = "Книга"
+
     @property
     def model(self) -> Type[BookModel]:
         return BookModel
 
-    @property
-    def sheet(self) -> str:
-        return "Книга"
-
     @property
     def attributes(self) -> dict:
         return {
@@ -40,20 +59,22 @@ class BookReader(BaseReader):
             "pages": {6: int},
         }
 
+    @property
+    def interned(self) -> tuple[str, ...]:
+        return ("edition", "city", "publishing_house")
+
 
 class InternetResourceReader(BaseReader):
     """
     Чтение модели интернет-ресурса.
     """
 
+    sheet = "Интернет-ресурс"
+
     @property
     def model(self) -> Type[InternetResourceModel]:
         return InternetResourceModel
 
-    @property
-    def sheet(self) -> str:
-        return "Интернет-ресурс"
-
     @property
     def attributes(self) -> dict:
         return {
@@ -63,20 +84,22 @@ class InternetResourceReader(BaseReader):
             "access_date": {3: date},
         }
 
+    @property
+    def interned(self) -> tuple[str, ...]:
+        return ("website",)
+
 
 class ArticlesCollectionReader(BaseReader):
     """
     Чтение модели сборника статей.
     """
 
+    sheet = "Статья из сборника"
+
     @property
     def model(self) -> Type[ArticlesCollectionModel]:
         return ArticlesCollectionModel
 
-    @property
-    def sheet(self) -> str:
-        return "Статья из сборника"
-
     @property
     def attributes(self) -> dict:
         return {
@@ -89,28 +112,319 @@ class ArticlesCollectionReader(BaseReader):
             "pages": {6: str},
         }
 
+    @property
+    def interned(self) -> tuple[str, ...]:
+        return ("collection_title", "city", "publishing_house")
+
+
+def open_workbook(
+    path: Union[str, BinaryIO],
+    readers: Sequence[Type[BaseReader]],
+    read_only: bool = False,
+    native: bool = False,
+) -> Workbook:
+    """
+    Открытие источника данных по расширению файла.
+
+    Текстовые файлы (CSV, JSON Lines) открываются как рабочая книга,
+    листы которой соответствуют типам строк и читаются потоком.
+
+    :param path: Путь к исходному файлу (или файловый объект рабочей книги Excel).
+    :param readers: Классы читателей листов.
+    :param read_only: Открытие рабочей книги Excel только для чтения.
+    :param native: Чтение рабочей книги Excel без `openpyxl` (см. :mod:`readers.xlsx`).
+    :return: Рабочая книга.
+    """
+
+    if text_workbook_class := get_text_workbook_class(path):
+        columns = {}
+        for reader_class in readers:
+            reader = reader_class(None)
+            # тип строки задается наименованием листа или модели
+            columns[reader.sheet] = columns[reader.model.__name__] = reader.columns
+
+        return text_workbook_class(str(path), columns)
+
+    if native:
+        return XLSXWorkbook(path)
+
+    return openpyxl.load_workbook(path, read_only=read_only)
+
+
+class SheetChunk(NamedTuple):
+    """
+    Диапазон строк листа, читаемый одним процессом при параллельном чтении.
+    """
+
+    # класс читателя листа
+    reader: Type[BaseReader]
+    # номер первой читаемой строки листа
+    min_row: int
+    # номер последней читаемой строки листа (`None` – до конца листа)
+    max_row: Optional[int]
+
+
+def read_chunk(
+    path: str, chunk: SheetChunk, trusted: bool = False, native: bool = False
+) -> list[BaseModel]:
+    """
+    Чтение и валидация диапазона строк листа в отдельном процессе.
+
+    Рабочая книга открывается в процессе только для чтения (или без `openpyxl`),
+    поэтому разбор листа выполняется параллельно с другими листами и диапазонами.
+
+    :param path: Путь к рабочей книге Excel.
+    :param chunk: Диапазон строк листа.
+    :param trusted: Режим доверенных данных.
+    :param native: Чтение рабочей книги без `openpyxl` (см. :mod:`readers.xlsx`).
+    :return: Список прочитанных моделей (строк).
+    """
+
+    workbook = open_workbook(path, [chunk.reader], read_only=True, native=native)
+    try:
+        return chunk.reader(
+            workbook, min_row=chunk.min_row, max_row=chunk.max_row, trusted=trusted
+        ).read()
+    finally:
+        workbook.close()
+
+
+def parse_chunk(
+    path: str, chunk: SheetChunk, native: bool = False
+) -> list[dict[str, Any]]:
+    """
+    Чтение атрибутов моделей диапазона строк листа в отдельном процессе (без создания моделей).
+
+    :param path: Путь к рабочей книге Excel.
+    :param chunk: Диапазон строк листа.
+    :param native: Чтение рабочей книги без `openpyxl` (см. :mod:`readers.xlsx`).
+    :return: Список атрибутов моделей строк.
+    """
+
+    workbook = open_workbook(path, [chunk.reader], read_only=True, native=native)
+    try:
+        return list(
+            chunk.reader(
+                workbook, min_row=chunk.min_row, max_row=chunk.max_row
+            ).iter_parsed()
+        )
+    finally:
+        workbook.close()
+
 
 class SourcesReader:
     """
     Чтение из источника данных.
+
+    Источником данных может быть рабочая книга Excel (`.xlsx`)
+    или текстовый файл (`.csv`, `.jsonl`, см. :mod:`readers.text`).
     """
 
     # зарегистрированные читатели
-    readers = [
+    readers: list[Type[BaseReader]] = [
         BookReader,
         InternetResourceReader,
         ArticlesCollectionReader,
     ]
 
-    def __init__(self, path: str) -> None:
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        path: Union[str, BinaryIO],
+        streaming: bool = False,
+        workers: int = READER_WORKERS,
+        chunk_size: int = READER_CHUNK_SIZE,
+        trusted: bool = False,
+        native: bool = False,
+    ) -> None:
         """
         Конструктор.
 
-        :param path: Путь к исходному файлу для чтения.
+        :param path: Путь к исходному файлу для чтения (или файловый объект).
+        :param streaming: Потоковый режим чтения (рабочая книга открывается только для чтения,
+            ячейки не загружаются в память целиком).
+        :param workers: Количество процессов для параллельного чтения листов
+            (1 – последовательное чтение).
+        :param chunk_size: Максимальное количество строк листа, обрабатываемых одним процессом.
+        :param trusted: Режим доверенных данных (столбцы проверяются пакетно,
+            модели создаются без повторной валидации каждого поля). Для текстовых файлов
+            включен всегда: значения приводятся к типам атрибутов при разборе строк,
+            а строки, не прошедшие проверку столбцов, валидируются полностью.
+        :param native: Быстрое чтение рабочей книги Excel без `openpyxl`: XML листов
+            разбирается потоком, читаются только значения ячеек (см. :mod:`readers.xlsx`).
+        """
+
+        self.path = path
+        self.streaming = streaming
+        self.workers = workers
+        self.chunk_size = chunk_size
+        # пакетная проверка столбцов дает те же модели и ошибки валидации, что и валидация
+        # каждой строки, но для текстовых файлов без затрат на разбор Excel составляет
+        # большую часть времени чтения
+        self.trusted = trusted or get_text_workbook_class(path) is not None
+        self.native = native
+
+    @cached_property
+    def workbook(self) -> Workbook:
+        """
+        Получение рабочей книги (загружается при первом обращении).
+
+        :return: Рабочая книга Excel.
         """
 
         logger.info("Загрузка рабочей книги ...")
-        self.workbook: Workbook = openpyxl.load_workbook(path)
+
+        return open_workbook(
+            self.path, self.readers, read_only=self.streaming, native=self.native
+        )
+
+    @property
+    def parallel(self) -> bool:
+        """
+        Проверка возможности параллельного чтения.
+
+        Процессы пула открывают рабочую книгу Excel по пути к файлу, поэтому файловые объекты
+        и текстовые файлы (разбираемые за один проход, см. :mod:`readers.text`)
+        читаются последовательно.
+
+        :return: Листы читаются в пуле процессов.
+        """
+
+        return (
+            self.workers > 1
+            and isinstance(self.path, (str, Path))
+            and get_text_workbook_class(self.path) is None
+        )
+
+    def chunks(self) -> list[SheetChunk]:
+        """
+        Разбиение листов рабочей книги на диапазоны строк для параллельного чтения.
+
+        Размеры листов берутся из их заголовков (ячейки не читаются). Последний диапазон
+        листа читается до конца листа, поэтому строки за пределами размера из заголовка
+        не теряются; лист без размера в заголовке читается одним процессом.
+        Порядок диапазонов совпадает с порядком последовательного чтения.
+
+        :return: Диапазоны строк листов.
+        """
+
+        chunks: list[SheetChunk] = []
+        workbook = open_workbook(
+            self.path, self.readers, read_only=True, native=self.native
+        )
+        try:
+            for reader in self.readers:
+                max_row = workbook[reader.sheet].max_row or 0
+                starts = range(2, max(max_row, 2) + 1, self.chunk_size)
+                chunks.extend(
+                    SheetChunk(reader, start, start + self.chunk_size - 1)
+                    for start in starts[:-1]
+                )
+                chunks.append(SheetChunk(reader, starts[-1], None))
+        finally:
+            workbook.close()
+
+        return chunks
+
+    def iter_chunks(
+        self, function: Callable[..., T], *args: Any
+    ) -> Iterator[tuple[SheetChunk, T]]:
+        """
+        Обработка диапазонов строк листов в пуле процессов.
+
+        :param function: Функция обработки диапазона строк (получает путь к файлу,
+            диапазон строк и дополнительные параметры).
+        :param args: Дополнительные параметры функции обработки.
+        :return: Итератор из диапазона строк и результата его обработки
+            в порядке последовательного чтения.
+        """
+
+        chunks = self.chunks()
+        logger.info(
+            "Параллельное чтение %s диапазонов строк (процессов: %s) ...",
+            len(chunks),
+            self.workers,
+        )
+
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            # одновременно в обработке находится не более двух диапазонов на процесс,
+            # чтобы прочитанные модели не накапливались в памяти
+            pending: deque[tuple[SheetChunk, Future]] = deque()
+            for chunk in chunks:
+                pending.append(
+                    (chunk, executor.submit(function, str(self.path), chunk, *args))
+                )
+                if len(pending) >= self.workers * 2:
+                    done, future = pending.popleft()
+                    yield done, future.result()
+
+            while pending:
+                done, future = pending.popleft()
+                yield done, future.result()
+
+    def iter_read_parallel(self) -> Iterator[BaseModel]:
+        """
+        Параллельное чтение исходного файла в пуле процессов.
+
+        Каждый диапазон строк листа открывается, разбирается и валидируется
+        в своем процессе (см. :func:`read_chunk`), в текущий процесс возвращаются модели.
+
+        :return: Итератор прочитанных моделей (строк) в порядке последовательного чтения.
+        """
+
+        for _, models in self.iter_chunks(read_chunk, self.trusted, self.native):
+            yield from models
+
+    def iter_read_sequential(self) -> Iterator[BaseModel]:
+        """
+        Последовательное чтение исходного файла.
+
+        :return: Итератор прочитанных моделей (строк).
+        """
+
+        for reader in self.readers:
+            logger.info("Чтение %s ...", reader)
+            yield from reader(self.workbook, trusted=self.trusted).iter_read()
+
+    def iter_parsed(self) -> Iterator[tuple[BaseReader, dict[str, Any]]]:
+        """
+        Чтение атрибутов моделей без создания моделей.
+
+        При параллельном чтении диапазоны строк листов разбираются в пуле процессов
+        (см. :func:`parse_chunk`), порядок строк совпадает с последовательным чтением.
+
+        :return: Итератор из читателя листа и атрибутов модели строки.
+        """
+
+        if self.parallel:
+            # читатели листов в текущем процессе используются только для получения моделей
+            readers = {
+                reader_class: reader_class(None) for reader_class in self.readers
+            }
+            for chunk, parsed in self.iter_chunks(parse_chunk, self.native):
+                reader = readers[chunk.reader]
+                for attrs in parsed:
+                    yield reader, attrs
+            return
+
+        for reader_class in self.readers:
+            logger.info("Чтение %s ...", reader_class)
+            reader = reader_class(self.workbook)
+            for attrs in reader.iter_parsed():
+                yield reader, attrs
+
+    def iter_read(self) -> Iterator[BaseModel]:
+        """
+        Потоковое чтение исходного файла.
+
+        :return: Итератор прочитанных моделей (строк).
+        """
+
+        if self.parallel:
+            models = self.iter_read_parallel()
+        else:
+            models = self.iter_read_sequential()
+
+        return ProgressLogger(logger, "Чтение").track(models)
 
     def read(self) -> list:
         """
@@ -119,9 +433,12 @@ class SourcesReader:
         :return: Список прочитанных моделей (строк).
         """
 
-        items = []
-        for reader in self.readers:
-            logger.info("Чтение %s ...", reader)
-            items.extend(reader(self.workbook).read())  # type: ignore
+        return list(self.iter_read())
+
+    def close(self) -> None:
+        """
+        Закрытие рабочей книги (освобождение файла в потоковом режиме).
+        """
 
-        return items
+        if "workbook" in self.__dict__:
+            self.workbook.close()
@@ -0,0 +1,257 @@
+"""
+Чтение исходных данных из текстовых файлов (CSV, JSON Lines).
+
+Текстовый файл содержит строки всех типов источников. Тип строки задается наименованием листа
+рабочей книги Excel ("Книга", "Интернет-ресурс", "Статья из сборника") или наименованием модели
+("BookModel", ...). Для читателей листов (:class:`readers.base.BaseReader`) текстовый файл
+представляется как рабочая книга, листы которой читаются потоком.
+
+Файл разбирается за один проход: строки читаемого листа возвращаются сразу,
+а строки остальных листов откладываются (во временный файл при превышении
+`READER_SPOOL_SIZE`) и возвращаются при чтении своего листа.
+
+CSV-файл: первая строка – заголовок, первый столбец – тип строки,
+остальные столбцы – значения в порядке столбцов листа Excel:
+
+.. code-block::
+
+    type,1,2,3,4,5,6,7
+    Книга,"Иванов И.М., Петров С.Н.",Наука как искусство,3-е,СПб.,Просвещение,2020,999
+
+JSON Lines: каждая строка – объект с типом строки и атрибутами модели:
+
+.. code-block::
+
+    {"type": "Книга", "authors": "Иванов И.М., Петров С.Н.", "title": "Наука как искусство", ...}
+"""
+from __future__ import annotations
+
+import csv
+import json
+import pickle
+import tempfile
+from abc import ABC, abstractmethod
+from itertools import islice
+from pathlib import Path
+from typing import IO, Any, Callable, Iterator, Optional
+
+from settings import READER_SPOOL_SIZE
+
+# количество отложенных строк листа, сохраняемых во временный файл одним блоком
+# (строки сериализуются пакетами, а не по одной)
+SPOOL_BATCH_SIZE = 1000
+
+
+class TextSheet:
+    """
+    Лист текстового источника данных: строки одного типа.
+    """
+
+    # количество строк заранее неизвестно (файл читается потоком)
+    max_row = None
+
+    def __init__(self, rows: Callable[[], Iterator[tuple]]) -> None:
+        """
+        Конструктор.
+
+        :param rows: Функция получения итератора значений строк листа.
+        """
+
+        self.rows = rows
+
+    def iter_rows(
+        self,
+        min_row: int = 2,
+        max_row: Optional[int] = None,
+        values_only: bool = True,  # pylint: disable=unused-argument
+    ) -> Iterator[tuple]:
+        """
+        Получение значений строк листа.
+
+        Нумерация строк совпадает с листом Excel: первая строка данных имеет номер 2.
+
+        :param min_row: Номер первой читаемой строки.
+        :param max_row: Номер последней читаемой строки.
+        :param values_only: Получение только значений (другие режимы не поддерживаются).
+        :return: Итератор кортежей значений ячеек.
+        """
+
+        return islice(
+            self.rows(), max(min_row - 2, 0), None if max_row is None else max_row - 1
+        )
+
+
+class BaseTextWorkbook(ABC):
+    """
+    Базовый класс текстового источника данных, совместимого с рабочей книгой Excel.
+    """
+
+    def __init__(self, path: str, columns: dict[str, tuple[str, ...]]) -> None:
+        """
+        Конструктор.
+
+        :param path: Путь к исходному файлу для чтения.
+        :param columns: Наименования атрибутов в порядке столбцов по типам строк
+            (наименованиям листов и моделей).
+        """
+
+        self.path = path
+        self.columns = columns
+        # строки файла, еще не разобранные в текущем проходе
+        self.records: Optional[Iterator[tuple[str, tuple]]] = None
+        # отложенные строки листов по наименованиям атрибутов
+        self.spools: dict[tuple[str, ...], IO[bytes]] = {}
+        # отложенные строки листов, еще не сохраненные во временный файл
+        self.pending: dict[tuple[str, ...], list[tuple]] = {}
+        # листы, прочитанные в текущем проходе
+        self.done: set[tuple[str, ...]] = set()
+
+    @abstractmethod
+    def iter_records(self) -> Iterator[tuple[str, tuple]]:
+        """
+        Потоковое чтение всех строк файла.
+
+        :return: Итератор из типа строки и значений ячеек.
+        """
+
+    def iter_sheet(self, sheet: str) -> Iterator[tuple]:
+        """
+        Потоковое чтение строк заданного типа.
+
+        Сначала возвращаются строки листа, отложенные при чтении других листов,
+        затем разбор файла продолжается с откладыванием строк остальных листов.
+        Повторное чтение листа начинает новый проход по файлу.
+
+        :param sheet: Наименование листа.
+        :return: Итератор значений ячеек.
+        """
+
+        names = self.columns[sheet]
+        if names in self.done:
+            self.close()
+        self.done.add(names)
+        if self.records is None:
+            self.records = self.iter_records()
+
+        if (spool := self.spools.pop(names, None)) is not None:
+            with spool:
+                spool.seek(0)
+                while True:
+                    try:
+                        yield from pickle.load(spool)
+                    except EOFError:
+                        break
+        yield from self.pending.pop(names, ())
+
+        for kind, values in self.records:
+            if (other := self.columns[kind]) is names:
+                yield values
+            elif other not in self.done:
+                self.defer(other, values)
+
+    def defer(self, names: tuple[str, ...], values: tuple) -> None:
+        """
+        Откладывание строки другого листа до чтения этого листа.
+
+        :param names: Наименования атрибутов листа.
+        :param values: Значения ячеек строки.
+        """
+
+        pending = self.pending.setdefault(names, [])
+        pending.append(values)
+        if len(pending) < SPOOL_BATCH_SIZE:
+            return
+
+        if names not in self.spools:
+            # pylint: disable-next=consider-using-with
+            self.spools[names] = tempfile.SpooledTemporaryFile(
+                max_size=READER_SPOOL_SIZE
+            )
+        pickle.dump(pending, self.spools[names], pickle.HIGHEST_PROTOCOL)
+        pending.clear()
+
+    def __getitem__(self, sheet: str) -> TextSheet:
+        return TextSheet(lambda: self.iter_sheet(sheet))
+
+    def close(self) -> None:
+        """
+        Завершение прохода по файлу с удалением отложенных строк.
+        """
+
+        for spool in self.spools.values():
+            spool.close()
+        self.spools.clear()
+        self.pending.clear()
+        self.done.clear()
+        self.records = None
+
+
+class CSVWorkbook(BaseTextWorkbook):
+    """
+    Источник данных в формате CSV.
+    """
+
+    def iter_records(self) -> Iterator[tuple[str, tuple]]:
+        with open(self.path, encoding="utf-8-sig", newline="") as file:
+            rows = csv.reader(file)
+            # пропуск заголовка
+            next(rows, None)
+            for row in rows:
+                # пустые строки файла пропускаются
+                if not row or (names := self.columns.get(row[0])) is None:
+                    continue
+
+                kind, *values = row
+
+                # пустые и недостающие ячейки соответствуют пустым ячейкам листа Excel
+                values.extend([""] * (len(names) - len(values)))
+                yield kind, tuple(value or None for value in values)
+
+
+class JSONLinesWorkbook(BaseTextWorkbook):
+    """
+    Источник данных в формате JSON Lines.
+    """
+
+    def iter_records(self) -> Iterator[tuple[str, tuple]]:
+        columns = self.columns
+        # декодер создается один раз на файл (без проверки параметров при каждом вызове)
+        decode = json.JSONDecoder().decode
+        with open(self.path, encoding="utf-8") as file:
+            for number, line in enumerate(file, start=1):
+                if not line.strip():
+                    continue
+
+                record: Any = decode(line)
+                if not isinstance(record, dict):
+                    raise ValueError(
+                        f"Строка {number}: ожидается JSON-объект, "
+                        f"получено: {type(record).__name__}"
+                    )
+
+                get = record.get
+                kind = get("type", "")
+                if names := columns.get(kind):
+                    yield kind, tuple(get(name) for name in names)
+
+
+# форматы текстовых источников данных по расширению файла
+TEXT_WORKBOOKS: dict[str, type[BaseTextWorkbook]] = {
+    ".csv": CSVWorkbook,
+    ".jsonl": JSONLinesWorkbook,
+    ".ndjson": JSONLinesWorkbook,
+}
+
+
+def get_text_workbook_class(path: Any) -> Optional[type[BaseTextWorkbook]]:
+    """
+    Получение класса текстового источника данных по расширению файла.
+
+    :param path: Путь к исходному файлу (или файловый объект).
+    :return: Класс текстового источника данных или `None` для рабочих книг Excel.
+    """
+
+    if not isinstance(path, (str, Path)):
+        return None
+
+    return TEXT_WORKBOOKS.get(Path(path).suffix.lower())
@@ -0,0 +1,380 @@
+"""
+Быстрое чтение рабочей книги Excel (`.xlsx`) без `openpyxl`.
+
+Рабочая книга – zip-архив с XML-частями. Таблица общих строк (`xl/sharedStrings.xml`)
+загружается один раз в список, номера стилей ячеек с форматом даты определяются
+по `xl/styles.xml`, а XML листов разбирается потоком (:func:`xml.etree.ElementTree.iterparse`)
+с удалением обработанных строк, поэтому объекты ячеек и стилей не создаются.
+
+Рабочая книга совместима с интерфейсом, который используют читатели листов
+(:class:`readers.base.BaseReader`): `workbook[sheet].iter_rows(...)` и `max_row`.
+"""
+from __future__ import annotations
+
+import re
+import zipfile
+from datetime import datetime, timedelta
+from functools import lru_cache
+from pathlib import PurePosixPath
+from typing import IO, Any, Callable, Iterator, Optional, Union
+from xml.etree import ElementTree
+
+# пространства имен XML рабочей книги
+NS_MAIN = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+NS_REL = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+NS_PACKAGE_REL = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+# встроенные форматы чисел с датой и временем
+BUILTIN_DATE_FORMATS = frozenset((*range(14, 23), *range(45, 48)))
+
+# части пользовательского формата, не влияющие на определение даты:
+# текст в кавычках, экранированные символы и условия/цвета в квадратных скобках
+FORMAT_LITERALS = re.compile(r'"[^"]*"|\\.|\[[^\]]*\]')
+# символы формата даты и времени
+DATE_FORMAT_CHARS = re.compile(r"[dmyhs]", re.IGNORECASE)
+
+# начало отсчета дат (системы дат 1900 и 1904)
+EPOCH_1900 = datetime(1899, 12, 30)
+EPOCH_1904 = datetime(1904, 1, 1)
+
+
+def is_date_format(format_code: str) -> bool:
+    """
+    Проверка пользовательского формата числа на формат даты и времени.
+
+    :param format_code: Код формата числа.
+    :return: Формат является форматом даты и времени.
+    """
+
+    return bool(DATE_FORMAT_CHARS.search(FORMAT_LITERALS.sub("", format_code)))
+
+
+@lru_cache(maxsize=None)
+def column_index(letters: str) -> int:
+    """
+    Получение индекса столбца (с нуля) по его буквенному обозначению.
+
+    :param letters: Буквенное обозначение столбца (например, `AB`).
+    :return: Индекс столбца.
+    """
+
+    index = 0
+    for letter in letters:
+        index = index * 26 + ord(letter) - 64
+
+    return index - 1
+
+
+def split_reference(reference: str) -> tuple[int, int]:
+    """
+    Разбор адреса ячейки.
+
+    :param reference: Адрес ячейки (например, `B12`).
+    :return: Номер строки и индекс столбца (с нуля).
+    """
+
+    letters = reference.rstrip("0123456789")
+
+    return int(reference.removeprefix(letters)), column_index(letters)
+
+
+def parse_bool(value: str) -> bool:
+    """
+    Получение логического значения ячейки.
+
+    :param value: Значение ячейки в XML (`0` или `1`).
+    :return: Логическое значение.
+    """
+
+    return value == "1"
+
+
+# функции получения значений ячеек по типам ячеек (кроме строк и чисел):
+# логическое значение и дата в формате ISO 8601, для строки формулы ("str")
+# и ошибки ("e") используется значение из XML
+VALUE_PARSERS: dict[str, Callable[[str], Any]] = {
+    "b": parse_bool,
+    "d": datetime.fromisoformat,
+}
+
+
+class XLSXSheet:
+    """
+    Лист рабочей книги, читаемый потоком из XML.
+    """
+
+    def __init__(self, workbook: XLSXWorkbook, part: str) -> None:
+        """
+        Конструктор.
+
+        :param workbook: Рабочая книга.
+        :param part: Наименование XML-части листа в архиве.
+        """
+
+        self.workbook = workbook
+        self.part = part
+        self.max_row, self.max_column = self.read_dimension()
+
+    def read_dimension(self) -> tuple[Optional[int], int]:
+        """
+        Получение размеров листа из его заголовка (без чтения строк).
+
+        :return: Номер последней строки (если указан) и количество столбцов.
+        """
+
+        with self.workbook.archive.open(self.part) as stream:
+            for _, element in ElementTree.iterparse(stream, events=("start",)):
+                if element.tag == f"{NS_MAIN}dimension":
+                    last = element.get("ref", "").split(":")[-1]
+                    if last.rstrip("0123456789") != last:
+                        max_row, index = split_reference(last)
+                        return max_row, index + 1
+                    break
+                if element.tag == f"{NS_MAIN}sheetData":
+                    break
+
+        return None, 0
+
+    def parse_value(self, cell: ElementTree.Element) -> Any:
+        """
+        Получение значения ячейки.
+
+        :param cell: Элемент ячейки.
+        :return: Значение ячейки (строка, число, дата или логическое значение).
+        """
+
+        cell_type = cell.get("t", "n")
+        if cell_type == "inlineStr":
+            inline = cell.find(f"{NS_MAIN}is")
+            return None if inline is None else "".join(inline.itertext())
+
+        value = cell.findtext(f"{NS_MAIN}v")
+        if value is None:
+            return None
+
+        if cell_type == "s":
+            return self.workbook.shared_strings[int(value)]
+        if cell_type == "n":
+            return self.parse_number(value, int(cell.get("s", 0)))
+
+        return VALUE_PARSERS.get(cell_type, str)(value)
+
+    def parse_number(self, value: str, style: int) -> Union[int, float, datetime]:
+        """
+        Получение числового значения ячейки.
+
+        :param value: Значение ячейки в XML.
+        :param style: Номер стиля ячейки.
+        :return: Число или дата (для ячеек с форматом даты).
+        """
+
+        if "." in value or "E" in value or "e" in value:
+            number: Union[int, float] = float(value)
+        else:
+            number = int(value)
+
+        if style in self.workbook.date_styles:
+            return self.workbook.to_datetime(number)
+
+        return number
+
+    def parse_row(self, row: ElementTree.Element) -> tuple:
+        """
+        Получение значений ячеек строки.
+
+        :param row: Элемент строки.
+        :return: Кортеж значений ячеек (отсутствующие ячейки – `None`).
+        """
+
+        values: list[Any] = [None] * self.max_column
+        for position, cell in enumerate(row.iter(f"{NS_MAIN}c")):
+            reference = cell.get("r")
+            index = split_reference(reference)[1] if reference else position
+            if index >= len(values):
+                values.extend([None] * (index + 1 - len(values)))
+            values[index] = self.parse_value(cell)
+
+        return tuple(values)
+
+    def iter_rows(
+        self,
+        min_row: int = 1,
+        max_row: Optional[int] = None,
+        values_only: bool = True,  # pylint: disable=unused-argument
+    ) -> Iterator[tuple]:
+        """
+        Получение значений строк листа.
+
+        Строки, отсутствующие в XML листа (пустые), пропускаются.
+
+        :param min_row: Номер первой читаемой строки.
+        :param max_row: Номер последней читаемой строки.
+        :param values_only: Получение только значений (другие режимы не поддерживаются).
+        :return: Итератор кортежей значений ячеек.
+        """
+
+        row_tag = f"{NS_MAIN}row"
+        number = 0
+        with self.workbook.archive.open(self.part) as stream:
+            parent = None
+            for event, element in ElementTree.iterparse(
+                stream, events=("start", "end")
+            ):
+                if event == "start":
+                    if element.tag == f"{NS_MAIN}sheetData":
+                        parent = element
+                    continue
+                if element.tag != row_tag:
+                    continue
+
+                number = int(element.get("r") or number + 1)
+                if max_row is not None and number > max_row:
+                    break
+                if number >= min_row:
+                    yield self.parse_row(element)
+
+                # обработанные строки удаляются из дерева, чтобы не накапливать их в памяти
+                if parent is not None:
+                    parent.clear()
+
+
+class XLSXWorkbook:
+    """
+    Рабочая книга Excel, читаемая без `openpyxl` (только значения ячеек).
+    """
+
+    def __init__(self, path: Union[str, IO[bytes]]) -> None:
+        """
+        Конструктор.
+
+        :param path: Путь к рабочей книге (или файловый объект).
+        """
+
+        # pylint: disable=consider-using-with
+        self.archive = zipfile.ZipFile(path)
+        self.sheets, self.date1904 = self.read_workbook()
+        self.shared_strings = self.read_shared_strings()
+        self.date_styles = self.read_date_styles()
+        # листы создаются при первом обращении (размеры читаются из заголовка XML один раз)
+        self.cached_sheets: dict[str, XLSXSheet] = {}
+
+    def read_workbook(self) -> tuple[dict[str, str], bool]:
+        """
+        Получение XML-частей листов по их наименованиям.
+
+        :return: Наименования частей архива по наименованиям листов
+            и признак системы дат 1904.
+        """
+
+        relationships = ElementTree.fromstring(
+            self.archive.read("xl/_rels/workbook.xml.rels")
+        )
+        targets = {
+            item.get("Id"): item.get("Target", "")
+            for item in relationships.iter(f"{NS_PACKAGE_REL}Relationship")
+        }
+
+        workbook = ElementTree.fromstring(self.archive.read("xl/workbook.xml"))
+        sheets = {}
+        for sheet in workbook.iter(f"{NS_MAIN}sheet"):
+            target = targets[sheet.get(f"{NS_REL}id")]
+            # путь указывается относительно `xl/` или от корня архива
+            sheets[sheet.get("name", "")] = (
+                target.lstrip("/")
+                if target.startswith("/")
+                else str(PurePosixPath("xl", target))
+            )
+
+        properties = workbook.find(f"{NS_MAIN}workbookPr")
+        date1904 = properties is not None and properties.get("date1904") in (
+            "1",
+            "true",
+        )
+
+        return sheets, date1904
+
+    def read_shared_strings(self) -> list[str]:
+        """
+        Загрузка таблицы общих строк.
+
+        :return: Общие строки в порядке их номеров.
+        """
+
+        if "xl/sharedStrings.xml" not in self.archive.namelist():
+            return []
+
+        item_tag, text_tag = f"{NS_MAIN}si", f"{NS_MAIN}t"
+        run_tag = f"{NS_MAIN}r"
+        strings = []
+        with self.archive.open("xl/sharedStrings.xml") as stream:
+            for _, element in ElementTree.iterparse(stream):
+                if element.tag != item_tag:
+                    continue
+
+                # текст строки – непосредственный `<t>` или `<t>` форматированных фрагментов
+                # (фонетические подсказки `<rPh>` не учитываются)
+                strings.append(
+                    "".join(
+                        child.findtext(text_tag, "")
+                        if child.tag == run_tag
+                        else child.text or ""
+                        for child in element
+                        if child.tag in (text_tag, run_tag)
+                    )
+                )
+                element.clear()
+
+        return strings
+
+    def read_date_styles(self) -> frozenset[int]:
+        """
+        Получение номеров стилей ячеек с форматом даты и времени.
+
+        :return: Номера стилей ячеек.
+        """
+
+        if "xl/styles.xml" not in self.archive.namelist():
+            return frozenset()
+
+        styles = ElementTree.fromstring(self.archive.read("xl/styles.xml"))
+        date_formats = set(BUILTIN_DATE_FORMATS)
+        for number_format in styles.iter(f"{NS_MAIN}numFmt"):
+            if is_date_format(number_format.get("formatCode", "")):
+                date_formats.add(int(number_format.get("numFmtId", -1)))
+
+        cell_formats = styles.find(f"{NS_MAIN}cellXfs")
+        if cell_formats is None:
+            return frozenset()
+
+        return frozenset(
+            index
+            for index, cell_format in enumerate(cell_formats.iter(f"{NS_MAIN}xf"))
+            if int(cell_format.get("numFmtId", 0)) in date_formats
+        )
+
+    def to_datetime(self, value: Union[int, float]) -> datetime:
+        """
+        Преобразование порядкового номера даты Excel в дату и время.
+
+        :param value: Порядковый номер даты (дробная часть – время).
+        :return: Дата и время.
+        """
+
+        if self.date1904:
+            return EPOCH_1904 + timedelta(days=value)
+
+        # в системе дат 1900 Excel считает 1900 год високосным
+        return EPOCH_1900 + timedelta(days=value + 1 if value < 60 else value)
+
+    def __getitem__(self, name: str) -> XLSXSheet:
+        if name not in self.cached_sheets:
+            self.cached_sheets[name] = XLSXSheet(self, self.sheets[name])
+
+        return self.cached_sheets[name]
+
+    def close(self) -> None:
+        """
+        Закрытие архива рабочей книги.
+        """
+
+        self.archive.close()
@@ -3,34 +3,194 @@
 """
 from __future__ import annotations
 
+import html
+import io
+import json
+import re
+import zipfile
+from abc import ABC, abstractmethod
+from contextlib import suppress
+from functools import lru_cache
+from io import BytesIO
 from pathlib import Path
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    ClassVar,
+    Iterable,
+    NamedTuple,
+    Optional,
+    Sequence,
+    TypeVar,
+)
+from xml.sax.saxutils import escape
 
-from docx import Document
-from docx.enum.text import WD_ALIGN_PARAGRAPH  # pylint: disable=E0611
-from docx.shared import Pt
+if TYPE_CHECKING:
+    from docx.document import Document as DocumentObject
 
+T = TypeVar("T")
 
-class Renderer:
+# заголовок списка источников
+TITLE = "Список использованной литературы"
+
+# наименование части документа Word с содержимым документа
+DOCUMENT_PART = "word/document.xml"
+
+# специальные символы разметки Markdown, экранируемые в строках списка
+MARKDOWN_SPECIAL = re.compile(r"([\\`*_\[\]<>#|])")
+# управляющие символы, недопустимые в XML 1.0 (документ Word с ними не открывается)
+XML_INVALID_CHARS = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+
+def check_opened(value: Optional[T]) -> T:
     """
-    Создание выходного файла – Word.
+    Проверка начала записи выходного файла.
+
+    :param value: Объект, создаваемый при начале записи (документ, поток или файл).
+    :return: Тот же объект.
+    :raises RuntimeError: Запись выходного файла не начата (:meth:`BaseRenderer.open`).
+    """
+
+    if value is None:
+        raise RuntimeError("Запись выходного файла не начата")
+
+    return value
+
+
+class BaseRenderer(ABC):
+    """
+    Базовый класс создания выходного файла.
+
+    Выходной файл записывается потоком: :meth:`open` записывает начало файла,
+    :meth:`write` – очередную строку списка источников, :meth:`close` – окончание файла.
+    Это позволяет записывать несколько выходных файлов за один проход по строкам
+    (см. :func:`render_all`).
     """
 
-    def __init__(self, rows: tuple[str, ...]):
+    # расширение выходного файла
+    extension: ClassVar[str]
+
+    def __init__(self, rows: Iterable[str] = ()) -> None:
+        """
+        Конструктор.
+
+        :param rows: Строки списка источников.
+        """
+
         self.rows = rows
 
-    def render(self, path: Path | str) -> None:
+    @abstractmethod
+    def open(self, path: Path | str | IO[bytes]) -> None:
+        """
+        Начало записи выходного файла.
+
+        :param path: Путь для сохранения выходного файла (или файловый объект).
+        """
+
+    @abstractmethod
+    def write(self, row: str) -> None:
+        """
+        Запись строки списка источников.
+
+        :param row: Строка списка источников.
+        """
+
+    @abstractmethod
+    def close(self) -> None:
+        """
+        Окончание записи выходного файла.
+        """
+
+    def abort(self) -> None:
+        """
+        Прерывание записи выходного файла при ошибке: ресурсы освобождаются
+        без записи окончания файла (недописанный файл удаляется вызывающим кодом).
+        """
+
+        self.close()
+
+    def render(self, path: Path | str | IO[bytes]) -> None:
+        """
+        Метод генерации выходного файла со списком использованных источников.
+
+        При ошибке получения строк недописанный файл не сохраняется.
+
+        :param Path | str | IO[bytes] path: Путь для сохранения выходного файла
+            (или файловый объект).
+        """
+
+        self.open(path)
+        try:
+            for row in self.rows:
+                self.write(row)
+        except BaseException:
+            self.discard(path)
+            raise
+        self.close()
+
+    def discard(self, path: Path | str | IO[bytes]) -> None:
+        """
+        Прерывание записи с удалением недописанного выходного файла.
+
+        :param Path | str | IO[bytes] path: Путь к выходному файлу (или файловый объект,
+            который не удаляется).
+        """
+
+        self.abort()
+        if isinstance(path, (str, Path)):
+            Path(path).unlink(missing_ok=True)
+
+    def render_bytes(self) -> bytes:
+        """
+        Генерация выходного файла в памяти.
+
+        :return: Содержимое выходного файла.
+        """
+
+        output = BytesIO()
+        self.render(output)
+
+        return output.getvalue()
+
+
+class Renderer(BaseRenderer):
+    """
+    Создание выходного файла – Word.
+    """
+
+    extension = ".docx"
+
+    def __init__(self, rows: Iterable[str] = ()) -> None:
         """
-        Метод генерации Word-файла со списком использованных источников.
+        Конструктор.
+
+        :param rows: Строки списка источников.
+        """
+
+        super().__init__(rows)
+        # путь для сохранения и документ задаются при начале записи (см. :meth:`open`)
+        self.path: Optional[Path | str | IO[bytes]] = None
+        self.document: Optional[DocumentObject] = None
 
-        :param Path | str path: Путь для сохранения выходного файла.
+    def build_document(self) -> DocumentObject:
         """
+        Создание документа Word со стилизацией текста и заголовком списка источников.
+
+        :return: Документ Word без строк списка источников.
+        """
+
+        # python-docx загружается только при генерации файлов Word
+        # pylint: disable=import-outside-toplevel
+        from docx import Document
+        from docx.enum.text import WD_ALIGN_PARAGRAPH  # pylint: disable=E0611
+        from docx.shared import Pt
 
         document = Document()
 
         # стилизация заголовка
         paragraph = document.add_paragraph()
         paragraph.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        runner = paragraph.add_run("Список использованной литературы")
+        runner = paragraph.add_run(TITLE)
         runner.bold = True
 
         # стилизация текста
@@ -40,9 +200,436 @@ class Renderer:
         style_normal.paragraph_format.line_spacing = 1.5
         style_normal.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
 
-        for row in self.rows:
-            # добавление источника
-            document.add_paragraph(row, style="List Number")
+        return document
+
+    def load_document(self) -> DocumentObject:
+        """
+        Получение копии стилизованного документа Word из снимка
+        (см. :func:`get_base_document`), без повторной стилизации.
+
+        :return: Документ Word без строк списка источников.
+        """
+
+        # pylint: disable=import-outside-toplevel
+        from docx import Document
+
+        return Document(BytesIO(get_base_document(type(self))))
+
+    def open(self, path: Path | str | IO[bytes]) -> None:
+        self.path = path
+        self.document = self.load_document()
 
+    def write(self, row: str) -> None:
+        # добавление источника (python-docx не принимает недопустимые в XML символы)
+        document: DocumentObject = check_opened(self.document)
+        document.add_paragraph(XML_INVALID_CHARS.sub("", row), style="List Number")
+
+    def close(self) -> None:
         # сохранение файла Word
-        document.save(path)
+        document: DocumentObject = check_opened(self.document)
+        document.save(check_opened(self.path))
+
+    def abort(self) -> None:
+        """
+        Прерывание записи: документ создается в памяти и при ошибке не сохраняется.
+        """
+
+
+class StreamRenderer(Renderer):
+    """
+    Потоковое создание выходного файла – Word.
+
+    Стилизация и заголовок документа формируются так же, как в :class:`Renderer`
+    (из того же снимка, см. :func:`get_stream_template`), а строки списка источников
+    записываются в содержимое документа (`word/document.xml`) потоком,
+    без построения дерева объектов документа.
+
+    Файловый объект для сохранения должен поддерживать чтение и позиционирование
+    (например, :class:`io.BytesIO`), так как содержимое документа дописывается в архив.
+    """
+
+    def __init__(self, rows: Iterable[str] = ()) -> None:
+        """
+        Конструктор.
+
+        :param rows: Строки списка источников.
+        """
+
+        super().__init__(rows)
+        # разметка снимка и архив задаются при начале записи (см. :meth:`open`)
+        self.prefix = ""
+        self.suffix = b""
+        self.target: Optional[zipfile.ZipFile] = None
+        self.stream: Optional[IO[bytes]] = None
+
+    def open(self, path: Path | str | IO[bytes]) -> None:
+        template = get_stream_template(type(self))
+        self.prefix = template.paragraph
+        self.suffix = template.suffix
+
+        # сжатые части снимка копируются как есть, содержимое документа дописывается в архив
+        if isinstance(path, (str, Path)):
+            Path(path).write_bytes(template.parts)
+        else:
+            path.write(template.parts)
+        # pylint: disable=consider-using-with
+        self.target = zipfile.ZipFile(path, "a", zipfile.ZIP_DEFLATED)
+        self.stream = self.target.open(DOCUMENT_PART, "w")
+        self.stream.write(template.prefix)
+
+    def write(self, row: str) -> None:
+        check_opened(self.stream).write(
+            (self.prefix + self.to_runs(row) + "</w:r></w:p>").encode("utf-8")
+        )
+
+    def close(self) -> None:
+        check_opened(self.stream).write(self.suffix)
+        self.abort()
+
+    def abort(self) -> None:
+        # архив закрывается и в том случае, если содержимое документа не открыто
+        if self.stream is not None:
+            self.stream.close()
+        if self.target is not None:
+            self.target.close()
+
+    @staticmethod
+    def to_runs(text: str) -> str:
+        """
+        Получение XML-разметки текста абзаца.
+
+        Символы табуляции и переноса строки преобразуются так же, как в `python-docx`,
+        управляющие символы, недопустимые в XML, удаляются (как в :class:`Renderer`).
+
+        :param text: Текст абзаца.
+        :return: XML-разметка текста абзаца.
+        """
+
+        parts = []
+        for part in re.split(r"([\t\n\r])", XML_INVALID_CHARS.sub("", text)):
+            if part == "\t":
+                parts.append("<w:tab/>")
+            elif part in ("\n", "\r"):
+                parts.append("<w:br/>")
+            elif part:
+                parts.append(f'<w:t xml:space="preserve">{escape(part)}</w:t>')
+
+        return "".join(parts)
+
+
+class StreamTemplate(NamedTuple):
+    """
+    Части снимка документа Word для потоковой записи (см. :func:`get_stream_template`).
+    """
+
+    # архив со всеми частями документа, кроме содержимого (сжимается один раз)
+    parts: bytes
+    # содержимое документа до строк списка источников
+    prefix: bytes
+    # содержимое документа после строк списка источников
+    suffix: bytes
+    # начало разметки абзаца строки списка источников
+    paragraph: str
+
+
+@lru_cache(maxsize=None)
+def get_base_document(renderer: type[Renderer]) -> bytes:
+    """
+    Получение снимка стилизованного документа Word с заголовком списка источников.
+
+    Документ создается и сохраняется один раз для класса создания выходного файла,
+    при генерации каждого файла используется копия снимка.
+
+    :param renderer: Класс создания выходного файла Word.
+    :return: Содержимое документа Word без строк списка источников.
+    """
+
+    base = BytesIO()
+    renderer().build_document().save(base)
+
+    return base.getvalue()
+
+
+@lru_cache(maxsize=None)
+def get_stream_template(renderer: type[Renderer]) -> StreamTemplate:
+    """
+    Получение частей снимка документа Word для потоковой записи.
+
+    Снимок разбирается один раз, поэтому при потоковой генерации файла
+    документ Word не создается и не разбирается.
+
+    :param renderer: Класс создания выходного файла Word.
+    :return: Части снимка документа.
+    """
+
+    # pylint: disable=import-outside-toplevel
+    from docx import Document
+
+    base = get_base_document(renderer)
+    style_id = Document(BytesIO(base)).styles["List Number"].style_id
+
+    parts = BytesIO()
+    with zipfile.ZipFile(BytesIO(base)) as source, zipfile.ZipFile(
+        parts, "w", zipfile.ZIP_DEFLATED
+    ) as target:
+        for info in source.infolist():
+            if info.filename == DOCUMENT_PART:
+                content = source.read(info).decode("utf-8")
+            else:
+                target.writestr(info, source.read(info))
+
+    # строки списка вставляются в конец тела документа перед параметрами раздела
+    position = content.rfind("<w:sectPr")
+    if position == -1:
+        position = content.rindex("</w:body>")
+
+    return StreamTemplate(
+        parts=parts.getvalue(),
+        prefix=content[:position].encode("utf-8"),
+        suffix=content[position:].encode("utf-8"),
+        paragraph=f'<w:p><w:pPr><w:pStyle w:val="{style_id}"/></w:pPr><w:r>',
+    )
+
+
+class BaseTextRenderer(BaseRenderer):
+    """
+    Базовый класс потокового создания текстового выходного файла (UTF-8).
+    """
+
+    def __init__(self, rows: Iterable[str] = ()) -> None:
+        """
+        Конструктор.
+
+        :param rows: Строки списка источников.
+        """
+
+        super().__init__(rows)
+        # номер последней записанной строки списка источников
+        self.number = 0
+        # выходной файл открыт при начале записи (см. :meth:`open`) и закрывается
+        # при ее окончании (файловый объект вызывающего кода остается открытым)
+        self.owned = False
+        self.file: Optional[io.TextIOWrapper] = None
+
+    def open(self, path: Path | str | IO[bytes]) -> None:
+        self.number = 0
+        # файловый объект, переданный вызывающим кодом, остается открытым
+        self.owned = isinstance(path, (str, Path))
+        # pylint: disable=consider-using-with
+        stream = open(path, "wb") if isinstance(path, (str, Path)) else path
+        self.file = io.TextIOWrapper(stream, encoding="utf-8", newline="\n")
+        self.file.write(self.header())
+
+    def write(self, row: str) -> None:
+        file = check_opened(self.file)
+        self.number += 1
+        file.write(self.format_row(row))
+
+    def close(self) -> None:
+        check_opened(self.file).write(self.footer())
+        self.abort()
+
+    def abort(self) -> None:
+        if self.file is None:
+            return
+        if self.owned:
+            self.file.close()
+        else:
+            self.file.flush()
+            self.file.detach()
+        # повторное прерывание (например, после ошибки окончания записи) не выполняется
+        self.file = None
+
+    def header(self) -> str:
+        """
+        Получение начала файла.
+
+        :return: Начало файла.
+        """
+
+        return ""
+
+    @abstractmethod
+    def format_row(self, row: str) -> str:
+        """
+        Получение разметки очередной строки списка источников.
+
+        :param row: Строка списка источников.
+        :return: Разметка строки.
+        """
+
+    def footer(self) -> str:
+        """
+        Получение окончания файла.
+
+        :return: Окончание файла.
+        """
+
+        return ""
+
+
+class TextRenderer(BaseTextRenderer):
+    """
+    Потоковое создание выходного файла – простой текст.
+    """
+
+    extension = ".txt"
+
+    def header(self) -> str:
+        return f"{TITLE}\n\n"
+
+    def format_row(self, row: str) -> str:
+        return f"{self.number}. {row}\n"
+
+
+class MarkdownRenderer(BaseTextRenderer):
+    """
+    Потоковое создание выходного файла – Markdown.
+    """
+
+    extension = ".md"
+
+    def header(self) -> str:
+        return f"# {TITLE}\n\n"
+
+    def format_row(self, row: str) -> str:
+        escaped = MARKDOWN_SPECIAL.sub(r"\\\1", row)
+
+        return f"{self.number}. {escaped}\n"
+
+
+class HTMLRenderer(BaseTextRenderer):
+    """
+    Потоковое создание выходного файла – HTML.
+    """
+
+    extension = ".html"
+
+    def header(self) -> str:
+        return (
+            '<!DOCTYPE html>\n<html lang="ru">\n<head>\n<meta charset="utf-8">\n'
+            f"<title>{TITLE}</title>\n</head>\n<body>\n<h1>{TITLE}</h1>\n<ol>\n"
+        )
+
+    def format_row(self, row: str) -> str:
+        return f"<li>{html.escape(row)}</li>\n"
+
+    def footer(self) -> str:
+        return "</ol>\n</body>\n</html>\n"
+
+
+class JSONRenderer(BaseTextRenderer):
+    """
+    Потоковое создание выходного файла – JSON.
+
+    .. code-block::
+
+        {"title": "Список использованной литературы", "items": ["...", "..."]}
+    """
+
+    extension = ".json"
+
+    def header(self) -> str:
+        return f'{{"title": {json.dumps(TITLE, ensure_ascii=False)}, "items": ['
+
+    def format_row(self, row: str) -> str:
+        separator = ", " if self.number > 1 else ""
+        return separator + json.dumps(row, ensure_ascii=False)
+
+    def footer(self) -> str:
+        return "]}\n"
+
+
+# классы создания выходного файла по расширению
+RENDERERS: dict[str, type[BaseRenderer]] = {
+    Renderer.extension: Renderer,
+    TextRenderer.extension: TextRenderer,
+    MarkdownRenderer.extension: MarkdownRenderer,
+    HTMLRenderer.extension: HTMLRenderer,
+    JSONRenderer.extension: JSONRenderer,
+}
+
+
+def get_renderer(path: Path | str, stream_render: bool = False) -> type[BaseRenderer]:
+    """
+    Получение класса создания выходного файла по его расширению.
+
+    :param Path | str path: Путь к выходному файлу.
+    :param bool stream_render: Потоковая генерация файлов Word.
+    :return: Класс создания выходного файла.
+    :raises ValueError: Формат выходного файла не поддерживается.
+    """
+
+    extension = Path(path).suffix.lower()
+    if extension not in RENDERERS:
+        raise ValueError(f"Формат выходного файла не поддерживается: {path}")
+
+    if stream_render and extension == Renderer.extension:
+        return StreamRenderer
+
+    return RENDERERS[extension]
+
+
+def check_paths(paths: Iterable[Path | str]) -> None:
+    """
+    Проверка отсутствия совпадающих путей к выходным файлам.
+
+    :param Iterable[Path | str] paths: Пути к выходным файлам.
+    :raises ValueError: Несколько выходных файлов записываются в один файл.
+    """
+
+    seen = set()
+    for path in paths:
+        resolved = Path(path).resolve()
+        if resolved in seen:
+            raise ValueError(f"Выходной файл указан несколько раз: {path}")
+        seen.add(resolved)
+
+
+def render_all(
+    rows: Iterable[str], paths: Sequence[Path | str], stream_render: bool = False
+) -> int:
+    """
+    Генерация нескольких выходных файлов за один проход по строкам списка источников.
+
+    Формат каждого файла определяется его расширением. При ошибке записи (например,
+    при получении очередной строки) недописанные файлы удаляются, а не сохраняются частично.
+    При ошибке окончания записи файла удаляются этот и еще не закрытые файлы.
+
+    :param Iterable[str] rows: Строки списка источников.
+    :param Sequence[Path | str] paths: Пути к выходным файлам.
+    :param bool stream_render: Потоковая генерация файлов Word.
+    :return: Количество записанных строк.
+    :raises ValueError: Несколько выходных файлов записываются в один файл.
+    """
+
+    check_paths(paths)
+    renderers = [get_renderer(path, stream_render)() for path in paths]
+
+    count = 0
+    opened: list[tuple[BaseRenderer, Path | str]] = []
+    try:
+        for renderer, path in zip(renderers, paths):
+            renderer.open(path)
+            opened.append((renderer, path))
+
+        for row in rows:
+            for renderer in renderers:
+                renderer.write(row)
+            count += 1
+    except BaseException:
+        for renderer, path in opened:
+            renderer.discard(path)
+        raise
+
+    for index, (renderer, _) in enumerate(opened):
+        try:
+            renderer.close()
+        except BaseException:
+            # исходная ошибка не подменяется ошибками освобождения остальных файлов
+            for rest, path in opened[index:]:
+                with suppress(Exception):
+                    rest.discard(path)
+            raise
+
+    return count
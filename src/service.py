@@ -0,0 +1,490 @@
+"""
+HTTP-сервис генерации библиографического списка.
+
+.. code-block:: console
+
+    python service.py --host 0.0.0.0 --port 8000
+
+    curl --data-binary @input.xlsx http://localhost:8000/render -o output.docx
+    curl -H "Content-Type: application/json" --data @sources.json http://localhost:8000/render -o output.docx
+"""
+from __future__ import annotations
+
+import json
+import threading
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from http import HTTPStatus
+from io import BytesIO
+from socketserver import ThreadingMixIn
+from typing import Any, Callable, Iterable, Optional
+from urllib.parse import parse_qs
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer
+from wsgiref.util import setup_testing_defaults
+
+import click
+from openpyxl.utils.exceptions import InvalidFileException
+from pydantic import BaseModel, ValidationError
+
+from formatters.models import ArticlesCollectionModel, BookModel, InternetResourceModel
+from formatters.registry import get_formatter
+from logger import get_logger
+from main import CitationEnum
+from readers.reader import SourcesReader
+from renderer import StreamRenderer
+from settings import SERVICE_MAX_REQUESTS, SERVICE_MAX_UPLOAD_SIZE, SERVICE_WORKERS
+
+logger = get_logger(__name__)
+
+# MIME-тип выходного файла Word
+DOCX_CONTENT_TYPE = (
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+)
+
+# разделы JSON-запроса и соответствующие им модели источников
+PAYLOAD_MODELS: dict[str, type[BaseModel]] = {
+    "books": BookModel,
+    "internet_resources": InternetResourceModel,
+    "articles_collections": ArticlesCollectionModel,
+}
+
+StartResponse = Callable[[str, list[tuple[str, str]]], Any]
+
+
+def render_models(
+    models: Iterable[BaseModel], citation: str = CitationEnum.GOST.name
+) -> bytes:
+    """
+    Форматирование списка источников и генерация файла Word в памяти.
+
+    :param models: Модели источников.
+    :param citation: Стиль цитирования.
+    :return: Содержимое файла Word.
+    """
+
+    rows = tuple(str(item) for item in get_formatter(citation)(models).format())
+
+    return StreamRenderer(rows).render_bytes()
+
+
+def render_workbook(content: bytes, citation: str = CitationEnum.GOST.name) -> bytes:
+    """
+    Генерация файла Word по содержимому входного файла Excel.
+
+    :param content: Содержимое входного файла Excel.
+    :param citation: Стиль цитирования.
+    :return: Содержимое файла Word.
+    :raises ValueError: Входной файл некорректен.
+    """
+
+    try:
+        reader = SourcesReader(BytesIO(content), streaming=True)
+        try:
+            models = reader.read()
+        finally:
+            reader.close()
+    except (InvalidFileException, zipfile.BadZipFile, KeyError) as ex:
+        raise ValueError(f"Некорректный входной файл: {ex}") from None
+    except ValidationError as ex:
+        raise ValueError(str(ex)) from None
+
+    return render_models(models, citation)
+
+
+def render_payload(
+    payload: dict[str, list[dict[str, Any]]], citation: str = CitationEnum.GOST.name
+) -> bytes:
+    """
+    Генерация файла Word по JSON-описанию источников.
+
+    .. code-block::
+
+        {
+            "books": [{"authors": "Иванов И.М.", "title": "Наука как искусство", ...}],
+            "internet_resources": [...],
+            "articles_collections": [...]
+        }
+
+    :param payload: Источники, сгруппированные по типам.
+    :param citation: Стиль цитирования.
+    :return: Содержимое файла Word.
+    :raises ValueError: Описание источников некорректно.
+    """
+
+    if not isinstance(payload, dict) or not set(payload) <= set(PAYLOAD_MODELS):
+        raise ValueError(f"Ожидается объект с разделами: {', '.join(PAYLOAD_MODELS)}")
+
+    try:
+        models = [
+            PAYLOAD_MODELS[section](**item)
+            for section, items in payload.items()
+            for item in items
+        ]
+    except (TypeError, ValidationError) as ex:
+        raise ValueError(str(ex)) from None
+
+    return render_models(models, citation)
+
+
+class BibliographyService:
+    """
+    WSGI-приложение сервиса генерации библиографического списка.
+
+    Запросы обрабатываются пулом процессов ограниченного размера. Процессы пула
+    создаются один раз и сохраняют загруженные зависимости и шаблоны стилей
+    между запросами.
+    """
+
+    def __init__(
+        self,
+        workers: int = SERVICE_WORKERS,
+        max_upload_size: int = SERVICE_MAX_UPLOAD_SIZE,
+    ) -> None:
+        """
+        Конструктор.
+
+        :param workers: Количество процессов для обработки запросов.
+        :param max_upload_size: Максимальный размер тела запроса в байтах.
+        """
+
+        self.max_upload_size = max_upload_size
+        self.executor = ProcessPoolExecutor(max_workers=workers)
+
+    def __call__(
+        self, environ: dict[str, Any], start_response: StartResponse
+    ) -> Iterable[bytes]:
+        """
+        Обработка WSGI-запроса.
+
+        :param environ: Окружение WSGI-запроса.
+        :param start_response: Функция начала WSGI-ответа.
+        :return: Тело ответа.
+        """
+
+        method = environ.get("REQUEST_METHOD", "GET")
+        path = environ.get("PATH_INFO", "/")
+
+        if path == "/health" and method == "GET":
+            return self.respond(start_response, HTTPStatus.OK, b"ok", "text/plain")
+
+        if path != "/render":
+            return self.error(start_response, HTTPStatus.NOT_FOUND, "Не найдено")
+        if method != "POST":
+            return self.error(
+                start_response, HTTPStatus.METHOD_NOT_ALLOWED, "Ожидается POST-запрос"
+            )
+
+        try:
+            return self.render(environ, start_response)
+        except ValueError as ex:
+            return self.error(start_response, HTTPStatus.BAD_REQUEST, str(ex))
+        except Exception as ex:
+            logger.error("При обработке запроса возникла ошибка: %s", ex)
+            return self.error(
+                start_response, HTTPStatus.INTERNAL_SERVER_ERROR, "Внутренняя ошибка"
+            )
+
+    def render(
+        self, environ: dict[str, Any], start_response: StartResponse
+    ) -> Iterable[bytes]:
+        """
+        Обработка запроса на генерацию библиографического списка.
+
+        :param environ: Окружение WSGI-запроса.
+        :param start_response: Функция начала WSGI-ответа.
+        :return: Тело ответа.
+        """
+
+        query = parse_qs(environ.get("QUERY_STRING", ""))
+        citation = query.get("citation", [CitationEnum.GOST.name])[0].upper()
+        # проверка стиля до чтения тела запроса (:class:`ValueError` для неизвестного стиля)
+        get_formatter(citation)
+
+        # размер тела запроса проверяется до его чтения
+        # (тело без указанного размера не читается, см. RFC 9110, 411 Length Required)
+        content_length = environ.get("CONTENT_LENGTH")
+        if not content_length:
+            return self.error(
+                start_response,
+                HTTPStatus.LENGTH_REQUIRED,
+                "Не указан размер тела запроса (Content-Length)",
+            )
+        if not content_length.isdigit():
+            raise ValueError(f"Некорректный размер тела запроса: {content_length}")
+
+        length = int(content_length)
+        if length > self.max_upload_size:
+            return self.error(
+                start_response,
+                HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                "Превышен максимальный размер входного файла",
+            )
+        body = environ["wsgi.input"].read(length)
+
+        if environ.get("CONTENT_TYPE", "").startswith("application/json"):
+            try:
+                payload = json.loads(body)
+            except json.JSONDecodeError as ex:
+                raise ValueError(f"Некорректный JSON: {ex}") from None
+            future = self.executor.submit(render_payload, payload, citation)
+        else:
+            future = self.executor.submit(render_workbook, body, citation)
+
+        return self.respond(
+            start_response,
+            HTTPStatus.OK,
+            future.result(),
+            DOCX_CONTENT_TYPE,
+            [("Content-Disposition", 'attachment; filename="output.docx"')],
+        )
+
+    @staticmethod
+    def respond(
+        start_response: StartResponse,
+        status: HTTPStatus,
+        body: bytes,
+        content_type: str,
+        headers: Optional[list[tuple[str, str]]] = None,
+    ) -> Iterable[bytes]:
+        """
+        Формирование ответа.
+
+        :param start_response: Функция начала WSGI-ответа.
+        :param status: Статус ответа.
+        :param body: Тело ответа.
+        :param content_type: MIME-тип тела ответа.
+        :param headers: Дополнительные заголовки ответа.
+        :return: Тело ответа.
+        """
+
+        start_response(
+            f"{status.value} {status.phrase}",
+            [
+                ("Content-Type", content_type),
+                ("Content-Length", str(len(body))),
+                *(headers or []),
+            ],
+        )
+
+        return [body]
+
+    def error(
+        self, start_response: StartResponse, status: HTTPStatus, message: str
+    ) -> Iterable[bytes]:
+        """
+        Формирование ответа с ошибкой.
+
+        :param start_response: Функция начала WSGI-ответа.
+        :param status: Статус ответа.
+        :param message: Описание ошибки.
+        :return: Тело ответа.
+        """
+
+        body = json.dumps({"error": message}, ensure_ascii=False).encode("utf-8")
+
+        return self.respond(start_response, status, body, "application/json")
+
+    def close(self) -> None:
+        """
+        Остановка пула процессов.
+        """
+
+        self.executor.shutdown()
+
+
+class ServiceClient:
+    """
+    Клиент для вызова сервиса внутри процесса (без сетевого соединения), например, в тестах.
+    """
+
+    def __init__(self, app: BibliographyService) -> None:
+        """
+        Конструктор.
+
+        :param app: WSGI-приложение сервиса.
+        """
+
+        self.app = app
+
+    def request(  # pylint: disable=too-many-arguments
+        self,
+        method: str,
+        path: str,
+        body: bytes = b"",
+        content_type: str = "application/octet-stream",
+        extra: Optional[dict[str, Any]] = None,
+    ) -> tuple[int, dict[str, str], bytes]:
+        """
+        Выполнение запроса к сервису.
+
+        :param method: HTTP-метод.
+        :param path: Путь запроса (может содержать параметры запроса).
+        :param body: Тело запроса.
+        :param content_type: MIME-тип тела запроса.
+        :param extra: Дополнительные переменные окружения запроса
+            (переменные со значением `None` удаляются).
+        :return: Код статуса, заголовки и тело ответа.
+        """
+
+        path_info, _, query = path.partition("?")
+        environ: dict[str, Any] = {
+            "REQUEST_METHOD": method,
+            "PATH_INFO": path_info,
+            "QUERY_STRING": query,
+            "CONTENT_TYPE": content_type,
+            "CONTENT_LENGTH": str(len(body)),
+            "wsgi.input": BytesIO(body),
+        }
+        for name, value in (extra or {}).items():
+            if value is None:
+                environ.pop(name, None)
+            else:
+                environ[name] = value
+        setup_testing_defaults(environ)
+
+        response: dict[str, Any] = {}
+
+        def start_response(status: str, headers: list[tuple[str, str]]) -> None:
+            response["status"] = int(status.split()[0])
+            response["headers"] = dict(headers)
+
+        content = b"".join(self.app(environ, start_response))
+
+        return response["status"], response["headers"], content
+
+    def post(
+        self, path: str, body: bytes, content_type: str = "application/octet-stream"
+    ) -> tuple[int, dict[str, str], bytes]:
+        """
+        Выполнение POST-запроса к сервису.
+
+        :param path: Путь запроса.
+        :param body: Тело запроса.
+        :param content_type: MIME-тип тела запроса.
+        :return: Код статуса, заголовки и тело ответа.
+        """
+
+        return self.request("POST", path, body, content_type)
+
+
+class ThreadingWSGIServer(ThreadingMixIn, WSGIServer):
+    """
+    WSGI-сервер, обрабатывающий соединения в отдельных потоках.
+
+    Количество одновременно обрабатываемых соединений ограничено: при достижении
+    ограничения новые соединения не принимаются и ожидают в очереди сокета.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self, *args: Any, max_requests: int = SERVICE_MAX_REQUESTS, **kwargs: Any
+    ) -> None:
+        """
+        Конструктор.
+
+        :param args: Параметры сервера (адрес и класс обработчика запросов).
+        :param max_requests: Максимальное количество одновременно обрабатываемых соединений.
+        :param kwargs: Именованные параметры сервера.
+        """
+
+        super().__init__(*args, **kwargs)
+        self.slots = threading.BoundedSemaphore(max_requests)
+
+    def process_request(self, request: Any, client_address: Any) -> None:
+        """
+        Запуск обработки соединения в отдельном потоке (с ожиданием свободного места).
+
+        :param request: Соединение.
+        :param client_address: Адрес клиента.
+        """
+
+        # место освобождается в потоке обработки соединения
+        self.slots.acquire()  # pylint: disable=consider-using-with
+        try:
+            super().process_request(request, client_address)
+        except Exception:
+            self.slots.release()
+            raise
+
+    def process_request_thread(self, request: Any, client_address: Any) -> None:
+        """
+        Обработка соединения в отдельном потоке.
+
+        :param request: Соединение.
+        :param client_address: Адрес клиента.
+        """
+
+        try:
+            super().process_request_thread(request, client_address)
+        finally:
+            self.slots.release()
+
+
+@click.command()
+@click.option(
+    "--host",
+    "host",
+    type=str,
+    default="127.0.0.1",
+    show_default=True,
+    help="Адрес для входящих соединений",
+)
+@click.option(
+    "--port",
+    "-p",
+    "port",
+    type=int,
+    default=8000,
+    show_default=True,
+    help="Порт для входящих соединений",
+)
+@click.option(
+    "--workers",
+    "-w",
+    "workers",
+    type=click.IntRange(min=1),
+    default=SERVICE_WORKERS,
+    show_default=True,
+    help="Количество процессов для обработки запросов",
+)
+@click.option(
+    "--max_requests",
+    "-mr",
+    "max_requests",
+    type=click.IntRange(min=1),
+    default=SERVICE_MAX_REQUESTS,
+    show_default=True,
+    help="Максимальное количество одновременно обрабатываемых соединений",
+)
+def serve(
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    workers: int = SERVICE_WORKERS,
+    max_requests: int = SERVICE_MAX_REQUESTS,
+) -> None:
+    """
+    Запуск HTTP-сервиса генерации библиографического списка.
+
+    :param str host: Адрес для входящих соединений
+    :param int port: Порт для входящих соединений
+    :param int workers: Количество процессов для обработки запросов
+    :param int max_requests: Максимальное количество одновременно обрабатываемых соединений
+    """
+
+    app = BibliographyService(workers=workers)
+    with ThreadingWSGIServer(
+        (host, port), WSGIRequestHandler, max_requests=max_requests
+    ) as server:
+        server.set_app(app)
+        logger.info(
+            "Сервис запущен: http://%s:%s (процессов: %s).", host, port, workers
+        )
+        try:
+            server.serve_forever()
+        finally:
+            app.close()
+
+
+if __name__ == "__main__":
+    serve()  # pylint: disable=no-value-for-parameter
@@ -14,9 +14,79 @@ OUTPUT_FILE_PATH: str = os.getenv("OUTPUT_FILE_PATH", "../media/output.docx")
 
 # путь к директории для логирования
 LOGGING_PATH: str = os.getenv("LOGGING_PATH", "../logs")
+# наименование общего файла логов в директории для логирования
+LOGGING_FILE_NAME: str = os.getenv("LOGGING_FILE_NAME", "app.log")
+# количество записей логов, накапливаемых в буфере перед записью в файл
+LOGGING_BUFFER_SIZE: int = int(os.getenv("LOGGING_BUFFER_SIZE", "100"))
 # формат для записей логов
 LOGGING_FORMAT: str = os.getenv(
     "LOGGING_FORMAT", "%(name)s %(asctime)s %(levelname)s %(message)s"
 )
 # уровень логирования
 LOGGING_LEVEL: str = os.getenv("LOGGING_LEVEL", "INFO")
+# количество обработанных элементов между записями логов о прогрессе обработки
+LOGGING_PROGRESS_EVERY: int = int(os.getenv("LOGGING_PROGRESS_EVERY", "10000"))
+# количество элементов этапа обработки, получаемых за один замер времени и памяти
+INSTRUMENTATION_BATCH_SIZE: int = int(os.getenv("INSTRUMENTATION_BATCH_SIZE", "1000"))
+
+# количество процессов для параллельного чтения листов входного файла (1 – последовательное чтение)
+READER_WORKERS: int = int(os.getenv("READER_WORKERS", "1"))
+# максимальное количество строк листа, читаемых одним процессом при параллельном чтении
+READER_CHUNK_SIZE: int = int(os.getenv("READER_CHUNK_SIZE", "50000"))
+# количество строк листа, проверяемых одним пакетом в режиме доверенных данных
+READER_BATCH_SIZE: int = int(os.getenv("READER_BATCH_SIZE", "10000"))
+# максимальный объем памяти (в байтах) для строк текстового файла, отложенных до чтения
+# их листа (при превышении строки сохраняются во временный файл)
+READER_SPOOL_SIZE: int = int(os.getenv("READER_SPOOL_SIZE", str(16 * 2**20)))
+
+# количество процессов для параллельного форматирования (1 – последовательное форматирование)
+FORMATTER_WORKERS: int = int(os.getenv("FORMATTER_WORKERS", "1"))
+# количество строк списка источников, форматируемых одним заданием процесса
+FORMATTER_CHUNK_SIZE: int = int(os.getenv("FORMATTER_CHUNK_SIZE", "10000"))
+# минимальное количество строк для параллельного форматирования
+# (меньшие списки форматируются последовательно)
+FORMATTER_PARALLEL_THRESHOLD: int = int(
+    os.getenv("FORMATTER_PARALLEL_THRESHOLD", "50000")
+)
+# максимальное количество различных значений фрагментов строк (например, информации
+# об издании), отформатированных один раз и переиспользуемых для всех источников
+FORMATTER_FRAGMENT_CACHE_SIZE: int = int(
+    os.getenv("FORMATTER_FRAGMENT_CACHE_SIZE", "10000")
+)
+# максимальное количество авторов в описании источника (остальные сокращаются до "и др.",
+# 0 – все авторы приводятся полностью)
+FORMATTER_AUTHORS_LIMIT: int = int(os.getenv("FORMATTER_AUTHORS_LIMIT", "0"))
+# максимальное количество различных списков авторов, разобранных один раз
+# и переиспользуемых для всех источников
+FORMATTER_AUTHORS_CACHE_SIZE: int = int(
+    os.getenv("FORMATTER_AUTHORS_CACHE_SIZE", "100000")
+)
+
+# путь к файлу постоянного кэша отформатированных строк
+CACHE_PATH: str = os.getenv("CACHE_PATH", "../cache/formatted.sqlite3")
+# максимальное количество записей в кэше отформатированных строк
+CACHE_MAX_ENTRIES: int = int(os.getenv("CACHE_MAX_ENTRIES", "1000000"))
+# количество изменений кэша отформатированных строк, сохраняемых одной транзакцией
+CACHE_BATCH_SIZE: int = int(os.getenv("CACHE_BATCH_SIZE", "10000"))
+# время ожидания (в секундах) освобождения файла кэша другим процессом
+CACHE_BUSY_TIMEOUT: float = float(os.getenv("CACHE_BUSY_TIMEOUT", "30"))
+
+# максимальное количество строк списка источников, сортируемых в памяти
+# (при превышении выполняется внешняя сортировка слиянием через временные файлы)
+COLLATION_BUFFER_SIZE: int = int(os.getenv("COLLATION_BUFFER_SIZE", "100000"))
+# максимальный объем памяти строк списка источников, сортируемых в памяти, в байтах
+COLLATION_MEMORY_LIMIT: int = int(
+    os.getenv("COLLATION_MEMORY_LIMIT", str(64 * 2**20))
+)
+
+# количество процессов для пакетной обработки входных файлов
+BATCH_WORKERS: int = int(os.getenv("BATCH_WORKERS", str(os.cpu_count() or 1)))
+
+# количество процессов HTTP-сервиса для обработки запросов
+SERVICE_WORKERS: int = int(os.getenv("SERVICE_WORKERS", str(os.cpu_count() or 1)))
+# максимальный размер тела запроса к HTTP-сервису в байтах
+SERVICE_MAX_UPLOAD_SIZE: int = int(
+    os.getenv("SERVICE_MAX_UPLOAD_SIZE", str(50 * 2**20))
+)
+# максимальное количество соединений, одновременно обрабатываемых HTTP-сервисом
+SERVICE_MAX_REQUESTS: int = int(os.getenv("SERVICE_MAX_REQUESTS", "32"))
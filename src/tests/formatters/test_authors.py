@@ -0,0 +1,164 @@
+"""
+Тестирование разбора и нормализации списка авторов.
+"""
+
+import pytest
+
+from formatters.authors import (
+    Author,
+    format_authors,
+    format_authors_apa,
+    format_authors_mla,
+    parse_authors,
+)
+from formatters.models import BookModel
+from formatters.styles.gost import GOSTBook
+
+
+class TestAuthors:
+    """
+    Тестирование разбора и нормализации списка авторов.
+    """
+
+    @pytest.mark.parametrize(
+        "authors, expected",
+        [
+            ("Иванов И.М., Петров С.Н.", "Иванов И.М., Петров С.Н."),
+            ("Иванов  и. м.;И. М. Петров", "Иванов И.М., Петров И.М."),
+            ("Толкин Дж. Р.", "Толкин Дж.Р."),
+            ("Салтыков-Щедрин М", "Салтыков-Щедрин М."),
+            (
+                "Иванов И.М., Петров С.Н., Сидоров А.А., Попов В.П.",
+                "Иванов И.М., Петров С.Н., Сидоров А.А., Попов В.П.",
+            ),
+            ("Иванов И.М. и др.", "Иванов И.М. и др."),
+            ("Иванов И. М., Петров С. Н., и др", "Иванов И.М., Петров С.Н. и др."),
+            ("Smith J. [et al.]", "Smith J. et al."),
+            ("Smith, J., Doe, A. B.", "Smith J., Doe A.B."),
+            ("Smith, J.; Doe J., Roe", "Smith J., Doe J., Roe"),
+            ("", ""),
+        ],
+    )
+    def test_format_authors(self, authors: str, expected: str) -> None:
+        """
+        Тестирование нормализации инициалов и списка авторов.
+
+        :param str authors: Список авторов
+        :param str expected: Ожидаемый нормализованный список авторов
+        """
+
+        assert format_authors(authors) == expected
+
+    @pytest.mark.parametrize(
+        "authors, expected",
+        [
+            (
+                "Иванов И.М., Петров С.Н., Сидоров А.А., Попов В.П.",
+                "Иванов И.М., Петров С.Н., Сидоров А.А. и др.",
+            ),
+            ("Smith J., Doe J., Roe R., Poe E.A.", "Smith J., Doe J., Roe R. et al."),
+            (
+                "Иванов И.М., Петров С.Н., Сидоров А.А.",
+                "Иванов И.М., Петров С.Н., Сидоров А.А.",
+            ),
+            (
+                "Иванов И.М., Петров С.Н., Сидоров А.А., Попов В.П., и др.",
+                "Иванов И.М., Петров С.Н., Сидоров А.А. и др.",
+            ),
+        ],
+    )
+    def test_format_authors_limit(self, authors: str, expected: str) -> None:
+        """
+        Тестирование сокращения списка авторов до заданного количества.
+
+        :param str authors: Список авторов
+        :param str expected: Ожидаемый сокращенный список авторов
+        """
+
+        assert format_authors(authors, limit=3) == expected
+
+    def test_parse_authors(self) -> None:
+        """
+        Тестирование разбора авторов на фамилию и инициалы с кэшированием результата.
+        """
+
+        parse_authors.cache_clear()
+        authors = "Иванов И.М., Петров С.Н."
+
+        assert parse_authors(authors) == (
+            Author("Иванов", "И.М."),
+            Author("Петров", "С.Н."),
+        )
+        # повторный разбор того же списка – обращение к кэшу
+        assert parse_authors("".join(authors)) is parse_authors(authors)
+        assert parse_authors.cache_info().hits == 2
+
+        # сокращение "и др." не считается автором, инициалы после запятой
+        # относятся к предыдущему автору
+        assert parse_authors("Smith, J., Doe, A. et al.") == (
+            Author("Smith", "J."),
+            Author("Doe", "A."),
+        )
+
+    def test_gost_heading(self, book_model_fixture: BookModel) -> None:
+        """
+        Тестирование нормализации авторов в описании по ГОСТ.
+
+        :param BookModel book_model_fixture: Фикстура модели книги
+        """
+
+        model = book_model_fixture.copy(
+            update={"authors": "И. М. Иванов, петров с.н., Сидоров А.А., Попов В.П."}
+        )
+
+        assert GOSTBook(model).formatted == (
+            "Иванов И.М., петров С.Н., Сидоров А.А., Попов В.П. Наука как искусство. "
+            "– 3-е изд. – СПб.: Просвещение, 2020. – 999 с."
+        )
+
+    @pytest.mark.parametrize(
+        "authors, mla, apa",
+        [
+            ("Иванов И.М.", "Иванов, И.М.", "Иванов, И. М."),
+            (
+                "Иванов И.М., Петров С.Н.",
+                "Иванов, И.М., and С.Н. Петров.",
+                "Иванов, И. М., & Петров, С. Н.",
+            ),
+            (
+                "Smith J., Doe J. R., Roe",
+                "Smith, J., et al.",
+                "Smith, J., Doe, J. R., & Roe.",
+            ),
+            (
+                "Иванов И.М., Петров С.Н. и др.",
+                "Иванов, И.М., et al.",
+                "Иванов, И. М., Петров, С. Н., et al.",
+            ),
+            ("Smith, J., Doe, A.", "Smith, J., and A. Doe.", "Smith, J., & Doe, A."),
+            ("", "", ""),
+        ],
+    )
+    def test_format_authors_styles(self, authors: str, mla: str, apa: str) -> None:
+        """
+        Тестирование форматирования списка авторов по MLA и APA.
+
+        :param str authors: Список авторов
+        :param str mla: Ожидаемый список авторов по MLA
+        :param str apa: Ожидаемый список авторов по APA
+        """
+
+        assert format_authors_mla(authors) == mla
+        assert format_authors_apa(authors) == apa
+
+    def test_format_authors_apa_many(self) -> None:
+        """
+        Тестирование сокращения списка из более чем 20 авторов по APA.
+        """
+
+        authors = ", ".join(f"Автор{index} А.А." for index in range(1, 23))
+        formatted = format_authors_apa(authors)
+
+        assert formatted.startswith("Автор1, А. А., Автор2, А. А., ")
+        assert "Автор19, А. А., . . . Автор22, А. А." in formatted
+        assert "Автор20" not in formatted
@@ -0,0 +1,92 @@
+"""
+Тестирование функций сортировки списка источников.
+"""
+
+import pytest
+
+from formatters.collation import iter_buffers, sort_columns, sort_items, sort_key
+
+
+class TestCollation:
+    """
+    Тестирование сортировки списка источников.
+    """
+
+    rows = [
+        "Smith J. Science as art. – London: Springer, 2020. – 100 p.",
+        "«Ёлкин Е.Е.» Наука. – М.: АСТ, 2020. – 10 с.",
+        "андреев А.А. Наука. – М.: АСТ, 2020. – 10 с.",
+        "Adams D. Science. – London: Springer, 2020. – 100 p.",
+        "Елкин Е.Е. Наука. – М.: АСТ, 2020. – 10 с.",
+        "Баранов А.Н. Наука. – М.: АСТ, 2020. – 10 с.",
+    ]
+
+    expected = [
+        "андреев А.А. Наука. – М.: АСТ, 2020. – 10 с.",
+        "Баранов А.Н. Наука. – М.: АСТ, 2020. – 10 с.",
+        "Елкин Е.Е. Наука. – М.: АСТ, 2020. – 10 с.",
+        "«Ёлкин Е.Е.» Наука. – М.: АСТ, 2020. – 10 с.",
+        "Adams D. Science. – London: Springer, 2020. – 100 p.",
+        "Smith J. Science as art. – London: Springer, 2020. – 100 p.",
+    ]
+
+    def test_sort_key(self) -> None:
+        """
+        Тестирование ключа сортировки: кириллица перед латиницей, без учета регистра,
+        знаков препинания в начале строки и различия "ё" и "е".
+        """
+
+        assert sorted(self.rows, key=sort_key) == self.expected
+        assert sort_key("«Ёлкин") == sort_key("елкин")
+
+    @pytest.mark.parametrize(
+        "first, second",
+        [
+            # буквы кириллицы вне основного блока и латиница с диакритикой
+            ("ԁ", "a"),
+            ("яблоко", "ábaco"),
+            ("Ärger", "ω"),
+            ("zebra", "ǆ"),
+            # остальные письменности следуют после латиницы
+            ("zorn", "ω"),
+            # цифры предшествуют буквам
+            ("2020", "Ааронов"),
+        ],
+    )
+    def test_sort_key_scripts(self, first: str, second: str) -> None:
+        """
+        Тестирование порядка письменностей в ключе сортировки.
+
+        :param str first: Строка, предшествующая при сортировке
+        :param str second: Строка, следующая при сортировке
+        """
+
+        assert sort_key(first) < sort_key(second)
+
+    def test_sort_items_external(self) -> None:
+        """
+        Тестирование внешней сортировки слиянием при переполнении буфера.
+        """
+
+        assert (
+            list(sort_items(iter(self.rows), sort_key, buffer_size=2)) == self.expected
+        )
+        assert list(sort_items(self.rows, sort_key, buffer_size=100)) == self.expected
+        assert not list(sort_items([], sort_key, buffer_size=2))
+
+    def test_sort_columns(self) -> None:
+        """
+        Тестирование сортировки столбцов строк с ограничением объема памяти буфера.
+        """
+
+        rows = [(row, row.upper()) for row in self.rows]
+        expected = [self.expected, [row.upper() for row in self.expected]]
+
+        # в буфер помещается одна строка
+        buffers = list(iter_buffers(rows, memory_limit=1))
+        assert len(buffers) == len(rows)
+        assert [last for _, last in buffers] == [False] * (len(rows) - 1) + [True]
+
+        for memory_limit in (1, 10**6):
+            columns = sort_columns(iter(rows), 2, sort_key, memory_limit=memory_limit)
+            assert [list(column) for column in columns] == expected
@@ -4,7 +4,13 @@
 
 from formatters.base import BaseCitationFormatter
 from formatters.models import BookModel, InternetResourceModel, ArticlesCollectionModel
-from formatters.styles.gost import GOSTBook, GOSTInternetResource, GOSTCollectionArticle
+from formatters.styles.base import BaseCitationStyle, format_edition
+from formatters.styles.gost import (
+    GOSTBook,
+    GOSTCitationFormatter,
+    GOSTCollectionArticle,
+    GOSTInternetResource,
+)
 
 
 class TestGOST:
@@ -61,6 +67,25 @@ class TestGOST:
             == "Иванов И.М., Петров С.Н. Наука как искусство // Сборник научных трудов. – СПб.: АСТ, 2020. – С. 25-30."
         )
 
+    def test_template_registry(self, book_model_fixture: BookModel) -> None:
+        """
+        Тестирование реестра скомпилированных шаблонов.
+
+        :param BookModel book_model_fixture: Фикстура модели книги
+        :return:
+        """
+
+        # шаблон компилируется один раз и переиспользуется всеми объектами стиля
+        assert (
+            GOSTBook(book_model_fixture).template
+            is GOSTBook(book_model_fixture).template
+        )
+
+        template = BaseCitationStyle.compile_template("{$name} $$ ${value}%")
+        assert (
+            BaseCitationStyle.templates[template.template][1] == "{{{name}}} $ {value}%"
+        )
+
     def test_citation_formatter(
         self,
         book_model_fixture: BookModel,
@@ -87,3 +112,58 @@ class TestGOST:
         assert result[0] == models[2]
         assert result[1] == models[0]
         assert result[2] == models[1]
+
+    def test_parallel_formatter(
+        self,
+        book_model_fixture: BookModel,
+        internet_resource_model_fixture: InternetResourceModel,
+        articles_collection_model_fixture: ArticlesCollectionModel,
+    ) -> None:
+        """
+        Тестирование параллельного форматирования списка источников частями.
+
+        :param BookModel book_model_fixture: Фикстура модели книги
+        :param InternetResourceModel internet_resource_model_fixture: Фикстура модели интернет-ресурса
+        :param ArticlesCollectionModel articles_collection_model_fixture: Фикстура модели сборника статей
+        """
+
+        models = [
+            book_model_fixture,
+            internet_resource_model_fixture,
+            articles_collection_model_fixture,
+        ] * 3
+        expected = [str(item) for item in GOSTCitationFormatter(models).format()]
+
+        result = GOSTCitationFormatter(
+            iter(models), workers=2, chunk_size=2, threshold=0
+        ).format()
+        assert [str(item) for item in result] == expected
+        assert all(isinstance(item, BaseCitationStyle) for item in result)
+        assert result[0].data == articles_collection_model_fixture
+
+        # меньше порогового количества строк – последовательное форматирование
+        result = GOSTCitationFormatter(models, workers=2, threshold=100).format()
+        assert [str(item) for item in result] == expected
+
+    def test_fragments(self, book_model_fixture: BookModel) -> None:
+        """
+        Тестирование переиспользования фрагментов строк с одинаковыми значениями.
+
+        :param BookModel book_model_fixture: Фикстура модели книги
+        """
+
+        format_edition.cache_clear()
+        books = [
+            GOSTBook(book_model_fixture.copy(update={"title": f"Книга {number}"}))
+            for number in range(3)
+        ]
+
+        assert books[2].formatted == (
+            "Иванов И.М., Петров С.Н. Книга 2. – 3-е изд. – СПб.: Просвещение, 2020. – 999 с."
+        )
+        # информация об издании форматируется один раз
+        # (pylint принимает функцию, обернутую lru_cache, за исходную функцию)
+        # pylint: disable-next=no-value-for-parameter
+        cache_info = format_edition.cache_info()
+        assert cache_info.misses == 1
+        assert cache_info.hits == 2
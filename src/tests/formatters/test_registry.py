@@ -0,0 +1,54 @@
+"""
+Тестирование реестра стилей цитирования.
+"""
+from typing import Iterator
+
+import pytest
+from pydantic import BaseModel
+
+from formatters.models import BookModel, InternetResourceModel
+from formatters.registry import STYLES, format_styles, get_formatter
+
+
+class TestRegistry:
+    """
+    Тестирование реестра стилей цитирования.
+    """
+
+    def test_get_formatter(self) -> None:
+        """
+        Тестирование получения класса форматирования по наименованию стиля.
+        """
+
+        assert get_formatter("mla") is STYLES["MLA"]
+
+        with pytest.raises(ValueError):
+            get_formatter("chicago")
+
+    def test_format_styles(
+        self,
+        book_model_fixture: BookModel,
+        internet_resource_model_fixture: InternetResourceModel,
+    ) -> None:
+        """
+        Тестирование форматирования в нескольких стилях за один проход по моделям.
+
+        :param BookModel book_model_fixture: Фикстура модели книги
+        :param InternetResourceModel internet_resource_model_fixture: Фикстура модели интернет-ресурса
+        """
+
+        def models() -> Iterator[BaseModel]:
+            # итератор может быть пройден только один раз
+            yield book_model_fixture
+            yield internet_resource_model_fixture
+
+        result = format_styles(models(), list(STYLES))
+
+        assert len(result) == len(STYLES)
+        for style, items in zip(STYLES.values(), result):
+            assert [str(item) for item in items] == [
+                str(item)
+                for item in style(
+                    [book_model_fixture, internet_resource_model_fixture]
+                ).format()
+            ]
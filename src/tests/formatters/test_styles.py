@@ -0,0 +1,136 @@
+"""
+Тестирование функций оформления списка источников в стилях MLA (Modern Language Association)
+и APA (American Psychological Association).
+"""
+from typing import Type
+
+import pytest
+
+from formatters.base import StyleCitationFormatter
+from formatters.models import BookModel, InternetResourceModel, ArticlesCollectionModel
+from formatters.styles.apa import APACitationFormatter
+from formatters.styles.mla import MLACitationFormatter
+
+# ожидаемые строки для книги, интернет-ресурса и статьи из сборника по стилям
+EXPECTED = {
+    MLACitationFormatter: (
+        "Иванов, И.М., and С.Н. Петров. Наука как искусство. 3-е изд., Просвещение, 2020.",
+        '"Наука как искусство." Ведомости, https://www.vedomosti.ru. Accessed 01.01.2021.',
+        'Иванов, И.М., and С.Н. Петров. "Наука как искусство." Сборник научных трудов, АСТ, '
+        "2020, pp. 25-30.",
+    ),
+    APACitationFormatter: (
+        "Иванов, И. М., & Петров, С. Н. (2020). Наука как искусство (3-е изд.). Просвещение.",
+        "Наука как искусство. (n.d.). Ведомости. Retrieved 01.01.2021, from https://www.vedomosti.ru",
+        "Иванов, И. М., & Петров, С. Н. (2020). Наука как искусство. "
+        "In Сборник научных трудов (pp. 25-30). АСТ.",
+    ),
+}
+
+# ожидаемый порядок источников (индексы строк в `EXPECTED`) после сортировки по стилям
+ORDER = {
+    MLACitationFormatter: (2, 0, 1),
+    APACitationFormatter: (0, 2, 1),
+}
+
+
+@pytest.mark.parametrize("formatter", list(EXPECTED))
+class TestStyles:
+    """
+    Тестирование оформления списка источников в стилях MLA и APA.
+    """
+
+    def test_book(
+        self, formatter: Type[StyleCitationFormatter], book_model_fixture: BookModel
+    ) -> None:
+        """
+        Тестирование форматирования книги.
+
+        :param formatter: Класс форматирования списка источников в стиле цитирования
+        :param BookModel book_model_fixture: Фикстура модели книги
+        """
+
+        model = formatter.formatters_map[BookModel](book_model_fixture)
+
+        assert model.formatted == EXPECTED[formatter][0]
+
+    def test_book_without_edition(
+        self, formatter: Type[StyleCitationFormatter], book_model_fixture: BookModel
+    ) -> None:
+        """
+        Тестирование форматирования книги без указания издания.
+
+        :param formatter: Класс форматирования списка источников в стиле цитирования
+        :param BookModel book_model_fixture: Фикстура модели книги
+        """
+
+        model = formatter.formatters_map[BookModel](
+            book_model_fixture.copy(update={"edition": None})
+        )
+
+        assert "изд." not in model.formatted
+
+    def test_internet_resource(
+        self,
+        formatter: Type[StyleCitationFormatter],
+        internet_resource_model_fixture: InternetResourceModel,
+    ) -> None:
+        """
+        Тестирование форматирования интернет-ресурса.
+
+        :param formatter: Класс форматирования списка источников в стиле цитирования
+        :param InternetResourceModel internet_resource_model_fixture: Фикстура модели интернет-ресурса
+        """
+
+        model = formatter.formatters_map[InternetResourceModel](
+            internet_resource_model_fixture
+        )
+
+        assert model.formatted == EXPECTED[formatter][1]
+
+    def test_articles_collection(
+        self,
+        formatter: Type[StyleCitationFormatter],
+        articles_collection_model_fixture: ArticlesCollectionModel,
+    ) -> None:
+        """
+        Тестирование форматирования сборника статей.
+
+        :param formatter: Класс форматирования списка источников в стиле цитирования
+        :param ArticlesCollectionModel articles_collection_model_fixture: Фикстура модели сборника статей
+        """
+
+        model = formatter.formatters_map[ArticlesCollectionModel](
+            articles_collection_model_fixture
+        )
+
+        assert model.formatted == EXPECTED[formatter][2]
+
+    def test_citation_formatter(
+        self,
+        formatter: Type[StyleCitationFormatter],
+        book_model_fixture: BookModel,
+        internet_resource_model_fixture: InternetResourceModel,
+        articles_collection_model_fixture: ArticlesCollectionModel,
+    ) -> None:
+        """
+        Тестирование функции итогового форматирования списка источников.
+
+        :param formatter: Класс форматирования списка источников в стиле цитирования
+        :param BookModel book_model_fixture: Фикстура модели книги
+        :param InternetResourceModel internet_resource_model_fixture: Фикстура модели интернет-ресурса
+        :param ArticlesCollectionModel articles_collection_model_fixture: Фикстура модели сборника статей
+        """
+
+        result = formatter(
+            [
+                book_model_fixture,
+                internet_resource_model_fixture,
+                articles_collection_model_fixture,
+            ]
+        ).format()
+
+        # тестирование сортировки списка источников
+        assert [str(item) for item in result] == [
+            EXPECTED[formatter][index] for index in ORDER[formatter]
+        ]
@@ -1,9 +1,11 @@
 """
 Тестирование функций чтения данных из источника.
 """
+from datetime import date
 from typing import Any
 
 import pytest
+from pydantic import ValidationError
 
 from formatters.models import BookModel, InternetResourceModel, ArticlesCollectionModel
 from readers.reader import (
@@ -55,6 +57,46 @@ class TestReaders:
         # проверка общего количества атрибутов
         assert len(model_type.schema().get("properties", {}).keys()) == 7
 
+    def test_plan(self, workbook: Any) -> None:
+        """
+        Тестирование плана извлечения столбцов.
+
+        :param workbook: Объект тестовой рабочей книги.
+        """
+
+        reader = InternetResourceReader(workbook)
+
+        # план компилируется один раз на читателя
+        assert reader.plan is reader.plan
+        assert [attr for attr, _, _ in reader.plan] == list(reader.attributes)
+
+        attrs = reader.parse(
+            (" Статья ", "Сайт", "https://example.com", date(2021, 1, 1))
+        )
+        assert attrs == {
+            "article": "Статья",
+            "website": "Сайт",
+            "link": "https://example.com",
+            "access_date": "01.01.2021",
+        }
+
+    def test_interned(self, workbook: Any) -> None:
+        """
+        Тестирование интернирования часто повторяющихся значений при чтении.
+
+        :param workbook: Объект тестовой рабочей книги.
+        """
+
+        reader = BookReader(workbook)
+        row = ("Автор", "Название", "1-е", "М.", "АСТ", 2020, 100)
+        first = reader.parse(row)
+        # значения из разных строк (не интернированные исходно) совпадают по объекту
+        second = reader.parse(tuple("".join(value) for value in row[:5]) + row[5:])
+
+        assert second["city"] is first["city"]
+        assert second["publishing_house"] is first["publishing_house"]
+        assert second["title"] == first["title"]
+
     def test_internet_resource(self, workbook: Any) -> None:
         """
         Тестирование чтения интернет-ресурса.
@@ -120,3 +162,98 @@ class TestReaders:
             InternetResourceModel.__name__,
             ArticlesCollectionModel.__name__,
         }
+
+    def test_sources_reader_streaming(self) -> None:
+        """
+        Тестирование потокового чтения всех моделей из источника.
+        """
+
+        reader = SourcesReader(TEMPLATE_FILE_PATH, streaming=True)
+        models = reader.iter_read()
+
+        # модели возвращаются генератором, а не списком
+        assert not isinstance(models, list)
+        assert list(models) == SourcesReader(TEMPLATE_FILE_PATH).read()
+
+        reader.close()
+
+    @pytest.mark.parametrize("native", [False, True])
+    def test_sources_reader_parallel(self, native: bool) -> None:
+        """
+        Тестирование параллельного чтения всех моделей из источника диапазонами строк.
+
+        :param bool native: Быстрое чтение рабочей книги Excel без openpyxl
+        """
+
+        reader = SourcesReader(
+            TEMPLATE_FILE_PATH, workers=2, chunk_size=4, native=native
+        )
+
+        # листы разбиваются на диапазоны строк по размеру из заголовка листа,
+        # последний диапазон листа читается до конца листа
+        chunks = reader.chunks()
+        assert [chunk.reader for chunk in chunks] == [
+            reader_class
+            for reader_class in (
+                BookReader,
+                InternetResourceReader,
+                ArticlesCollectionReader,
+            )
+            for _ in range(3)
+        ]
+        assert [(chunk.min_row, chunk.max_row) for chunk in chunks[:3]] == [
+            (2, 5),
+            (6, 9),
+            (10, None),
+        ]
+        # рабочая книга открывается в процессах пула, а не в текущем процессе
+        assert reader.parallel
+        assert "workbook" not in reader.__dict__
+
+        # порядок моделей совпадает с последовательным чтением
+        assert reader.read() == SourcesReader(TEMPLATE_FILE_PATH).read()
+        assert "workbook" not in reader.__dict__
+
+        # атрибуты моделей без создания моделей (чтение для кэша) также читаются в пуле
+        assert [(item.model, attrs) for item, attrs in reader.iter_parsed()] == [
+            (item.model, attrs)
+            for item, attrs in SourcesReader(TEMPLATE_FILE_PATH).iter_parsed()
+        ]
+        assert "workbook" not in reader.__dict__
+
+        # текстовые файлы и файловые объекты читаются последовательно
+        assert not SourcesReader("input.csv", workers=2).parallel
+        with open(TEMPLATE_FILE_PATH, "rb") as file:
+            assert not SourcesReader(file, workers=2).parallel
+
+    def test_sources_reader_trusted(self) -> None:
+        """
+        Тестирование чтения всех моделей из источника в режиме доверенных данных.
+        """
+
+        models = SourcesReader(TEMPLATE_FILE_PATH, trusted=True).read()
+        assert models == SourcesReader(TEMPLATE_FILE_PATH).read()
+
+    def test_construct_batch(self, workbook: Any) -> None:
+        """
+        Тестирование пакетной проверки столбцов в режиме доверенных данных.
+
+        :param workbook: Объект тестовой рабочей книги.
+        """
+
+        reader = BookReader(workbook, trusted=True)
+        row = ("Иванов И.М.", "Наука", None, "СПб.", "АСТ", 2020, 999)
+
+        # проверка столбца возвращает индексы значений с нарушением типа или ограничения
+        checks = dict(reader.checks)
+        assert checks["year"]([2020, 1]) == set()
+        assert checks["year"]([2020, 0, "2020"]) == {1, 2}
+        assert checks["edition"]([None, "3-е"]) == set()
+
+        # строка с корректными значениями создается без валидации полей
+        (model,) = reader.construct_batch([reader.parse(row)])
+        assert model == BookModel(**reader.parse(row))
+
+        # строка с нарушением ограничения столбца проходит полную валидацию
+        with pytest.raises(ValidationError):
+            list(reader.construct_batch([reader.parse(row[:-1] + (0,))]))
@@ -0,0 +1,154 @@
+"""
+Тестирование чтения данных из текстовых файлов (CSV, JSON Lines).
+"""
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from benchmarks.generator import generate_text, generate_workbook
+from formatters.models import BookModel, InternetResourceModel
+from readers.reader import SourcesReader
+
+
+class TestTextReaders:
+    """
+    Тестирование чтения данных из текстовых файлов.
+    """
+
+    @pytest.mark.parametrize("suffix", [".csv", ".jsonl"])
+    def test_same_models(self, tmp_path: Path, suffix: str) -> None:
+        """
+        Тестирование совпадения моделей, прочитанных из текстового файла и рабочей книги Excel.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        :param str suffix: Расширение текстового файла
+        """
+
+        path = tmp_path / "input.xlsx"
+        generate_workbook(path, 5)
+        generate_text(path.with_suffix(suffix), 5)
+
+        expected = SourcesReader(str(path)).read()
+        assert SourcesReader(str(path.with_suffix(suffix))).read() == expected
+        assert (
+            SourcesReader(str(path.with_suffix(suffix)), trusted=True).read()
+            == expected
+        )
+        assert (
+            SourcesReader(str(path.with_suffix(suffix)), workers=2).read() == expected
+        )
+
+    def test_csv(self, tmp_path: Path) -> None:
+        """
+        Тестирование чтения CSV-файла с типами строк по наименованиям листов и моделей.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        """
+
+        path = tmp_path / "input.csv"
+        path.write_text(
+            "type,1,2,3,4,5,6,7\n"
+            "Интернет-ресурс,Наука как искусство,Ведомости,"
+            "https://www.vedomosti.ru,01.01.2021\n"
+            'BookModel,"Иванов И.М., Петров С.Н.",Наука как искусство,,СПб.,'
+            "Просвещение,2020,999\n"
+            "Неизвестный тип,1,2,3\n",
+            encoding="utf-8",
+        )
+
+        book, resource = SourcesReader(str(path)).read()
+
+        assert isinstance(book, BookModel)
+        assert book.authors == "Иванов И.М., Петров С.Н."
+        assert book.edition is None
+        assert book.year == 2020
+        assert isinstance(resource, InternetResourceModel)
+        assert resource.access_date == "01.01.2021"
+
+    def test_jsonl(self, tmp_path: Path) -> None:
+        """
+        Тестирование чтения файла JSON Lines с пропущенными атрибутами.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        """
+
+        path = tmp_path / "input.jsonl"
+        path.write_text(
+            '{"type": "Книга", "authors": "Иванов И.М.", "title": "Наука", '
+            '"city": "М.", "publishing_house": "АСТ", "year": 2020, "pages": 99}\n'
+            "\n",
+            encoding="utf-8",
+        )
+
+        (book,) = SourcesReader(str(path)).read()
+
+        assert book == BookModel(
+            authors="Иванов И.М.",
+            title="Наука",
+            city="М.",
+            publishing_house="АСТ",
+            year=2020,
+            pages=99,
+        )
+
+    def test_csv_blank_lines(self, tmp_path: Path) -> None:
+        """
+        Тестирование чтения CSV-файла с пустыми строками.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        """
+
+        path = tmp_path / "input.csv"
+        path.write_text(
+            "type,1,2,3,4\n"
+            "\n"
+            "Интернет-ресурс,Наука как искусство,Ведомости,"
+            "https://www.vedomosti.ru,01.01.2021\n"
+            "\n",
+            encoding="utf-8",
+        )
+
+        (resource,) = SourcesReader(str(path)).read()
+
+        assert resource.website == "Ведомости"
+
+    def test_jsonl_not_object(self, tmp_path: Path) -> None:
+        """
+        Тестирование ошибки чтения файла JSON Lines со строкой, не являющейся объектом.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        """
+
+        path = tmp_path / "input.jsonl"
+        path.write_text('{"type": "Книга"}\n["Книга"]\n', encoding="utf-8")
+
+        with pytest.raises(ValueError, match="Строка 2"):
+            SourcesReader(str(path)).read()
+
+    def test_single_pass(self, tmp_path: Path) -> None:
+        """
+        Тестирование чтения всех листов текстового файла за один проход.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        """
+
+        path = tmp_path / "input.jsonl"
+        generate_text(path, 5)
+        reader = SourcesReader(str(path))
+        records = reader.workbook.iter_records
+        passes = []
+
+        def iter_records() -> Iterator[tuple[str, tuple]]:
+            passes.append(1)
+            return records()
+
+        reader.workbook.iter_records = iter_records
+        expected = SourcesReader(str(path)).read()
+
+        assert reader.read() == expected
+        assert len(passes) == 1
+
+        # повторное чтение начинает новый проход
+        assert reader.read() == expected
+        assert len(passes) == 2
@@ -0,0 +1,74 @@
+"""
+Тестирование быстрого чтения рабочей книги Excel без openpyxl.
+"""
+from datetime import datetime
+from pathlib import Path
+
+import openpyxl
+
+from benchmarks.generator import generate_workbook
+from readers.reader import SourcesReader
+from readers.xlsx import XLSXWorkbook, column_index, is_date_format
+from settings import TEMPLATE_FILE_PATH
+
+
+class TestXLSXReader:
+    """
+    Тестирование быстрого чтения рабочей книги Excel.
+    """
+
+    def test_same_values(self) -> None:
+        """
+        Тестирование совпадения значений и размеров всех листов шаблона с openpyxl.
+        """
+
+        expected = openpyxl.load_workbook(TEMPLATE_FILE_PATH, read_only=True)
+        workbook = XLSXWorkbook(TEMPLATE_FILE_PATH)
+        try:
+            for sheet in expected:
+                native = workbook[sheet.title]
+                assert native.max_row == sheet.max_row
+                assert list(native.iter_rows(min_row=2)) == list(
+                    sheet.iter_rows(min_row=2, values_only=True)
+                )
+                assert list(native.iter_rows(min_row=3, max_row=4)) == list(
+                    sheet.iter_rows(min_row=3, max_row=4, values_only=True)
+                )
+
+            # даты определяются по формату ячейки
+            rows = workbook["Интернет-ресурс"].iter_rows(min_row=2, max_row=2)
+            assert next(rows)[3] == datetime(2021, 1, 1)
+            # лист создается (и его заголовок читается) один раз
+            assert workbook["Книга"] is workbook["Книга"]
+        finally:
+            workbook.close()
+            expected.close()
+
+    def test_same_models(self, tmp_path: Path) -> None:
+        """
+        Тестирование совпадения прочитанных моделей с чтением через openpyxl.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        """
+
+        path = tmp_path / "input.xlsx"
+        generate_workbook(path, 5)
+
+        expected = SourcesReader(str(path)).read()
+        assert SourcesReader(str(path), native=True).read() == expected
+        assert (
+            SourcesReader(str(path), native=True, workers=2, chunk_size=2).read()
+            == expected
+        )
+
+    def test_helpers(self) -> None:
+        """
+        Тестирование разбора адресов столбцов и форматов дат.
+        """
+
+        assert column_index("A") == 0
+        assert column_index("AB") == 27
+        assert is_date_format("dd.mm.yyyy")
+        assert is_date_format("[$-F800]dddd, mmmm dd, yyyy")
+        assert not is_date_format('0.00" дней"')
+        assert not is_date_format("General")
@@ -0,0 +1,101 @@
+"""
+Тестирование пакетной обработки входных файлов.
+"""
+import shutil
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from batch import process_batch
+from settings import TEMPLATE_FILE_PATH
+
+
+class TestBatch:
+    """
+    Тестирование пакетной обработки входных файлов.
+    """
+
+    def test_input_dir(self, tmp_path: Path) -> None:
+        """
+        Тестирование обработки всех входных файлов директории в пуле процессов.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        """
+
+        input_dir = tmp_path / "input"
+        input_dir.mkdir()
+        for name in ("first", "second", "third"):
+            shutil.copy(TEMPLATE_FILE_PATH, input_dir / f"{name}.xlsx")
+
+        output_dir = tmp_path / "output"
+        result = CliRunner().invoke(
+            process_batch,
+            ["-id", str(input_dir), "-od", str(output_dir), "-w", "2", "-sr"],
+        )
+
+        assert result.exit_code == 0, result.output
+        assert sorted(path.name for path in output_dir.iterdir()) == [
+            "first.docx",
+            "second.docx",
+            "third.docx",
+        ]
+
+    def test_manifest(self, tmp_path: Path) -> None:
+        """
+        Тестирование обработки входных файлов из манифеста.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        """
+
+        shutil.copy(TEMPLATE_FILE_PATH, tmp_path / "input.xlsx")
+        manifest = tmp_path / "manifest.csv"
+        manifest.write_text(
+            "input.xlsx,custom/result.docx\ninput.xlsx\nmissing.xlsx\n",
+            encoding="utf-8",
+        )
+
+        output_dir = tmp_path / "output"
+        result = CliRunner().invoke(
+            process_batch, ["-m", str(manifest), "-od", str(output_dir), "-w", "1"]
+        )
+
+        # отсутствующий входной файл не прерывает обработку остальных
+        assert result.exit_code == 1
+        assert (tmp_path / "custom" / "result.docx").exists()
+        assert (output_dir / "input.docx").exists()
+
+    def test_output_names(self, tmp_path: Path) -> None:
+        """
+        Тестирование выходных файлов для одноименных входных файлов.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        """
+
+        for group in ("101", "102"):
+            (tmp_path / group).mkdir()
+            shutil.copy(TEMPLATE_FILE_PATH, tmp_path / group / "ivanov.xlsx")
+        manifest = tmp_path / "manifest.csv"
+        manifest.write_text("101/ivanov.xlsx\n102/ivanov.xlsx\n", encoding="utf-8")
+
+        output_dir = tmp_path / "output"
+        result = CliRunner().invoke(
+            process_batch, ["-m", str(manifest), "-od", str(output_dir), "-w", "1"]
+        )
+
+        # выходные файлы по умолчанию не перезаписывают друг друга
+        assert result.exit_code == 0, result.output
+        assert sorted(path.name for path in output_dir.iterdir()) == [
+            "ivanov.docx",
+            "ivanov_2.docx",
+        ]
+
+        # явно указанный общий выходной файл – ошибка параметров
+        manifest.write_text(
+            "101/ivanov.xlsx,result.docx\n102/ivanov.xlsx,result.docx\n",
+            encoding="utf-8",
+        )
+        result = CliRunner().invoke(
+            process_batch, ["-m", str(manifest), "-od", str(output_dir), "-w", "1"]
+        )
+        assert result.exit_code == 2
+        assert "result.docx" in result.output
@@ -0,0 +1,69 @@
+"""
+Тестирование генерации синтетического входного файла для замеров производительности.
+"""
+from pathlib import Path
+
+from benchmarks.generator import generate_workbook
+from benchmarks.run import add_speedups, get_stages, measure
+from benchmarks.startup import get_loaded_heavy_modules, measure_import
+from readers.reader import SourcesReader
+
+
+class TestBenchmarks:
+    """
+    Тестирование инструментов замеров производительности.
+    """
+
+    def test_generate_workbook(self, tmp_path: Path) -> None:
+        """
+        Тестирование генерации входного файла по шаблону.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        """
+
+        path = tmp_path / "input.xlsx"
+        generate_workbook(path, 5)
+
+        # по 5 строк на каждом из трех читаемых листов
+        assert len(SourcesReader(str(path)).read()) == 15
+
+    def test_measure(self, tmp_path: Path) -> None:
+        """
+        Тестирование замера этапа обработки.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        """
+
+        path = tmp_path / "input.xlsx"
+        generate_workbook(path, 5)
+
+        result = measure(get_stages(path, tmp_path)["format"])
+        assert result["rows"] == 15
+        assert {"seconds", "rows_per_second", "peak_memory_mb"} <= set(result)
+
+    def test_speedups(self) -> None:
+        """
+        Тестирование расчета ускорения этапов чтения относительно чтения Excel.
+        """
+
+        results = {
+            "stages": {
+                "read": {"seconds": 10.0},
+                "read_csv": {"seconds": 0.8},
+                "format": {"seconds": 1.0},
+            }
+        }
+        add_speedups(results)
+
+        assert results["stages"]["read_csv"]["speedup"] == 12.5
+        assert "speedup" not in results["stages"]["format"]
+        assert "speedup" not in results["stages"]["read"]
+
+    def test_startup(self) -> None:
+        """
+        Тестирование отложенной загрузки тяжелых зависимостей при запуске консольной команды.
+        """
+
+        assert not get_loaded_heavy_modules("main")
+        assert not get_loaded_heavy_modules("batch")
+        assert measure_import("main")["total_ms"] > 0
@@ -0,0 +1,118 @@
+"""
+Тестирование постоянного кэша отформатированных строк.
+"""
+from pathlib import Path
+
+from cache import CachedCitationFormatter, FormattedCache
+from formatters.styles.gost import GOSTCitationFormatter
+from readers.reader import SourcesReader
+from settings import TEMPLATE_FILE_PATH
+
+
+class TestCache:
+    """
+    Тестирование постоянного кэша отформатированных строк.
+    """
+
+    def test_cached_formatter(self, tmp_path: Path) -> None:
+        """
+        Тестирование форматирования списка источников с использованием кэша.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        """
+
+        path = tmp_path / "cache.sqlite3"
+        expected = [
+            str(item)
+            for item in GOSTCitationFormatter(
+                SourcesReader(TEMPLATE_FILE_PATH).read()
+            ).format()
+        ]
+
+        for _ in range(2):
+            cache = FormattedCache("1", path)
+            result = CachedCitationFormatter(
+                SourcesReader(TEMPLATE_FILE_PATH), cache
+            ).format()
+            assert result == expected
+
+            # при повторном запуске все строки берутся из кэша
+            hits = cache.hits
+            cache.close()
+
+        assert hits == len(expected)
+
+    def test_version(self, tmp_path: Path) -> None:
+        """
+        Тестирование очистки кэша при изменении версии кода стиля цитирования.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        """
+
+        path = tmp_path / "cache.sqlite3"
+        cache = FormattedCache("1", path)
+        cache.set("key", "value")
+        cache.close()
+
+        cache = FormattedCache("2", path)
+        assert cache.get("key") is None
+        cache.close()
+
+    def test_evict(self, tmp_path: Path) -> None:
+        """
+        Тестирование удаления давно не использованных записей.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        """
+
+        path = tmp_path / "cache.sqlite3"
+        cache = FormattedCache("1", path, max_entries=2)
+        cache.set("old", "1")
+        cache.close()
+
+        cache = FormattedCache("1", path, max_entries=2)
+        cache.set("new", "2")
+        cache.set("newest", "3")
+        cache.close()
+
+        cache = FormattedCache("1", path, max_entries=2)
+        assert cache.get("old") is None
+        assert cache.get("new") == "2"
+        assert cache.get("newest") == "3"
+        cache.close()
+
+    def test_flush(self, tmp_path: Path) -> None:
+        """
+        Тестирование пакетного сохранения изменений кэша.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        """
+
+        path = tmp_path / "cache.sqlite3"
+        cache = FormattedCache("1", path, batch_size=2)
+        cache.set("first", "1")
+        assert cache.pending == 1
+
+        # по достижении размера пакета изменения сохраняются и видны другим соединениям
+        cache.set("second", "2")
+        assert cache.pending == 0
+        other = FormattedCache("1", path)
+        assert other.get("first") == "1"
+        other.close()
+
+        # отметки об использовании накапливаются только до сохранения пакета
+        assert cache.get("first") == "1"
+        assert cache.used == ["first"]
+        assert cache.get("second") == "2"
+        assert not cache.used
+        assert cache.hits == 2
+        cache.close()
+
+    def test_version_of_style(self) -> None:
+        """
+        Тестирование получения версии кода стиля цитирования.
+        """
+
+        version = CachedCitationFormatter.get_version(GOSTCitationFormatter)
+        assert version == CachedCitationFormatter.get_version(GOSTCitationFormatter)
+        assert len(version) == 64
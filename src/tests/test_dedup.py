@@ -0,0 +1,132 @@
+"""
+Тестирование объединения повторяющихся источников.
+"""
+import logging
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+import dedup
+from cache import CachedCitationFormatter, FormattedCache
+from dedup import Deduplicator, normalize_link
+from formatters.models import BookModel, InternetResourceModel
+from readers.reader import SourcesReader
+from settings import TEMPLATE_FILE_PATH
+
+
+class TestDedup:
+    """
+    Тестирование объединения повторяющихся источников.
+    """
+
+    def test_filter(
+        self,
+        book_model_fixture: BookModel,
+        internet_resource_model_fixture: InternetResourceModel,
+    ) -> None:
+        """
+        Тестирование исключения источников, отличающихся пробелами и регистром.
+
+        :param BookModel book_model_fixture: Фикстура модели книги
+        :param InternetResourceModel internet_resource_model_fixture: Фикстура модели интернет-ресурса
+        """
+
+        book_copy = book_model_fixture.copy(
+            update={"title": "  НАУКА как  искусство ", "pages": 1}
+        )
+        other_book = book_model_fixture.copy(update={"year": 2021})
+        resource_copy = internet_resource_model_fixture.copy(
+            update={"link": "http://vedomosti.ru/", "article": "Другое название"}
+        )
+
+        deduplicator = Deduplicator()
+        result = list(
+            deduplicator.filter(
+                [
+                    book_model_fixture,
+                    internet_resource_model_fixture,
+                    book_copy,
+                    other_book,
+                    resource_copy,
+                    book_copy,
+                ]
+            )
+        )
+
+        # сохраняются первые вхождения в исходном порядке
+        assert result == [
+            book_model_fixture,
+            internet_resource_model_fixture,
+            other_book,
+        ]
+        assert deduplicator.report() == [
+            {
+                "model": "BookModel",
+                "key": {
+                    "authors": "иванов и.м., петров с.н.",
+                    "title": "наука как искусство",
+                    "year": "2020",
+                },
+                "duplicates": 2,
+            },
+            {
+                "model": "InternetResourceModel",
+                "key": {"link": "vedomosti.ru"},
+                "duplicates": 1,
+            },
+        ]
+
+    def test_normalize_link(self) -> None:
+        """
+        Тестирование нормализации ссылок.
+        """
+
+        assert normalize_link(" HTTPS://www.Example.com/page/ ") == "example.com/page"
+
+    def test_cached(self, tmp_path: Path) -> None:
+        """
+        Тестирование объединения дубликатов при форматировании с использованием кэша.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        """
+
+        cache = FormattedCache("1", tmp_path / "cache.sqlite3")
+        deduplicator = Deduplicator()
+        result = CachedCitationFormatter(
+            SourcesReader(TEMPLATE_FILE_PATH), cache, deduplicator=deduplicator
+        ).format()
+        cache.close()
+
+        # в шаблоне нет повторяющихся источников
+        assert len(result) == 8
+        assert not deduplicator.report()
+
+    @pytest.mark.parametrize("level", [logging.INFO, logging.DEBUG])
+    def test_log_report(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        book_model_fixture: BookModel,
+        level: int,
+    ) -> None:
+        """
+        Тестирование вывода итогов объединения в журнал с подробностями на уровне DEBUG.
+
+        :param pytest.MonkeyPatch monkeypatch: Фикстура подмены объектов
+        :param BookModel book_model_fixture: Фикстура модели книги
+        :param int level: Уровень логирования
+        """
+
+        logger = Mock()
+        logger.isEnabledFor.side_effect = lambda value: value >= level
+        monkeypatch.setattr(dedup, "logger", logger)
+
+        models = [book_model_fixture] * 3 + [
+            book_model_fixture.copy(update={"title": "Другая книга"})
+        ] * 2
+        assert len(list(Deduplicator().filter(models))) == 2
+
+        # одна итоговая запись независимо от количества повторявшихся источников
+        assert logger.info.call_count == 1
+        assert logger.info.call_args.args[1:] == (3, 2)
+        assert logger.debug.call_count == (2 if level == logging.DEBUG else 0)
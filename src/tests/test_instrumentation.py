@@ -0,0 +1,103 @@
+"""
+Тестирование замеров этапов обработки.
+"""
+import json
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from instrumentation import Instrumentation
+from main import generate, get_profile_path
+from settings import TEMPLATE_FILE_PATH
+
+
+class TestInstrumentation:
+    """
+    Тестирование замеров этапов обработки.
+    """
+
+    def test_nested_stages(self) -> None:
+        """
+        Тестирование учета времени вложенного этапа отдельно от внешнего.
+        """
+
+        def produce() -> Iterator[int]:
+            for item in range(3):
+                time.sleep(0.02)
+                yield item
+
+        instrumentation = Instrumentation()
+        with instrumentation:
+            with instrumentation.stage("outer"):
+                items = list(instrumentation.track("inner", produce(), batch_size=2))
+                instrumentation.count("outer", len(items))
+
+        stages = instrumentation.report()["stages"]
+        assert items == [0, 1, 2]
+        assert stages["inner"]["rows"] == 3
+        assert stages["outer"]["rows"] == 3
+        # время получения элементов учитывается за вложенным этапом
+        assert stages["inner"]["seconds"] >= 0.06
+        assert stages["outer"]["seconds"] < stages["inner"]["seconds"]
+
+    def test_stop_on_error(self) -> None:
+        """
+        Тестирование остановки замеров при ошибке обработки.
+        """
+
+        instrumentation = Instrumentation(cpu_profile=True)
+        with pytest.raises(RuntimeError):
+            with instrumentation:
+                with instrumentation.stage("outer"):
+                    raise RuntimeError("ошибка")
+
+        assert not tracemalloc.is_tracing()
+        assert instrumentation.finished_at >= instrumentation.started_at > 0
+
+    def test_disabled(self) -> None:
+        """
+        Тестирование отсутствия замеров в выключенном режиме.
+        """
+
+        instrumentation = Instrumentation(enabled=False)
+        with instrumentation:
+            with instrumentation.stage("outer"):
+                assert list(instrumentation.track("inner", [1, 2])) == [1, 2]
+
+        assert not instrumentation.stages
+
+    def test_generate_profile(self, tmp_path: Path) -> None:
+        """
+        Тестирование сохранения результатов замеров рядом с выходным файлом.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        """
+
+        path_output = tmp_path / "output.docx"
+        generate(TEMPLATE_FILE_PATH, str(path_output), profile=True, cpu_profile=True)
+
+        report = json.loads(get_profile_path(str(path_output)).read_text("utf-8"))
+        assert set(report["stages"]) == {"read", "format", "sort", "merge", "render"}
+        assert report["stages"]["read"]["rows"] == 8
+        assert report["stages"]["sort"]["rows"] == 8
+        assert report["stages"]["sort"]["rows_per_second"] > 0
+        assert report["stages"]["render"]["rows"] == 8
+        assert report["stages"]["read"]["peak_memory_mb"] > 0
+        assert (tmp_path / "output.profile.prof").exists()
+
+    def test_generate_profile_error(self, tmp_path: Path) -> None:
+        """
+        Тестирование сохранения результатов замеров при ошибке обработки.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        """
+
+        path_output = tmp_path / "output.docx"
+        with pytest.raises(FileNotFoundError):
+            generate(str(tmp_path / "missing.xlsx"), str(path_output), profile=True)
+
+        assert get_profile_path(str(path_output)).exists()
+        assert not path_output.exists()
@@ -0,0 +1,106 @@
+"""
+Тестирование функций логирования.
+"""
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+import logger as logger_module
+from logger import ProgressLogger, get_logger, setup_logging
+from settings import LOGGING_FILE_NAME
+
+
+class TestProgressLogger:
+    """
+    Тестирование периодического логирования прогресса обработки.
+    """
+
+    def test_track(self) -> None:
+        """
+        Тестирование учета прогресса при обходе элементов.
+        """
+
+        logger = Mock()
+        progress = ProgressLogger(logger, "Обработка", every=10)
+
+        assert list(progress.track(range(25))) == list(range(25))
+        assert progress.count == 25
+
+        # две записи о прогрессе (10 и 20 элементов) и итоговая запись
+        assert logger.info.call_count == 3
+        assert logger.info.call_args_list[1].args[2] == 20
+
+    def test_step(self) -> None:
+        """
+        Тестирование учета пакета обработанных элементов.
+        """
+
+        logger = Mock()
+        progress = ProgressLogger(logger, "Обработка", every=10)
+        progress.step(25)
+
+        # одна запись на пакет, следующая – при достижении 30 элементов
+        assert logger.info.call_count == 1
+        assert progress.next_report == 30
+
+
+class TestGetLogger:
+    """
+    Тестирование настройки логгеров.
+    """
+
+    def test_idempotent(self) -> None:
+        """
+        Тестирование повторной настройки логгера того же модуля.
+        """
+
+        logger = get_logger("tests.idempotent")
+        handlers = list(logger.handlers)
+
+        # повторный вызов не добавляет обработчиков и не создает новых приемников логов
+        listener = setup_logging()
+        assert get_logger("tests.idempotent") is logger
+        assert logger.handlers == handlers
+        assert len(handlers) == 1
+        assert setup_logging() is listener
+
+    def test_fork(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Тестирование записи логов из процессов пула, запущенных через `fork`.
+
+        :param Path tmp_path: Временный каталог
+        :param pytest.MonkeyPatch monkeypatch: Фикстура подмены атрибутов модулей
+        """
+
+        listener = setup_logging()
+        # дочерний процесс наследует подмененный путь к директории для логирования
+        monkeypatch.setattr(logger_module, "LOGGING_PATH", str(tmp_path))
+        context = multiprocessing.get_context("fork")
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            # в дочернем процессе запускается собственный обработчик очереди
+            child = executor.submit(log_in_child).result()
+
+        assert child != os.getpid()
+        # запись ниже уровня сброса буфера сохраняется при завершении процесса пула
+        log = (tmp_path / LOGGING_FILE_NAME).read_text(encoding="utf-8")
+        assert f"запись {child}" in log
+        assert setup_logging() is listener
+
+
+def log_in_child() -> int:
+    """
+    Запись лога в дочернем процессе.
+
+    :return: Идентификатор дочернего процесса
+    """
+
+    # логирование выключено для тестов (см. `tests/__init__.py`), процесс пула завершается после теста
+    logging.disable(logging.NOTSET)
+    get_logger("tests.fork").info("запись %s", os.getpid())
+
+    return os.getpid()
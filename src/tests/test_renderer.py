@@ -1,11 +1,25 @@
 """
 Тестирование функций генерации выходного файла.
 """
+import json
+from io import BytesIO
 from pathlib import Path
+from typing import Iterator
 
 import pytest
+from docx import Document
 
-from renderer import Renderer
+from renderer import (
+    HTMLRenderer,
+    JSONRenderer,
+    MarkdownRenderer,
+    Renderer,
+    StreamRenderer,
+    TextRenderer,
+    get_base_document,
+    get_renderer,
+    render_all,
+)
 
 
 class TestRenderer:
@@ -41,3 +55,177 @@ class TestRenderer:
         assert len(list(tmp_path.iterdir())) == 1
         # проверка размера файла в байтах на диске
         assert path.stat().st_size == 36773
+
+        # документ создается из снимка, подготовленного один раз
+        assert get_base_document(Renderer) is get_base_document(Renderer)
+        assert len(Renderer(formatted_models).render_bytes()) == 36773
+
+    def test_stream_render(
+        self, tmp_path: Path, formatted_models: tuple[str, ...]
+    ) -> None:
+        """
+        Тестирование функции потоковой генерации выходного файла.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        :param tuple[str, ...] formatted_models: Список строк для сохранения в файле
+        """
+
+        path = tmp_path / "output.docx"
+        rows = (*formatted_models, "Строка <&>\tс табуляцией")
+        StreamRenderer(iter(rows)).render(path)
+
+        # проверка содержимого файла: заголовок и строки списка источников
+        paragraphs = Document(str(path)).paragraphs
+        assert paragraphs[0].text == "Список использованной литературы"
+        assert paragraphs[0].runs[0].bold
+        assert [paragraph.text for paragraph in paragraphs[1:]] == list(rows)
+        assert {paragraph.style.name for paragraph in paragraphs[1:]} == {"List Number"}
+
+        # повторная генерация в памяти из того же снимка дает тот же документ
+        content = StreamRenderer(rows).render_bytes()
+        assert content == StreamRenderer(rows).render_bytes()
+        paragraphs = Document(BytesIO(content)).paragraphs
+        assert [paragraph.text for paragraph in paragraphs[1:]] == list(rows)
+
+    @pytest.mark.parametrize("renderer", [Renderer, StreamRenderer])
+    def test_render_invalid_chars(self, renderer: type[Renderer]) -> None:
+        """
+        Тестирование удаления управляющих символов, недопустимых в XML, из строк файла Word.
+
+        :param type[Renderer] renderer: Класс создания выходного файла Word
+        """
+
+        content = renderer(["Наука\x00 как\x0b иск\x1fусство\tстр."]).render_bytes()
+
+        # документ открывается, текст сохраняется без недопустимых символов
+        paragraphs = Document(BytesIO(content)).paragraphs
+        assert paragraphs[1].text == "Наука как искусство\tстр."
+
+    @pytest.mark.parametrize("renderer", [Renderer, StreamRenderer, TextRenderer])
+    def test_write_before_open(self, renderer: type[Renderer]) -> None:
+        """
+        Тестирование ошибки записи строки до начала записи выходного файла.
+
+        :param type[Renderer] renderer: Класс создания выходного файла
+        """
+
+        with pytest.raises(RuntimeError):
+            renderer().write("Строка")
+        with pytest.raises(RuntimeError):
+            renderer().close()
+
+    @pytest.mark.parametrize(
+        "renderer, expected",
+        [
+            (
+                TextRenderer,
+                "Список использованной литературы\n\n1. Строка <1>\n2. Строка *2*\n",
+            ),
+            (
+                MarkdownRenderer,
+                "# Список использованной литературы\n\n"
+                "1. Строка \\<1\\>\n2. Строка \\*2\\*\n",
+            ),
+            (
+                JSONRenderer,
+                '{"title": "Список использованной литературы", '
+                '"items": ["Строка <1>", "Строка *2*"]}\n',
+            ),
+        ],
+    )
+    def test_text_render(self, renderer: type[TextRenderer], expected: str) -> None:
+        """
+        Тестирование потоковой генерации текстовых выходных файлов.
+
+        :param type[TextRenderer] renderer: Класс создания выходного файла
+        :param str expected: Ожидаемое содержимое файла
+        """
+
+        output = BytesIO()
+        renderer(iter(["Строка <1>", "Строка *2*"])).render(output)
+
+        # файловый объект остается открытым после генерации
+        assert output.getvalue().decode("utf-8") == expected
+
+    def test_render_all(
+        self, tmp_path: Path, formatted_models: tuple[str, ...]
+    ) -> None:
+        """
+        Тестирование генерации нескольких выходных файлов за один проход по строкам.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        :param tuple[str, ...] formatted_models: Список строк для сохранения в файле
+        """
+
+        paths = [
+            tmp_path / f"output{extension}" for extension in (".docx", ".html", ".json")
+        ]
+        render_all(iter(formatted_models), paths, stream_render=True)
+
+        paragraphs = Document(str(paths[0])).paragraphs
+        assert [paragraph.text for paragraph in paragraphs[1:]] == list(
+            formatted_models
+        )
+        assert paths[1].read_text("utf-8").count("<li>") == len(formatted_models)
+        assert json.loads(paths[2].read_text("utf-8"))["items"] == list(
+            formatted_models
+        )
+
+        # совпадающие выходные файлы отклоняются до записи
+        with pytest.raises(ValueError):
+            render_all(formatted_models, [paths[1], tmp_path / "." / "output.html"])
+
+        assert get_renderer("output.HTML") is HTMLRenderer
+        with pytest.raises(ValueError):
+            get_renderer("output.pdf")
+
+    @pytest.mark.parametrize("stream_render", [False, True])
+    def test_render_all_error(
+        self, tmp_path: Path, formatted_models: tuple[str, ...], stream_render: bool
+    ) -> None:
+        """
+        Тестирование удаления недописанных выходных файлов при ошибке получения строк.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        :param tuple[str, ...] formatted_models: Список строк для сохранения в файле
+        :param bool stream_render: Потоковая генерация файлов Word
+        """
+
+        def rows() -> Iterator[str]:
+            yield from formatted_models
+            raise RuntimeError("ошибка")
+
+        paths = [tmp_path / f"output{extension}" for extension in (".docx", ".txt")]
+        with pytest.raises(RuntimeError):
+            render_all(rows(), paths, stream_render=stream_render)
+        with pytest.raises(RuntimeError):
+            Renderer(rows()).render(paths[0])
+
+        assert not list(tmp_path.iterdir())
+
+    def test_render_all_close_error(
+        self,
+        tmp_path: Path,
+        formatted_models: tuple[str, ...],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """
+        Тестирование удаления файлов при ошибке окончания записи одного из них.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        :param tuple[str, ...] formatted_models: Список строк для сохранения в файле
+        :param pytest.MonkeyPatch monkeypatch: Фикстура подмены атрибутов
+        """
+
+        def footer(_: HTMLRenderer) -> str:
+            raise OSError("ошибка")
+
+        monkeypatch.setattr(HTMLRenderer, "footer", footer)
+        paths = [
+            tmp_path / f"output{extension}" for extension in (".txt", ".html", ".json")
+        ]
+        with pytest.raises(OSError):
+            render_all(formatted_models, paths)
+
+        # закрытый до ошибки файл сохраняется, файл с ошибкой и следующие за ним удаляются
+        assert [path.name for path in tmp_path.iterdir()] == ["output.txt"]
@@ -0,0 +1,225 @@
+"""
+Тестирование HTTP-сервиса генерации библиографического списка.
+"""
+import json
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+from wsgiref.simple_server import WSGIRequestHandler
+
+import pytest
+from docx import Document
+
+from service import BibliographyService, ServiceClient, ThreadingWSGIServer
+from settings import TEMPLATE_FILE_PATH
+
+
+class TestService:
+    """
+    Тестирование HTTP-сервиса генерации библиографического списка.
+    """
+
+    @pytest.fixture
+    def client(self) -> Iterator[ServiceClient]:
+        """
+        Получение клиента для вызова сервиса внутри процесса.
+
+        :return:
+        """
+
+        app = BibliographyService(workers=2)
+        yield ServiceClient(app)
+        app.close()
+
+    def test_health(self, client: ServiceClient) -> None:
+        """
+        Тестирование проверки доступности сервиса.
+
+        :param ServiceClient client: Клиент сервиса
+        """
+
+        status, _, body = client.request("GET", "/health")
+
+        assert status == 200
+        assert body == b"ok"
+
+    def test_render_workbook(self, client: ServiceClient) -> None:
+        """
+        Тестирование генерации файла Word по входному файлу Excel.
+
+        :param ServiceClient client: Клиент сервиса
+        """
+
+        status, headers, body = client.post(
+            "/render?citation=gost", Path(TEMPLATE_FILE_PATH).read_bytes()
+        )
+
+        assert status == 200
+        assert headers["Content-Type"].endswith("wordprocessingml.document")
+        # заголовок и 8 источников
+        assert len(Document(BytesIO(body)).paragraphs) == 9
+
+    def test_render_payload(self, client: ServiceClient) -> None:
+        """
+        Тестирование генерации файла Word по JSON-описанию источников.
+
+        :param ServiceClient client: Клиент сервиса
+        """
+
+        payload = {
+            "internet_resources": [
+                {
+                    "article": "Наука как искусство",
+                    "website": "Ведомости",
+                    "link": "https://www.vedomosti.ru",
+                    "access_date": "01.01.2021",
+                }
+            ]
+        }
+        status, _, body = client.post(
+            "/render", json.dumps(payload).encode("utf-8"), "application/json"
+        )
+
+        assert status == 200
+        paragraphs = Document(BytesIO(body)).paragraphs
+        assert paragraphs[1].text == (
+            "Наука как искусство // Ведомости URL: https://www.vedomosti.ru "
+            "(дата обращения: 01.01.2021)."
+        )
+
+        status, _, body = client.post(
+            "/render?citation=apa",
+            json.dumps(payload).encode("utf-8"),
+            "application/json",
+        )
+        assert status == 200
+        assert Document(BytesIO(body)).paragraphs[1].text == (
+            "Наука как искусство. (n.d.). Ведомости. "
+            "Retrieved 01.01.2021, from https://www.vedomosti.ru"
+        )
+
+        status, _, _ = client.post(
+            "/render?citation=chicago", b"{}", "application/json"
+        )
+        assert status == 400
+
+    @pytest.mark.parametrize(
+        "body, content_type",
+        [
+            (b"not a workbook", "application/octet-stream"),
+            (b"{", "application/json"),
+            ('{"books": [{"title": "Наука"}]}'.encode("utf-8"), "application/json"),
+            (b'{"unknown": []}', "application/json"),
+        ],
+    )
+    def test_bad_request(
+        self, client: ServiceClient, body: bytes, content_type: str
+    ) -> None:
+        """
+        Тестирование обработки некорректных запросов.
+
+        :param ServiceClient client: Клиент сервиса
+        :param bytes body: Тело запроса
+        :param str content_type: MIME-тип тела запроса
+        """
+
+        status, _, response = client.post("/render", body, content_type)
+
+        assert status == 400
+        assert json.loads(response)["error"]
+
+    @pytest.mark.parametrize(
+        "content_length, expected",
+        [(None, 411), ("", 411), ("-1", 400), ("abc", 400)],
+    )
+    def test_content_length(
+        self, client: ServiceClient, content_length: Any, expected: int
+    ) -> None:
+        """
+        Тестирование запроса без корректного размера тела.
+
+        :param ServiceClient client: Клиент сервиса
+        :param content_length: Значение заголовка Content-Length
+        :param int expected: Ожидаемый код статуса
+        """
+
+        status, _, response = client.request(
+            "POST", "/render", b"{}", extra={"CONTENT_LENGTH": content_length}
+        )
+
+        assert status == expected
+        assert json.loads(response)["error"]
+
+    def test_not_found(self, client: ServiceClient) -> None:
+        """
+        Тестирование запроса к неизвестному пути.
+
+        :param ServiceClient client: Клиент сервиса
+        """
+
+        assert client.request("GET", "/unknown")[0] == 404
+        assert client.request("GET", "/render")[0] == 405
+
+
+class TestThreadingWSGIServer:
+    """
+    Тестирование WSGI-сервера с ограничением количества соединений.
+    """
+
+    def test_max_requests(self) -> None:
+        """
+        Тестирование ограничения количества одновременно обрабатываемых соединений.
+        """
+
+        lock = threading.Lock()
+        active = {"current": 0, "max": 0}
+
+        def app(_: dict[str, Any], start_response: Any) -> Iterable[bytes]:
+            with lock:
+                active["current"] += 1
+                active["max"] = max(active["max"], active["current"])
+            time.sleep(0.05)
+            with lock:
+                active["current"] -= 1
+            start_response("200 OK", [("Content-Type", "text/plain")])
+            return [b"ok"]
+
+        class QuietHandler(WSGIRequestHandler):
+            """
+            Обработчик запросов без вывода журнала запросов.
+            """
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+        server = ThreadingWSGIServer(("127.0.0.1", 0), QuietHandler, max_requests=1)
+        server.set_app(app)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        url = f"http://127.0.0.1:{server.server_address[1]}/"
+        try:
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                responses = list(executor.map(get, [url] * 4))
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        # все соединения обработаны, но не более одного одновременно
+        assert responses == [b"ok"] * 4
+        assert active["max"] == 1
+
+
+def get(url: str) -> bytes:
+    """
+    Выполнение GET-запроса.
+
+    :param url: Адрес запроса
+    :return: Тело ответа
+    """
+
+    with urllib.request.urlopen(url, timeout=10) as response:
+        return response.read()